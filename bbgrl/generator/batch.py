@@ -0,0 +1,122 @@
+"""Multi-date batch generation.
+
+Spreads a date range across a bounded process pool. Each worker process owns
+its own generator (and so its own scraper and renderer); the parent collects
+one manifest entry per date.
+"""
+
+from __future__ import annotations
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+MANIFEST_NAME = "manifest.json"
+
+# Generator owned by the current worker process (created by _init_worker)
+_worker_generator = None
+_worker_options: Dict[str, Any] = {}
+
+
+def output_filename_for(target_date) -> str:
+    """Deck filename used by the CLI: olph_slides_[MM]_[DD]_[YYYY].pptx."""
+    return f"olph_slides_{target_date.month:02d}_{target_date.day:02d}_{target_date.year}.pptx"
+
+
+def iter_dates(start, end) -> List[date]:
+    """Inclusive list of dates from ``start`` to ``end``."""
+    start = start.date() if isinstance(start, datetime) else start
+    end = end.date() if isinstance(end, datetime) else end
+    if end < start:
+        raise ValueError(f"End date {end} is before start date {start}")
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    global _worker_generator, _worker_options
+    factory = options.get("generator_factory")
+    if factory is None:
+        from .generator import bbgrlslidegeneratorv1 as factory
+
+    _worker_options = dict(options)
+    kwargs = {"refresh": options.get("refresh", False)}
+    if options.get("fit_jobs"):
+        kwargs["fit_jobs"] = options["fit_jobs"]
+    _worker_generator = factory(**kwargs)
+
+
+def generate_one(date_iso: str, output_dir: str) -> Dict[str, Any]:
+    """Fetch and render one date in the current process; never raises."""
+    if _worker_generator is None:
+        _init_worker(_worker_options)
+    target_date = datetime.strptime(date_iso, "%Y-%m-%d")
+    started = time.perf_counter()
+    entry: Dict[str, Any] = {"date": date_iso, "ok": False, "output_path": None, "error": None}
+    try:
+        data = _worker_generator.fetch_live_liturgical_data(target_date)
+        entry["output_path"] = _worker_generator.create_presentation_from_template(
+            data,
+            output_filename=output_filename_for(target_date),
+            output_dir=output_dir,
+        )
+        entry["ok"] = True
+    except Exception as e:
+        traceback.print_exc()
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["seconds"] = round(time.perf_counter() - started, 2)
+    return entry
+
+
+def generate_batch(start, end, jobs: Optional[int] = None, output_dir: str = "new_slides",
+                   refresh: bool = False,
+                   progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                   generator_factory: Optional[Callable[..., Any]] = None) -> List[Dict[str, Any]]:
+    """Generate one deck per date in ``start``..``end`` (inclusive).
+
+    ``jobs`` bounds the process pool (default: CPU count, capped by the number
+    of dates); ``jobs=1`` runs serially in this process. Returns the manifest
+    (one entry per date, in date order) and also writes it to
+    ``output_dir/manifest.json``. ``generator_factory`` replaces the
+    generator class each worker instantiates; it must be picklable (a
+    module-level class or function) to reach the worker processes.
+    """
+    dates = [d.isoformat() for d in iter_dates(start, end)]
+    os.makedirs(output_dir, exist_ok=True)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(int(jobs), len(dates)))
+    # Dates already run in parallel; don't nest a fit pool in each worker
+    options = {"refresh": refresh, "fit_jobs": None if jobs == 1 else 1,
+               "generator_factory": generator_factory}
+
+    results: Dict[str, Dict[str, Any]] = {}
+    if jobs == 1:
+        _init_worker(options)
+        for d in dates:
+            results[d] = generate_one(d, output_dir)
+            if progress_callback:
+                progress_callback(results[d])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(options,)) as pool:
+            futures = {pool.submit(generate_one, d, output_dir): d for d in dates}
+            for future in as_completed(futures):
+                d = futures[future]
+                try:
+                    results[d] = future.result()
+                except Exception as e:
+                    # Worker process died (e.g. killed); record and keep going
+                    results[d] = {"date": d, "ok": False, "output_path": None,
+                                  "error": f"{type(e).__name__}: {e}", "seconds": None}
+                if progress_callback:
+                    progress_callback(results[d])
+
+    manifest = [results[d] for d in dates]
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+__all__ = ["generate_batch", "generate_one", "iter_dates", "output_filename_for"]
@@ -0,0 +1,224 @@
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Optional
+
+
+def default_cache_dir() -> str:
+    """Return the per-user cache directory (overridable via BBGRL_CACHE_DIR)."""
+    override = os.environ.get("BBGRL_CACHE_DIR")
+    if override:
+        return override
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "bbgrl", "cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bbgrl")
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _atomic_write(root: str, path: str, data: bytes) -> None:
+    os.makedirs(root, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=root, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _list_entries(root: str, suffix: str):
+    try:
+        return [n for n in os.listdir(root) if n.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+
+
+def _dir_size(root: str, suffix: str) -> int:
+    total = 0
+    for name in _list_entries(root, suffix):
+        try:
+            total += os.stat(os.path.join(root, name)).st_size
+        except OSError:
+            pass
+    return total
+
+
+def _evict_lru(root: str, suffix: str, max_bytes: int, target_bytes: Optional[int] = None) -> int:
+    """Remove least recently read entries (by atime) once over max_bytes.
+
+    Evicts until the directory holds at most ``target_bytes`` (default
+    ``max_bytes``); returns the bytes left.
+    """
+    if target_bytes is None:
+        target_bytes = max_bytes
+    entries = []
+    total = 0
+    for name in _list_entries(root, suffix):
+        try:
+            st = os.stat(os.path.join(root, name))
+        except OSError:
+            continue
+        entries.append((st.st_atime, st.st_size, name))
+        total += st.st_size
+    if total <= max_bytes:
+        return total
+    entries.sort()
+    while total > target_bytes and entries:
+        _, size, name = entries.pop(0)
+        try:
+            os.remove(os.path.join(root, name))
+            total -= size
+        except OSError:
+            pass
+    return total
+
+
+class HtmlCache:
+    """Compressed on-disk cache of raw iBreviary page HTML.
+
+    Entries are keyed by (date, page kind) and stored as gzip files named by
+    the SHA-256 of the key. A file's mtime records when it was stored (TTL)
+    and its atime when it was last read (LRU eviction once the directory
+    exceeds ``max_bytes``). Past dates keep for ``ttl_seconds``; today and
+    future dates, which iBreviary may still revise, for ``recent_ttl_seconds``.
+    """
+
+    def __init__(self, root: Optional[str] = None, ttl_seconds: float = 30 * 86400,
+                 recent_ttl_seconds: float = 6 * 3600, max_bytes: int = 64 * 1024 * 1024):
+        self.root = root or os.path.join(default_cache_dir(), "html")
+        self.ttl_seconds = ttl_seconds
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(target_date, page: str) -> str:
+        raw = f"{_as_date(target_date).isoformat()}|{page}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, target_date, page: str) -> str:
+        return os.path.join(self.root, f"{self.key(target_date, page)}.html.gz")
+
+    def _ttl_for(self, target_date) -> float:
+        if _as_date(target_date) < date.today():
+            return self.ttl_seconds
+        return self.recent_ttl_seconds
+
+    def get(self, target_date, page: str) -> Optional[str]:
+        """Return cached HTML, or None when missing or expired."""
+        path = self._path(target_date, page)
+        try:
+            stored_at = os.path.getmtime(path)
+            if time.time() - stored_at > self._ttl_for(target_date):
+                os.remove(path)
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                html = f.read()
+            # Record the access for LRU without touching the stored time
+            os.utime(path, (time.time(), stored_at))
+            return html
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"  WARNING: Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def put(self, target_date, page: str, html: str) -> None:
+        """Store HTML atomically, then evict least recently used entries."""
+        try:
+            _atomic_write(self.root, self._path(target_date, page), gzip.compress(html.encode("utf-8")))
+            _evict_lru(self.root, ".html.gz", self.max_bytes)
+        except Exception as e:
+            print(f"  WARNING: Could not write HTML cache entry: {e}")
+
+    def clear(self) -> None:
+        for name in _list_entries(self.root, ".html.gz"):
+            try:
+                os.remove(os.path.join(self.root, name))
+            except OSError:
+                pass
+
+
+class FitCache:
+    """On-disk memo of text fit results, shared across runs.
+
+    Keys are opaque hex digests computed by the fitter from everything the
+    result depends on (text, fonts, styles, box geometry, fitter version).
+    Values are small JSON documents. Entries never expire, since a key
+    changes whenever its inputs do; the directory is capped at ``max_bytes``
+    with the same least-recently-read eviction as :class:`HtmlCache`.
+
+    A fit pass stores one entry per new shape, so the directory size is kept
+    in memory (scanned on the first put) instead of listed on every put.
+    Once over ``max_bytes`` the cache is trimmed to ``EVICT_TO`` of it, so a
+    full cache is rescanned once per batch of puts.
+    """
+
+    EVICT_TO = 0.9
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = 16 * 1024 * 1024):
+        self.root = root or os.path.join(default_cache_dir(), "fit")
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"  WARNING: Ignoring unreadable fit cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+            path = self._path(key)
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            _atomic_write(self.root, path, data)
+            self._account(len(data) - replaced)
+        except Exception as e:
+            print(f"  WARNING: Could not write fit cache entry: {e}")
+
+    def _account(self, delta: int) -> None:
+        with self._size_lock:
+            if self._size is None:
+                self._size = _dir_size(self.root, ".json")
+            else:
+                self._size += delta
+            if self._size > self.max_bytes:
+                self._size = _evict_lru(self.root, ".json", self.max_bytes, int(self.max_bytes * self.EVICT_TO))
+
+    def clear(self) -> None:
+        with self._size_lock:
+            self._size = 0
+        for name in _list_entries(self.root, ".json"):
+            try:
+                os.remove(os.path.join(self.root, name))
+            except OSError:
+                pass
+
+
+__all__ = ["FitCache", "HtmlCache", "default_cache_dir"]
@@ -0,0 +1,103 @@
+"""Per-section index of a saved deck, for incremental regeneration.
+
+Next to each deck written to disk the generator keeps a small JSON sidecar
+(``<deck>.sections.json``) listing the deck's sections in order, how many
+slides each produced, and a fingerprint of each section's input. For the
+date-dependent sections the fingerprint is the digest of the section's slide
+specs (see ``specs``), so it changes exactly when the liturgical data the
+section shows changes. The sidecar also records the slide library digest
+(which covers the fit settings, fonts and slide size) and a digest of the
+deck file itself.
+
+When the same deck is generated again, :func:`load_previous` hands back the
+previous slides of each section, and only sections whose fingerprint changed
+are rebuilt and re-fitted. A deck that was edited or replaced since (its
+digest no longer matches), or one built with different fonts or settings, is
+rebuilt in full.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+from io import BytesIO
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# Bump when the sidecar format or the meaning of a fingerprint changes
+DECK_INDEX_VERSION = 1
+
+
+class SectionEntry(NamedTuple):
+    """One step of the deck plan: name, input fingerprint (None: always rebuild), slide count."""
+
+    name: str
+    fingerprint: Optional[str]
+    slides: int
+
+
+def index_path(deck_path: str) -> str:
+    """Sidecar path for ``deck_path``."""
+    return os.path.splitext(deck_path)[0] + ".sections.json"
+
+
+def _file_digest(blob: bytes) -> str:
+    return hashlib.sha256(blob).hexdigest()
+
+
+def save_index(deck_path: str, entries: Sequence[SectionEntry], library: str) -> None:
+    """Write the sidecar for the deck just saved at ``deck_path``."""
+    from .cache import _atomic_write
+
+    with open(deck_path, "rb") as f:
+        deck = _file_digest(f.read())
+    data = {
+        "version": DECK_INDEX_VERSION,
+        "library": library,
+        "deck": deck,
+        "sections": [list(entry) for entry in entries],
+    }
+    path = index_path(deck_path)
+    _atomic_write(os.path.dirname(path) or ".", path, json.dumps(data).encode("utf-8"))
+
+
+def load_previous(deck_path: str, names: Sequence[str], library: str) -> Optional[List[Tuple[SectionEntry, list]]]:
+    """(entry, slide parts) per section of the deck at ``deck_path``.
+
+    Returns None when there is no usable previous deck: no sidecar, a
+    different plan (``names``) or library, or a deck changed since it was
+    indexed. Slide parts are as returned by ``ooxml.read_slide_parts``.
+    """
+    from .ooxml import read_slide_parts
+
+    try:
+        with open(index_path(deck_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        with open(deck_path, "rb") as f:
+            blob = f.read()
+        entries = [SectionEntry(*entry) for entry in data["sections"]]
+        if (
+            data.get("version") != DECK_INDEX_VERSION
+            or data.get("library") != library
+            or data.get("deck") != _file_digest(blob)
+            or [entry.name for entry in entries] != list(names)
+        ):
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    try:
+        parts = read_slide_parts(BytesIO(blob))
+    except Exception as e:
+        print(f"  WARNING: Could not read previous deck {deck_path}: {e}")
+        return None
+    if len(parts) != sum(entry.slides for entry in entries):
+        return None
+    sections = []
+    start = 0
+    for entry in entries:
+        sections.append((entry, parts[start:start + entry.slides]))
+        start += entry.slides
+    return sections
+
+
+__all__ = ["DECK_INDEX_VERSION", "SectionEntry", "index_path", "load_previous", "save_index"]
@@ -0,0 +1,219 @@
+from __future__ import annotations
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Tuple
+
+
+def create_chrome_driver():
+    """Launch a headless Chrome WebDriver with the stability flags we rely on."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import WebDriverException
+
+    chrome_options = Options()
+    # Use the new headless mode explicitly; some versions need --headless=new
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])  # reduce noise
+    # Performance: block images/fonts to reduce load variation
+    prefs = {"profile.managed_default_content_settings.images": 2,
+             "profile.managed_default_content_settings.stylesheets": 1,
+             "profile.managed_default_content_settings.cookies": 1}
+    chrome_options.add_experimental_option("prefs", prefs)
+
+    try:
+        return webdriver.Chrome(options=chrome_options)
+    except WebDriverException as e:
+        raise RuntimeError(f"Failed to initialize ChromeDriver: {e}")
+
+
+def _quit_quietly(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class WebDriverPool:
+    """Process-wide pool of warm WebDrivers shared across generation jobs.
+
+    Drivers are checked out with :meth:`acquire` (or the :meth:`driver`
+    context manager) and handed back with :meth:`release`. A driver released
+    as ``broken`` is quit and its slot freed, so the next checkout launches a
+    fresh browser; idle drivers are health-checked before reuse and evicted
+    after ``idle_timeout`` seconds.
+    """
+
+    def __init__(self, size: int = 1, idle_timeout: float = 600.0,
+                 factory: Optional[Callable[[], Any]] = None):
+        self.size = max(1, int(size))
+        self.idle_timeout = float(idle_timeout)
+        self.factory = factory or create_chrome_driver
+        self._idle: List[Tuple[Any, float]] = []
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+
+    # ----------------- checkout / return -----------------
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Check out a healthy driver, launching one if the pool has room."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            driver = None
+            stale: List[Any] = []
+            try:
+                with self._cond:
+                    while True:
+                        if self._closed:
+                            raise RuntimeError("WebDriver pool is closed")
+                        stale.extend(self._take_expired_locked())
+                        # Either way the slot is reserved before the lock is let go
+                        if self._idle:
+                            driver, _ = self._idle.pop()
+                            self._in_use += 1
+                            break
+                        if self._in_use < self.size:
+                            self._in_use += 1
+                            break
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise RuntimeError("Timed out waiting for a WebDriver from the pool")
+                        self._cond.wait(remaining)
+            finally:
+                # Quitting Chrome can take seconds; never hold the lock for it
+                for old in stale:
+                    _quit_quietly(old)
+            if driver is None:
+                break
+            # The health probe is a WebDriver round trip; a hung browser can
+            # block it for the whole command timeout, so it runs unlocked too
+            if self._is_healthy(driver):
+                return driver
+            print("  -> Recycling crashed WebDriver from pool")
+            _quit_quietly(driver)
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+        # Launch outside the lock; Chrome startup takes seconds
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        self._ensure_reaper()
+        return driver
+
+    def release(self, driver, broken: bool = False) -> None:
+        """Return a driver to the pool; broken drivers are quit instead."""
+        if driver is None:
+            return
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            discard = broken or self._closed
+            if not discard:
+                self._idle.append((driver, time.monotonic()))
+            self._cond.notify()
+        if discard:
+            _quit_quietly(driver)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Context manager: check out a driver, marking it broken on error."""
+        drv = self.acquire(timeout)
+        try:
+            yield drv
+        except Exception:
+            self.release(drv, broken=True)
+            raise
+        else:
+            self.release(drv)
+
+    def close(self) -> None:
+        """Quit every idle driver; drivers still checked out are quit on release."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver, _ in idle:
+            _quit_quietly(driver)
+
+    @property
+    def idle_count(self) -> int:
+        with self._cond:
+            return len(self._idle)
+
+    # ----------------- housekeeping -----------------
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _take_expired_locked(self) -> List[Any]:
+        """Remove idle drivers past ``idle_timeout``; the caller quits them unlocked."""
+        now = time.monotonic()
+        keep, expired = [], []
+        for driver, last_used in self._idle:
+            if now - last_used > self.idle_timeout:
+                expired.append(driver)
+            else:
+                keep.append((driver, last_used))
+        self._idle = keep
+        return expired
+
+    def _ensure_reaper(self) -> None:
+        with self._cond:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name="webdriver-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        interval = max(1.0, self.idle_timeout / 2.0)
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                self._cond.wait(interval)
+                expired = self._take_expired_locked()
+            for driver in expired:
+                _quit_quietly(driver)
+
+
+_default_pool: Optional[WebDriverPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> WebDriverPool:
+    """Return the process-wide pool, sized by BBGRL_DRIVER_POOL_SIZE.
+
+    The default of 2 gives each concurrently fetched page its own browser.
+    Idle drivers are evicted after BBGRL_DRIVER_IDLE_SECONDS (default 600).
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WebDriverPool(
+                size=int(os.environ.get("BBGRL_DRIVER_POOL_SIZE", "2")),
+                idle_timeout=float(os.environ.get("BBGRL_DRIVER_IDLE_SECONDS", "600")),
+            )
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+__all__ = ["WebDriverPool", "create_chrome_driver", "get_default_pool"]
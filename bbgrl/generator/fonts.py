@@ -0,0 +1,414 @@
+"""Process-wide font handle and glyph-metrics cache for the text fit pass.
+
+Loading a FreeType face is the dominant cost of fitting text, and the fitter
+asks for the same (font file, pixel size) pairs over and over across shapes,
+slides and generation jobs. Faces are kept in a bounded LRU keyed by
+``(path, pixel_size)``; each carries a memo of measured advances so repeated
+tokens and characters are measured once.
+
+Font files are located through :class:`FontIndex`, which scans the system
+and user font directories once per set of changes and keeps the
+family/style -> file mapping on disk. Long-running processes re-check the
+directories every ``BBGRL_FONT_RECHECK_SECONDS`` (default 30); lookups are
+cached per :func:`font_generation`, so they follow installed or removed fonts.
+"""
+
+from __future__ import annotations
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_FONTS = 256
+
+# Collections (.ttc) are indexed and measured by their first face
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+FONT_INDEX_VERSION = 1
+# Seconds between checks of the font directories for changes
+FONT_RECHECK_SECONDS = float(os.environ.get("BBGRL_FONT_RECHECK_SECONDS", 30))
+
+# Families tried, in order, when the requested one is not installed. The
+# first entries are metric-compatible; the rest at least scale properly.
+FONT_SUBSTITUTES: Dict[str, List[str]] = {
+    "georgia": ["Gelasio", "Noto Serif", "DejaVu Serif", "Liberation Serif"],
+    "times new roman": ["Liberation Serif", "Tinos", "Times", "Noto Serif", "DejaVu Serif"],
+    "arial": ["Liberation Sans", "Arimo", "Helvetica", "Noto Sans", "DejaVu Sans"],
+    "calibri": ["Carlito", "Noto Sans", "DejaVu Sans"],
+    "cambria": ["Caladea", "Noto Serif", "DejaVu Serif"],
+    "courier new": ["Liberation Mono", "Cousine", "Noto Sans Mono", "DejaVu Sans Mono"],
+}
+
+# Style words that mean the plain weight/slant
+_PLAIN_STYLE_WORDS = {"regular", "book", "normal", "roman", "plain"}
+
+
+def font_dirs() -> List[str]:
+    """System and user font directories for this platform (existing only).
+
+    ``BBGRL_FONT_DIRS`` (``os.pathsep``-separated) is searched first.
+    """
+    home = os.path.expanduser("~")
+    dirs = [d for d in os.environ.get("BBGRL_FONT_DIRS", "").split(os.pathsep) if d]
+    if os.name == "nt":
+        dirs.append(os.path.join(os.environ.get("WINDIR", r"C:\\Windows"), "Fonts"))
+        local = os.environ.get("LOCALAPPDATA")
+        if local:
+            dirs.append(os.path.join(local, "Microsoft", "Windows", "Fonts"))
+    elif sys.platform == "darwin":
+        dirs += ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    else:
+        # Linux and ChromeOS (Crostini): XDG data dirs plus the legacy ~/.fonts
+        data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+        data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+        dirs.append(os.path.join(data_home, "fonts"))
+        dirs.append(os.path.join(home, ".fonts"))
+        dirs += [os.path.join(d, "fonts") for d in data_dirs.split(":") if d]
+    seen = set()
+    result = []
+    for d in dirs:
+        d = os.path.abspath(d)
+        if d not in seen and os.path.isdir(d):
+            seen.add(d)
+            result.append(d)
+    return result
+
+
+def _style_flags(style: str) -> Tuple[bool, bool, int]:
+    """(bold, italic, number of other style words) for a style name."""
+    words = style.lower().replace("-", " ").split()
+    bold = "bold" in words
+    italic = "italic" in words or "oblique" in words
+    extra = sum(1 for w in words if w not in _PLAIN_STYLE_WORDS | {"bold", "italic", "oblique"})
+    return bold, italic, extra
+
+
+def _read_face(path: str) -> Optional[Tuple[str, str]]:
+    """(family, style) names of a font file, or None if unreadable."""
+    from PIL import ImageFont
+
+    try:
+        family, style = ImageFont.truetype(path, 10).getname()
+    except Exception:
+        return None
+    return (family, style or "Regular") if family else None
+
+
+class FontIndex:
+    """Family/style -> font file map over a set of font directories.
+
+    The scan result is stored as JSON at ``cache_path`` together with the
+    mtime of every directory scanned; adding or removing a font changes its
+    directory's mtime, which triggers a rescan. The mtimes are re-read at
+    most every ``recheck_seconds``; :meth:`generation` changes when they do.
+    """
+
+    def __init__(self, dirs: Optional[Iterable[str]] = None, cache_path: Optional[str] = None,
+                 substitutes: Optional[Dict[str, List[str]]] = None,
+                 recheck_seconds: Optional[float] = None):
+        self.dirs = list(dirs) if dirs is not None else font_dirs()
+        if cache_path is None:
+            from .cache import default_cache_dir
+
+            cache_path = os.path.join(default_cache_dir(), "fonts.json")
+        self.cache_path = cache_path
+        self.substitutes = FONT_SUBSTITUTES if substitutes is None else substitutes
+        self.recheck_seconds = FONT_RECHECK_SECONDS if recheck_seconds is None else recheck_seconds
+        self._families: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._loaded_generation = 0
+        self._mtimes: Optional[Dict[str, int]] = None
+        self._checked_at: Optional[float] = None
+        self._generation = 0
+        self._lock = threading.RLock()
+        self.scanned = False  # True once this instance rescanned the disk
+
+    # ----------------- scanning -----------------
+
+    def _dir_mtimes(self) -> Dict[str, int]:
+        mtimes = {}
+        for root in self.dirs:
+            for dirpath, _, _ in os.walk(root):
+                try:
+                    mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+                except OSError:
+                    pass
+        return mtimes
+
+    def _scan(self) -> List[Tuple[str, str, str]]:
+        faces = []
+        for root in self.dirs:
+            for dirpath, _, filenames in os.walk(root):
+                for fname in sorted(filenames):
+                    if not fname.lower().endswith(FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(dirpath, fname)
+                    face = _read_face(path)
+                    if face:
+                        faces.append((face[0], face[1], path))
+        return faces
+
+    def _load_cached(self, mtimes: Dict[str, int]):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != FONT_INDEX_VERSION or data.get("dirs") != mtimes:
+            return None
+        return [tuple(face) for face in data.get("faces", [])]
+
+    def _save(self, mtimes: Dict[str, int], faces) -> None:
+        from .cache import _atomic_write
+
+        data = {"version": FONT_INDEX_VERSION, "dirs": mtimes, "faces": [list(f) for f in faces]}
+        try:
+            _atomic_write(os.path.dirname(self.cache_path) or ".", self.cache_path,
+                          json.dumps(data).encode("utf-8"))
+        except OSError as e:
+            print(f"  WARNING: Could not save font index: {e}")
+
+    def generation(self) -> int:
+        """A number that changes whenever the font directories changed.
+
+        Only stats the directories (no scan), at most every ``recheck_seconds``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is None or now - self._checked_at >= self.recheck_seconds:
+                mtimes = self._dir_mtimes()
+                if mtimes != self._mtimes:
+                    self._mtimes = mtimes
+                    self._generation += 1
+                self._checked_at = now
+            return self._generation
+
+    def _ensure(self) -> Dict[str, List[Tuple[str, str]]]:
+        with self._lock:
+            generation = self.generation()
+            if self._families is None or self._loaded_generation != generation:
+                mtimes = self._mtimes
+                faces = self._load_cached(mtimes)
+                if faces is None:
+                    faces = self._scan()
+                    self.scanned = True
+                    self._save(mtimes, faces)
+                families: Dict[str, List[Tuple[str, str]]] = {}
+                for family, style, path in faces:
+                    families.setdefault(family.lower(), []).append((style, path))
+                self._families = families
+                self._loaded_generation = generation
+            return self._families
+
+    def refresh(self) -> None:
+        """Re-check the font directories on the next lookup instead of waiting."""
+        with self._lock:
+            self._checked_at = None
+
+    # ----------------- lookup -----------------
+
+    def families(self) -> List[str]:
+        return sorted(self._ensure())
+
+    def find(self, family: str, bold: bool = False, italic: bool = False) -> Optional[str]:
+        """Path of the best face for a family/style, or None.
+
+        The requested family is preferred, then its substitutes in order; a
+        face with the exact bold/italic style beats any family preference.
+        """
+        families = self._ensure()
+        candidates = [family] + list(self.substitutes.get(family.lower(), []))
+        best = None
+        for rank, name in enumerate(candidates):
+            for style, path in families.get(name.lower(), []):
+                b, i, extra = _style_flags(style)
+                score = ((b != bold) + (i != italic), rank, extra, path)
+                if best is None or score < best:
+                    best = score
+        return best[3] if best else None
+
+
+_font_index: Optional[FontIndex] = None
+_font_index_lock = threading.Lock()
+
+
+def font_index() -> FontIndex:
+    """The process-wide index over :func:`font_dirs`."""
+    global _font_index
+    with _font_index_lock:
+        if _font_index is None:
+            _font_index = FontIndex()
+        return _font_index
+
+
+def _windows_georgia(bold: bool, italic: bool) -> Optional[str]:
+    # Well-known file names; avoids building the index on the common setup
+    windir = os.environ.get("WINDIR", r"C:\\Windows")
+    fname = {(True, True): "georgiaz.ttf", (True, False): "georgiab.ttf",
+             (False, True): "georgiai.ttf"}.get((bold, italic), "georgia.ttf")
+    path = os.path.join(windir, "Fonts", fname)
+    return path if os.path.exists(path) else None
+
+
+def font_generation() -> int:
+    """Changes whenever the installed fonts changed; key font-derived caches on it."""
+    try:
+        return font_index().generation()
+    except Exception:
+        return 0
+
+
+def font_path_for(name: str, bold: bool, italic: bool) -> Optional[str]:
+    """Path of the installed font file for a face/style, or None.
+
+    Falls back to a substitute family (see ``FONT_SUBSTITUTES``) when the
+    face itself is not installed.
+    """
+    return _font_path_for(name, bold, italic, font_generation())
+
+
+@lru_cache(maxsize=1024)
+def _font_path_for(name: str, bold: bool, italic: bool, generation: int) -> Optional[str]:
+    if name.lower() == "georgia":
+        path = _windows_georgia(bold, italic)
+        if path:
+            return path
+    try:
+        return font_index().find(name, bold, italic)
+    except Exception as e:
+        print(f"  WARNING: Font lookup failed for {name}: {e}")
+        return None
+
+
+class FontMetrics:
+    """A loaded font plus memoized advance widths and line metrics.
+
+    ``path`` None means Pillow's built-in default font, whose metrics do not
+    follow the requested size.
+    """
+
+    def __init__(self, font, path: Optional[str], pixel_size: int):
+        self.font = font
+        self.path = path
+        self.pixel_size = pixel_size
+        self._lengths: Dict[str, float] = {}
+        self._advances: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        try:
+            self.ascent, self.descent = font.getmetrics()
+        except Exception:
+            self.ascent = self.descent = None
+
+    @property
+    def scalable(self) -> bool:
+        return self.path is not None
+
+    def _measure(self, text: str) -> float:
+        # Pillow: getlength is preferred; fallback to bbox width.
+        try:
+            return float(self.font.getlength(text))
+        except Exception:
+            bbox = self.font.getbbox(text)
+            return float(bbox[2] - bbox[0])
+
+    def length(self, text: str) -> float:
+        """Advance width of ``text`` in pixels (memoized per string)."""
+        width = self._lengths.get(text)
+        if width is None:
+            width = self._measure(text)
+            with self._lock:
+                self._lengths[text] = width
+        return width
+
+    def advance(self, ch: str) -> float:
+        """Advance width of a single character (the glyph-advance table)."""
+        width = self._advances.get(ch)
+        if width is None:
+            width = self._measure(ch)
+            with self._lock:
+                self._advances[ch] = width
+        return width
+
+    def line_height(self, size_pt: float, dpi: float) -> float:
+        if self.ascent is not None:
+            return (self.ascent + self.descent) * 1.15
+        return (size_pt * dpi / 72.0) * 1.2
+
+
+class FontCache:
+    """Thread-safe LRU of :class:`FontMetrics` keyed by (path, pixel size)."""
+
+    def __init__(self, max_fonts: int = DEFAULT_MAX_FONTS):
+        self.max_fonts = max(1, int(max_fonts))
+        self._fonts: "OrderedDict[Tuple[Optional[str], int], FontMetrics]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Optional[str], pixel_size: int) -> FontMetrics:
+        # The default font ignores size, so one entry serves every request
+        key = (path, int(pixel_size) if path else 0)
+        with self._lock:
+            metrics = self._fonts.get(key)
+            if metrics is not None:
+                self._fonts.move_to_end(key)
+                self.hits += 1
+                return metrics
+            self.misses += 1
+        font, loaded_path = _load_font(path, key[1])
+        metrics = FontMetrics(font, loaded_path, key[1])
+        with self._lock:
+            # Another thread may have loaded it meanwhile; keep the first
+            metrics = self._fonts.setdefault(key, metrics)
+            self._fonts.move_to_end(key)
+            while len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+        return metrics
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fonts.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._fonts)
+
+
+def _load_font(path: Optional[str], pixel_size: int):
+    from PIL import ImageFont
+
+    if path:
+        try:
+            return ImageFont.truetype(path, max(1, pixel_size)), path
+        except Exception:
+            pass
+    return ImageFont.load_default(), None
+
+
+_default_cache = FontCache(int(os.environ.get("BBGRL_FONT_CACHE_SIZE", DEFAULT_MAX_FONTS)))
+
+
+def get_font_metrics(path: Optional[str], pixel_size: int) -> FontMetrics:
+    """Cached metrics for a font file at a pixel size (process-wide)."""
+    return _default_cache.get(path, pixel_size)
+
+
+def font_cache() -> FontCache:
+    return _default_cache
+
+
+__all__ = [
+    "FONT_SUBSTITUTES",
+    "FontCache",
+    "FontIndex",
+    "FontMetrics",
+    "font_cache",
+    "font_dirs",
+    "font_generation",
+    "font_index",
+    "font_path_for",
+    "get_font_metrics",
+]
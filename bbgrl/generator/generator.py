@@ -6,18 +6,18 @@ importing the legacy entry module to prevent circular imports.
 """
 
 import os
-import re
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from io import BytesIO
 
 import requests
-from bs4 import BeautifulSoup
 from pptx import Presentation
-from pptx.dml.color import RGBColor
-from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
-from pptx.util import Inches, Pt
+from pptx.util import Inches
 
+from . import deckindex, sections
+from .cache import FitCache, HtmlCache, _atomic_write
 from .constants import get_reference_template as _get_reference_template_cfg
 from .fallbacks import (
 	get_fallback_data as _fallback_data,
@@ -49,33 +49,18 @@ from .parsers import (
 	extract_short_reading,
 	get_fallback_canticle_verses,
 	get_fallback_verses,
+	ParsedPage,
 )
-from .slides import (
-	create_daily_morning_prayer_image_slide as _slides_daily_image,
-	create_heart_of_jesus_prayer_slides as _slides_hoj_prayers,
-	create_heart_of_jesus_slide as _slides_hoj_image,
-	create_initial_blank_slide as _slides_initial_blank,
-	create_jubilee_prayer_slides as _slides_jubilee,
-	create_lords_prayer_slide as _slides_lords_prayer,
-	create_novena_of_confidence_slides as _slides_nov_conf,
-	create_novena_prayer_slides as _slides_nov_prayer,
-	create_novena_sacred_heart_slide as _slides_nsh_image,
-	create_oh_sacred_heart_prayer_slides as _slides_osh_prayers,
-	create_oh_sacred_heart_slide as _slides_osh_image,
-	create_prayer_of_thanksgiving_slides as _slides_thanksgiving,
-	create_prayer_to_st_michael_slides as _slides_st_michael,
-	create_salve_regina_slides as _slides_salve_regina,
-	create_soul_of_christ_slides as _slides_soc_prayers,
-	create_st_joseph_prayer_image_slide as _slides_stj_image,
-	create_st_joseph_prayer_text_slides as _slides_stj_text,
-)
+from .library import STATIC_SECTIONS, SlideLibrary, library_digest
+from .specs import render_slides, specs_digest
 from .static_content import (
 	get_static_devotional_content as _get_static_devotional_content_cfg,
 )
 
 
 class bbgrlslidegeneratorv1:
-	def __init__(self):
+	def __init__(self, selenium_fallback=None, refresh=False, html_cache=True, fit_cache=True, fit_jobs=None, static_library=True,
+			stream_writer=None, incremental=True):
 		self.base_url = "https://www.ibreviary.com/m2/"
 		self.session = requests.Session()
 		self.session.headers.update(
@@ -87,9 +72,35 @@ class bbgrlslidegeneratorv1:
 		# Reference structure template (based on the analyzed PowerPoint)
 		self.reference_template = self._get_reference_template()
 
-		# Selenium driver (initialized when needed) via scraper wrapper
-		self.driver = None
-		self.scraper = IBreviaryScraper(self.base_url)
+		# Pages are fetched over HTTP; Selenium is an opt-in fallback
+		# (argument, or BBGRL_SELENIUM_FALLBACK=1 in the environment).
+		if selenium_fallback is None:
+			selenium_fallback = os.environ.get("BBGRL_SELENIUM_FALLBACK", "") in ("1", "true", "yes")
+		# Raw page HTML is cached on disk per (date, page); ``refresh`` bypasses
+		# the cache for reads, ``html_cache=False`` disables it entirely.
+		if html_cache is True:
+			html_cache = HtmlCache()
+		self.scraper = IBreviaryScraper(
+			self.base_url,
+			selenium_fallback=selenium_fallback,
+			cache=html_cache or None,
+			refresh=refresh,
+		)
+		# Text fit results are memoized on disk across runs; ``fit_cache=False``
+		# fits every shape from scratch.
+		self.fit_cache = FitCache() if fit_cache is True else (fit_cache or None)
+		# Worker processes for the fit pass (None: BBGRL_FIT_JOBS or CPU count)
+		self.fit_jobs = fit_jobs
+		# Pre-fitted devotional slides copied into each deck (see `library`)
+		self.slide_library = SlideLibrary() if static_library is True else (static_library or None)
+		# Write decks with the streaming OOXML writer instead of python-pptx
+		# (argument, or BBGRL_STREAM_WRITER=1); needs the slide library.
+		if stream_writer is None:
+			stream_writer = os.environ.get("BBGRL_STREAM_WRITER", "") in ("1", "true", "yes")
+		self.stream_writer = stream_writer
+		# Regenerating a deck on disk rebuilds only the sections whose input
+		# changed (see `deckindex`); ``incremental=False`` always rebuilds all.
+		self.incremental = incremental
 
 	def _get_reference_template(self):
 		"""Delegated: reference template and formatting rules (extracted)."""
@@ -105,15 +116,22 @@ class bbgrlslidegeneratorv1:
 		if target_date is None:
 			target_date = datetime.now()
 
-		progress_callback(5, f"Initializing Selenium driver...")
+		progress_callback(5, f"Connecting to iBreviary...")
 		try:
-			self._initialize_driver()
-			progress_callback(10, f"Navigating to Morning Prayer for {target_date.strftime('%B %d, %Y')}")
-			morning_prayer_data = self._fetch_morning_prayer_structured(target_date)
-			progress_callback(25, "Parsing Morning Prayer data...")
-			progress_callback(30, "Navigating to Daily Readings...")
-			readings_data = self._fetch_daily_readings_structured(target_date)
-			progress_callback(45, "Parsing Daily Readings data...")
+			# Morning Prayer and Readings navigate independently (own session or
+			# browser each), so fetch and parse both pages at the same time.
+			progress_callback(10, f"Fetching Morning Prayer and Daily Readings for {target_date.strftime('%B %d, %Y')}")
+			with ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch") as pool:
+				morning_future = pool.submit(self._fetch_morning_prayer_structured, target_date)
+				readings_future = pool.submit(self._fetch_daily_readings_structured, target_date)
+				pending = {morning_future: "Morning Prayer", readings_future: "Daily Readings"}
+				percent = 25
+				for future in as_completed(pending):
+					future.result()
+					progress_callback(percent, f"Parsed {pending[future]} data...")
+					percent = 45
+			morning_prayer_data = morning_future.result()
+			readings_data = readings_future.result()
 			progress_callback(50, "Combining structured data...")
 			structured_data = {
 				"date": target_date.strftime("%B %d, %Y"),
@@ -126,65 +144,58 @@ class bbgrlslidegeneratorv1:
 		except Exception as e:
 			progress_callback(55, f"Error fetching liturgical data: {e}. Using fallback template structure...")
 			return self._get_fallback_data(target_date)
-		finally:
-			if hasattr(self, "scraper") and self.scraper:
-				self.scraper.quit()
-				self.driver = None
 
-	def _initialize_driver(self):
-		"""Initialize Chrome driver in headless mode via scraper wrapper"""
-		self.driver = self.scraper.init_driver()
-
-	def _navigate_ibreviary_to_date(self, target_date):
+	def _navigate_ibreviary_to_date(self, target_date, refresh=False):
 		"""Delegated to scraper: returns Morning Prayer HTML for date."""
-		return self.scraper.navigate_morning_prayer_html(target_date)
+		return self.scraper.navigate_morning_prayer_html(target_date, refresh=refresh)
 
-	def _navigate_to_readings_page(self):
+	def _navigate_to_readings_page(self, target_date=None):
 		"""Delegated to scraper: returns Readings page HTML."""
-		return self.scraper.navigate_readings_html()
+		return self.scraper.navigate_readings_html(target_date)
 
 	def _fetch_morning_prayer_structured(self, target_date):
 		"""
 		Fetch morning prayer and structure it to match the reference template exactly
-		Uses Selenium to navigate iBreviary to the specific date
+		Navigates iBreviary to the specific date (HTTP, Selenium as fallback)
 		"""
 		try:
-			# Use Selenium to navigate to the specific date
-			print(f"  Fetching Morning Prayer using Selenium navigation...")
+			print(f"  Fetching Morning Prayer...")
 			html_content = self._navigate_ibreviary_to_date(target_date)
 
 			if not html_content:
-				print(f"  WARNING: Selenium navigation failed, using fallback data")
+				print(f"  WARNING: Navigation failed, using fallback data")
 				return self._get_fallback_morning_prayer()
 
-			# Parse the HTML content
-			soup = BeautifulSoup(html_content, "html.parser")
-			full_text = soup.get_text(separator="\n")
+			# Parse the HTML once; every extractor shares this page
+			page = ParsedPage(html_content)
+			soup = page.soup
+			full_text = page.lines_text
 
 			# Find "PSALMODY" in all caps and extract only the text AFTER it
 			# This skips the "Tune:" and "Text:" segments that come before PSALMODY
-			psalmody_pos = full_text.upper().find("PSALMODY")
+			psalmody_pos = page.psalmody_offset
 
-			# If PSALMODY not found, perform an early full retry once (driver re-init)
+			# If PSALMODY not found, perform an early full retry once
 			if psalmody_pos < 0:
 				print("  WARNING: PSALMODY marker not found; retrying full navigation once...")
-				# Reinitialize Selenium driver and attempt navigation again
 				try:
-					self._initialize_driver()
-					html_content_retry = self._navigate_ibreviary_to_date(target_date)
+					self.scraper.reset_http_session("morning_prayer")
+					html_content_retry = self._navigate_ibreviary_to_date(target_date, refresh=True)
 					if html_content_retry:
-						soup = BeautifulSoup(html_content_retry, "html.parser")
-						full_text = soup.get_text(separator="\n")
-						psalmody_pos = full_text.upper().find("PSALMODY")
+						page = ParsedPage(html_content_retry)
+						soup = page.soup
+						full_text = page.lines_text
+						psalmody_pos = page.psalmody_offset
 						print("  ✓ Retry succeeded: PSALMODY located")
 					else:
 						print("  WARNING: Retry navigation failed; proceeding with original content")
 				except Exception as e:
-					print(f"  WARNING: Retry initialization failed: {e}")
+					print(f"  WARNING: Retry navigation failed: {e}")
 
 			if psalmody_pos >= 0:
 				# Extract only the text after PSALMODY for all parsing
 				text_after_psalmody = full_text[psalmody_pos:]
+				sections_after_psalmody = page.sections.region(psalmody_pos)
 				print(
 					f"  Found PSALMODY at position {psalmody_pos}, parsing content after it"
 				)
@@ -194,6 +205,7 @@ class bbgrlslidegeneratorv1:
 			else:
 				# Fallback: use full text if PSALMODY not found
 				text_after_psalmody = full_text
+				sections_after_psalmody = page.sections
 				psalmody_soup = soup
 				print(f"  WARNING: PSALMODY marker not found after retry, using full text")
 
@@ -206,7 +218,7 @@ class bbgrlslidegeneratorv1:
 					"psalm_1": self._extract_psalm_verses_from_html(psalmody_soup, 1),
 					"antiphon_2": self._extract_antiphon(text_after_psalmody, 2),
 					"canticle_info": self._extract_canticle_info(
-						psalmody_soup, text_after_psalmody
+						page, text_after_psalmody
 					),
 					"canticle": self._extract_canticle_verses(
 						psalmody_soup, text_after_psalmody
@@ -217,19 +229,19 @@ class bbgrlslidegeneratorv1:
 					"psalm_3": self._extract_psalm_verses_from_html(psalmody_soup, 3),
 				},
 				"reading": {
-					"short_reading": self._extract_short_reading(text_after_psalmody),
+					"short_reading": self._extract_short_reading(sections_after_psalmody),
 					"responsory": self._extract_responsory_from_html(
-						psalmody_soup, text_after_psalmody
+						psalmody_soup, sections_after_psalmody
 					),
 				},
 				"gospel_canticle": {
-					"antiphon": self._extract_gospel_antiphon(text_after_psalmody),
+					"antiphon": self._extract_gospel_antiphon(sections_after_psalmody),
 					"benedictus_verses": self._extract_benedictus_verses(
 						text_after_psalmody
 					),
 				},
-				"intercessions": self._extract_intercessions(soup, full_text),
-				"concluding_prayer": self._extract_concluding_prayer(full_text),
+				"intercessions": self._extract_intercessions(page, full_text),
+				"concluding_prayer": self._extract_concluding_prayer(page.sections),
 			}
 
 			return structured
@@ -241,20 +253,19 @@ class bbgrlslidegeneratorv1:
 	def _fetch_daily_readings_structured(self, target_date):
 		"""
 		Fetch daily readings and structure them to match the reference template
-		Uses Selenium navigation to the Readings page
+		Fetches the Readings page for the same date as Morning Prayer
 		"""
 		try:
-			# Navigate to Readings page using Selenium (driver already initialized)
-			print(f"  Fetching Daily Readings using Selenium navigation...")
-			html_content = self._navigate_to_readings_page()
+			print(f"  Fetching Daily Readings...")
+			html_content = self._navigate_to_readings_page(target_date)
 
 			if not html_content:
 				print(f"  WARNING: Could not navigate to Readings page, using fallback data")
 				return self._get_fallback_readings()
 
-			# Parse the HTML content
-			soup = BeautifulSoup(html_content, "html.parser")
-			full_text = soup.get_text()
+			# Parse the HTML once; every extractor shares this page
+			page = ParsedPage(html_content)
+			full_text = page.text
 
 			structured = {
 				"first_reading": {
@@ -262,13 +273,13 @@ class bbgrlslidegeneratorv1:
 					"verses": self._extract_first_reading_verses(full_text),
 				},
 				"responsorial_psalm": {
-					"citation": self._extract_psalm_citation(html_content),
-					"verses": self._extract_psalm_response_verses(html_content),
+					"citation": self._extract_psalm_citation(page),
+					"verses": self._extract_psalm_response_verses(page),
 				},
-				"gospel_acclamation": self._extract_gospel_acclamation(html_content),
+				"gospel_acclamation": self._extract_gospel_acclamation(page),
 				"gospel": {
-					"citation": self._extract_gospel_citation(html_content),
-					"content": self._extract_gospel_verses(html_content),
+					"citation": self._extract_gospel_citation(page),
+					"content": self._extract_gospel_verses(page),
 				},
 			}
 
@@ -379,44 +390,58 @@ class bbgrlslidegeneratorv1:
 		"""Delegated: complete fallback data structure (extracted)."""
 		return _fallback_data(target_date)
 
-	def create_presentation_from_template(self, liturgical_data, output_filename=None, output_dir=None, progress_callback=None):
+	def create_presentation_from_template(self, liturgical_data, output_filename=None, output_dir=None, progress_callback=None,
+			target=None, as_bytes=False):
 		"""
 		Create presentation using the reference template structure with live liturgical data
-		"""
-		if output_filename is None:
-			# Use OLPH naming convention: olph_slides_[year]_[month]_[day].pptx
-			# Extract date from liturgical_data if available, otherwise use current date
-			if "date" in liturgical_data:
-				try:
-					# Parse the date string to get components
-					date_obj = datetime.strptime(liturgical_data["date"], "%B %d, %Y")
-					output_filename = (
-						f"olph_slides_{date_obj.year}_{date_obj.month:02d}_{date_obj.day:02d}.pptx"
-					)
-				except Exception:
-					# Fallback to current date
-					now = datetime.now()
-					output_filename = (
-						f"olph_slides_{now.year}_{now.month:02d}_{now.day:02d}.pptx"
-					)
-			else:
-				now = datetime.now()
-				output_filename = f"olph_slides_{now.year}_{now.month:02d}_{now.day:02d}.pptx"
-
-		prs = Presentation()
-		prs.slide_width = Inches(13.33)
-		prs.slide_height = Inches(7.5)
 
+		Saves to ``output_dir`` (default ``output_v2``) and returns the path. With
+		``target`` (a writable binary file object) the deck is written there
+		instead and ``target`` is returned; with ``as_bytes=True`` the deck is
+		returned as bytes. Neither touches the disk; see `archive_presentation`.
+		"""
 		print(f"Creating presentation using reference template structure...")
 		print(f"Date: {liturgical_data['date']}")
+		if target is not None or as_bytes:
+			out = BytesIO() if target is None else target
+			self._write_deck(liturgical_data, out, progress_callback)
+			return out.getvalue() if target is None else target
+
+		_dir = output_dir or "output_v2"
+		if not os.path.exists(_dir):
+			os.makedirs(_dir)
+		output_path = os.path.join(_dir, output_filename or self.output_filename(liturgical_data))
+		return self._write_deck(liturgical_data, output_path, progress_callback)
+
+	def output_filename(self, liturgical_data):
+		"""Deck file name, following the OLPH naming convention: olph_slides_[year]_[month]_[day].pptx"""
+		# Extract date from liturgical_data if available, otherwise use current date
+		if "date" in liturgical_data:
+			try:
+				# Parse the date string to get components
+				date_obj = datetime.strptime(liturgical_data["date"], "%B %d, %Y")
+				return f"olph_slides_{date_obj.year}_{date_obj.month:02d}_{date_obj.day:02d}.pptx"
+			except Exception:
+				# Fallback to current date
+				pass
+		now = datetime.now()
+		return f"olph_slides_{now.year}_{now.month:02d}_{now.day:02d}.pptx"
+
+	def archive_presentation(self, deck, liturgical_data, output_filename=None, output_dir=None):
+		"""Save deck bytes (from ``as_bytes=True``) to ``output_dir``; returns the path."""
+		_dir = output_dir or "output_v2"
+		output_path = os.path.join(_dir, output_filename or self.output_filename(liturgical_data))
+		return self._save_with_fallback(lambda path: _atomic_write(_dir, path, deck), output_path)
+
+	def _write_deck(self, liturgical_data, target, progress_callback=None):
+		"""Build the deck into ``target`` (a path or a binary file object).
+
+		Returns the path written (see `_save_with_fallback`), or ``target``.
+		"""
 		if progress_callback is None:
 			def progress_callback(percent, message):
 				pass
 
-		slide_count = 0
-		total_steps = 30  # Estimate for percent calculation
-		current_step = 0
-
 		# Estimate total slides for percent calculation
 		estimated_total_slides = 60
 		slides_created = 0
@@ -426,795 +451,259 @@ class bbgrlslidegeneratorv1:
 			percent = int((slides_created / estimated_total_slides) * 100)
 			progress_callback(percent, msg)
 
-		# Add blank black slide at the very beginning
-		slide_count = _slides_initial_blank(prs, slide_count)
-		slide_progress("Added blank black slide")
-
-		# Add Daily Morning Prayer image slide as second slide
-		slide_count = _slides_daily_image(prs, slide_count)
-		slide_progress("Added Daily Morning Prayer image slide")
-
-		# Apply reference template structure to current liturgical data
-		slide_count = self._create_opening_slides(prs, liturgical_data, slide_count)
-		slide_progress("Created opening slides")
-		slide_count = self._create_psalmody_section(prs, liturgical_data, slide_count)
-		slide_progress("Created psalmody section")
-		slide_count = self._create_reading_section(prs, liturgical_data, slide_count)
-		slide_progress("Created reading section")
-		slide_count = self._create_responsory_section(prs, liturgical_data, slide_count)
-		slide_progress("Created responsory section")
-		slide_count = self._create_gospel_canticle_section(prs, liturgical_data, slide_count)
-		slide_progress("Created gospel canticle section")
-		slide_count = self._create_intercessions_section(prs, liturgical_data, slide_count)
-		slide_progress("Created intercessions section")
-		slide_count = _slides_lords_prayer(prs, slide_count)
-		slide_progress("Added Lord's Prayer slide")
-		slide_count = self._create_concluding_prayer_slides(prs, liturgical_data, slide_count)
-		slide_progress("Created concluding prayer slides")
-		slide_count = self._create_sacred_heart_hymns(prs, liturgical_data, slide_count)
-		slide_progress("Created Sacred Heart hymns")
-		slide_count = self._create_post_communion_prayers(prs, liturgical_data, slide_count)
-		slide_progress("Created post-communion prayers")
-		slide_count = _slides_hoj_image(prs, slide_count)
-		slide_progress("Added Heart of Jesus image slide")
-		slide_count = _slides_hoj_prayers(prs, slide_count)
-		slide_progress("Added Heart of Jesus prayer text slides")
-		slide_count = _slides_osh_image(prs, slide_count)
-		slide_progress("Added Oh Sacred Heart image slide")
-		slide_count = _slides_osh_prayers(prs, slide_count)
-		slide_progress("Added Oh Sacred Heart prayer text slides")
-		slide_count = _slides_nsh_image(prs, slide_count)
-		slide_progress("Added Novena to the Sacred Heart image slide")
-		slide_count = _slides_soc_prayers(prs, slide_count)
-		slide_progress("Added Soul of Christ prayer slides")
-		slide_count = _slides_thanksgiving(prs, slide_count)
-		slide_progress("Added Prayer of Thanksgiving slides")
-		slide_count = _slides_nov_conf(prs, slide_count)
-		slide_progress("Added Novena of Confidence slides")
-		slide_count = _slides_nov_prayer(prs, slide_count)
-		slide_progress("Added Novena Prayer slides")
-		slide_count = _slides_salve_regina(prs, slide_count)
-		slide_progress("Added Salve Regina slides")
-		slide_count = _slides_st_michael(prs, slide_count)
-		slide_progress("Added Prayer to St. Michael slides")
-		slide_count = _slides_jubilee(prs, slide_count)
-		slide_progress("Added The Jubilee Prayer slides")
-		slide_count = _slides_stj_image(prs, slide_count)
-		slide_progress("Added St. Joseph Prayer image slide")
-		slide_count = _slides_stj_text(prs, slide_count)
-		slide_progress("Added St. Joseph Prayer text slides")
-		# Move Mass Readings (Responsorial Psalm + Gospel) to very end of deck
-		slide_count = self._create_mass_readings_section(prs, liturgical_data, slide_count)
-		slide_progress("Created mass readings section")
-
-		# Save presentation
-		_dir = output_dir or "output_v2"
-		if not os.path.exists(_dir):
-			os.makedirs(_dir)
+		to_path = isinstance(target, (str, os.PathLike))
+		def save(write):
+			if to_path:
+				return self._save_with_fallback(write, target)
+			write(target)
+			return target
+
+		# Sections unchanged since the deck at ``target`` was last written are
+		# copied from it by the streaming writer
+		previous = None
+		if to_path and self.incremental and self.slide_library is not None:
+			previous = deckindex.load_previous(target, [name for _, name, _ in self.DECK_PLAN], self._library_digest())
+
+		if (self.stream_writer or previous is not None) and self.slide_library is not None:
+			start = None if to_path else target.tell()
+			entries = []
+			def write(out):
+				entries[:] = self._write_streamed(liturgical_data, out, slide_progress, previous)
+			try:
+				output = save(write)
+				if to_path:
+					self._save_deck_index(output, entries)
+				slide_progress("Presentation saved")
+				return output
+			except PermissionError:
+				raise
+			except Exception as e:
+				print(f"  WARNING: Streaming writer failed, building the deck with python-pptx: {e}")
+				traceback.print_exc()
+				if not to_path:
+					# Discard the partial deck
+					target.seek(start)
+					target.truncate()
+				slides_created = 0
+
+		prs = Presentation()
+		prs.slide_width = Inches(13.33)
+		prs.slide_height = Inches(7.5)
+		slide_count = 0
+		# Slides copied pre-fitted from the static library skip the fit pass
+		library_slide_ids = set()
+		entries = []
+		for kind, name, message in self.DECK_PLAN:
+			start = len(prs.slides)
+			fingerprint = kind
+			if kind == "static":
+				slide_count = self._add_static_slides(prs, name, slide_count, library_slide_ids)
+			elif name in sections.SECTION_BUILDERS:
+				specs, fingerprint = self._build_section(name, liturgical_data)
+				slide_count = render_slides(prs, specs, slide_count)
+			else:
+				slide_count = getattr(self, f"_create_{name}")(prs, liturgical_data, slide_count)
+			entries.append(deckindex.SectionEntry(name, fingerprint, len(prs.slides) - start))
+			slide_progress(message)
 
-		output_path = os.path.join(_dir, output_filename)
 		# Post-process: maximize text sizes while respecting shape bounds
-		self._maximize_text_size(prs)
+		self._maximize_text_size(prs, skip_slide_ids=library_slide_ids)
+		output = save(prs.save)
+		if to_path and self.slide_library is not None:
+			self._save_deck_index(output, entries)
+		slide_progress("Presentation saved")
+		return output
+
+	def _library_digest(self):
+		return library_digest(self.slide_library.slide_width, self.slide_library.slide_height)
+
+	def _build_section(self, name, liturgical_data):
+		"""(slide specs, fingerprint) of a dynamic section.
+
+		The fingerprint is the digest of the specs, so it changes exactly when
+		the data the section shows changes; a section that fails to build is
+		skipped with a warning and fingerprinted None (always rebuilt).
+		"""
 		try:
-			prs.save(output_path)
+			specs = sections.SECTION_BUILDERS[name](liturgical_data, self.reference_template)
+		except Exception as e:
+			print(f"  WARNING: Error creating {name.replace('_', ' ')}: {e}")
+			traceback.print_exc()
+			return [], None
+		return specs, specs_digest(specs)
+
+	def _save_deck_index(self, output_path, entries):
+		try:
+			deckindex.save_index(output_path, entries, self._library_digest())
+		except Exception as e:
+			print(f"  WARNING: Could not write deck index for {output_path}: {e}")
+
+	# Deck order: ("static", library section) or ("section", name of a
+	# ``_create_<name>`` method), with the progress message for each step.
+	DECK_PLAN = (
+		("static", "initial_blank", "Added blank black slide"),
+		("static", "daily_morning_prayer_image", "Added Daily Morning Prayer image slide"),
+		("section", "opening_slides", "Created opening slides"),
+		("section", "psalmody_section", "Created psalmody section"),
+		("section", "reading_section", "Created reading section"),
+		("section", "responsory_section", "Created responsory section"),
+		("section", "gospel_canticle_section", "Created gospel canticle section"),
+		("section", "intercessions_section", "Created intercessions section"),
+		("static", "lords_prayer", "Added Lord's Prayer slide"),
+		("section", "concluding_prayer_slides", "Created concluding prayer slides"),
+		("section", "sacred_heart_hymns", "Created Sacred Heart hymns"),
+		("section", "post_communion_prayers", "Created post-communion prayers"),
+		("static", "heart_of_jesus_image", "Added Heart of Jesus image slide"),
+		("static", "heart_of_jesus_prayers", "Added Heart of Jesus prayer text slides"),
+		("static", "oh_sacred_heart_image", "Added Oh Sacred Heart image slide"),
+		("static", "oh_sacred_heart_prayers", "Added Oh Sacred Heart prayer text slides"),
+		("static", "novena_sacred_heart_image", "Added Novena to the Sacred Heart image slide"),
+		("static", "soul_of_christ", "Added Soul of Christ prayer slides"),
+		("static", "prayer_of_thanksgiving", "Added Prayer of Thanksgiving slides"),
+		("static", "novena_of_confidence", "Added Novena of Confidence slides"),
+		("static", "novena_prayer", "Added Novena Prayer slides"),
+		("static", "salve_regina", "Added Salve Regina slides"),
+		("static", "st_michael", "Added Prayer to St. Michael slides"),
+		("static", "jubilee", "Added The Jubilee Prayer slides"),
+		("static", "st_joseph_image", "Added St. Joseph Prayer image slide"),
+		("static", "st_joseph_text", "Added St. Joseph Prayer text slides"),
+		# Mass Readings (Responsorial Psalm + Gospel) go at the very end of the deck
+		("section", "mass_readings_section", "Created mass readings section"),
+	)
+
+	def _save_with_fallback(self, save, output_path):
+		"""Call ``save(path)``; returns the path actually written."""
+		try:
+			save(output_path)
 		except PermissionError:
 			# On Windows the PPTX may be open in PowerPoint, which locks the file.
-			base, ext = os.path.splitext(output_filename)
+			base, ext = os.path.splitext(output_path)
 			ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-			alt_name = f"{base}_{ts}{ext}"
-			alt_path = os.path.join(_dir, alt_name)
+			alt_path = f"{base}_{ts}{ext}"
 			print(f"  WARNING: Could not overwrite '{output_path}'. Saving to '{alt_path}' instead.")
-			prs.save(alt_path)
+			save(alt_path)
 			output_path = alt_path
-		slide_progress("Presentation saved")
 		return output_path
 
-	# --- Dynamic section builders (moved from legacy file) ---
+	def _write_streamed(self, liturgical_data, path, slide_progress, previous=None):
+		"""Write the deck with the streaming writer (see `ooxml`).
 
-	def _maximize_text_size(self, prs):
-		"""Resize every text box to the largest font that fits its bounds.
-
-		python-pptx does not perform PowerPoint's layout engine; relying on auto-fit
-		often yields inconsistent results. This pass computes wrapping + font size
-		using real font metrics (Pillow) and rewrites each text frame.
-
-		No slide-index or section hard-coding. Font size is derived from shape
-		geometry and text content via search.
+		Dynamic sections are built as slide specs and fitted in one batch, then
+		every slide is written straight into the zip in deck order, with the
+		static sections copied from the slide library. Sections whose
+		fingerprint matches ``previous`` (from `deckindex.load_previous`) are
+		copied from the previous deck instead. Returns the deck index entries.
 		"""
+		from .ooxml import DeckWriter
+		from .textfit import fit_slide_specs
+
+		steps = []
+		for i, (kind, name, message) in enumerate(self.DECK_PLAN):
+			# Static and placeholder sections never change for a given slide library
+			specs, fingerprint = None, kind
+			if kind == "section" and name in sections.SECTION_BUILDERS:
+				specs, fingerprint = self._build_section(name, liturgical_data)
+			reuse = None
+			if (previous is not None and fingerprint is not None and previous[i][0].fingerprint == fingerprint
+					and (kind == "static" or specs is not None)):
+				reuse = previous[i][1]
+			steps.append((kind, name, message, specs, fingerprint, reuse))
+
+		all_specs = [spec for _, _, _, specs, _, reuse in steps if specs and reuse is None for spec in specs]
 		try:
-			from PIL import ImageFont
+			import PIL  # noqa: F401
 		except Exception:
 			print("  WARNING: Pillow not available; skipping text fit pass")
-			return
+			fitted = iter(all_specs)
+		else:
+			fitted = iter(fit_slide_specs(all_specs, cache=self.fit_cache, jobs=self.fit_jobs)[0] if all_specs else ())
 
-		EMU_PER_INCH = 914400
-		# Use a deterministic conversion for font measurement.
-		# This is not a fixed point size; it only maps inches->pixels for measurement.
-		DPI = 96
-
-		def _font_path_for(name: str, bold: bool, italic: bool) -> str | None:
-			windir = os.environ.get("WINDIR", r"C:\\Windows")
-			fonts_dir = os.path.join(windir, "Fonts")
-			if name.lower() != "georgia":
-				return None
-			candidates = []
-			if bold and italic:
-				candidates = ["georgiaz.ttf"]
-			elif bold:
-				candidates = ["georgiab.ttf"]
-			elif italic:
-				candidates = ["georgiai.ttf"]
-			else:
-				candidates = ["georgia.ttf"]
-			for fname in candidates:
-				path = os.path.join(fonts_dir, fname)
-				if os.path.exists(path):
-					return path
-			return None
-
-		def _measure_text_px(font: ImageFont.FreeTypeFont, text: str) -> float:
-			# Pillow: getlength is preferred; fallback to bbox width.
-			try:
-				return float(font.getlength(text))
-			except Exception:
-				bbox = font.getbbox(text)
-				return float(bbox[2] - bbox[0])
-
-		def _split_tokens_preserve_ws(s: str):
-			# Keep whitespace as tokens so we can wrap cleanly.
-			return re.split(r"(\s+)", s)
-
-		def _wrap_tokens(tokens, font, max_width_px: float):
-			# tokens: list of (text, style_key)
-			wrapped = []
-			line_width = 0.0
-			for text, style in tokens:
-				if text == "":
-					continue
-				# Handle explicit newlines inside token
-				parts = text.split("\n")
-				for pi, part in enumerate(parts):
-					if pi > 0:
-						wrapped.append(("\n", style))
-						line_width = 0.0
-					if part == "":
-						continue
-					w = _measure_text_px(font, part)
-					# If the token is whitespace and line is empty, skip it
-					if part.isspace() and line_width == 0.0:
-						continue
-					# Wrap on token boundaries; if a single token is too wide, hard-break by chars
-					if line_width > 0.0 and (line_width + w) > max_width_px:
-						# Prefer breaking at whitespace boundaries
-						if not part.isspace():
-							wrapped.append(("\n", style))
-							line_width = 0.0
-							# Hard-break long words
-							if _measure_text_px(font, part) > max_width_px:
-								buf = ""
-								for ch in part:
-									if buf and (_measure_text_px(font, buf + ch) > max_width_px):
-										wrapped.append((buf + "\n", style))
-										buf = ch
-									else:
-										buf += ch
-								if buf:
-									wrapped.append((buf, style))
-									line_width = _measure_text_px(font, buf)
-								continue
-						else:
-							wrapped.append(("\n", style))
-							line_width = 0.0
-					# Append token
-					wrapped.append((part, style))
-					line_width += w
-			return wrapped
-
-		def _count_lines_from_wrapped(wrapped_tokens) -> int:
-			lines = 1
-			for t, _ in wrapped_tokens:
-				lines += t.count("\n")
-			return max(1, lines)
-
-		def _fit_shape(tf, shape) -> None:
-			# Capture original paragraphs/runs with styles.
-			paragraph_specs = []
-			for p in tf.paragraphs:
-				runs = getattr(p, "runs", []) or []
-				para_runs = []
-				for r in runs:
-					para_runs.append({
-						"text": r.text or "",
-						"name": (r.font.name or p.font.name or "Georgia"),
-						"bold": bool(r.font.bold if r.font.bold is not None else p.font.bold),
-						"italic": bool(r.font.italic if r.font.italic is not None else p.font.italic),
-						"color": getattr(getattr(r.font, "color", None), "rgb", None),
-					})
-				paragraph_specs.append({
-					"alignment": p.alignment,
-					"runs": para_runs,
-				})
-			# If there's no content, skip.
-			if not any(any(r["text"] for r in ps["runs"]) for ps in paragraph_specs):
-				return
-
-			# Available box size in pixels, using EMU -> inches -> px
-			w_in = float(shape.width) / EMU_PER_INCH if shape.width else 1.0
-			h_in = float(shape.height) / EMU_PER_INCH if shape.height else 1.0
-			w_px = max(1.0, w_in * DPI)
-			h_px = max(1.0, h_in * DPI)
-
-			# Margins: proportional to shape size (no fixed absolute sizing)
-			mx = w_px * 0.02
-			my = h_px * 0.02
-			inner_w = max(1.0, w_px - (2.0 * mx))
-			inner_h = max(1.0, h_px - (2.0 * my))
-
-			# Flatten tokens per paragraph (keeps run-level style)
-			def build_tokens_for_para(para_spec):
-				tokens = []
-				for run in para_spec["runs"]:
-					style_key = (run["name"], run["bold"], run["italic"], run["color"])
-					for tok in _split_tokens_preserve_ws(run["text"]):
-						if tok == "":
-							continue
-						tokens.append((tok, style_key))
-				return tokens
-
-			# Binary search font size (pt) per shape.
-			# Upper bound is derived from box height; lower bound is minimal readable size.
-			low = 1.0
-			high = max(1.0, (inner_h / DPI) * 72.0)  # points
-			best = low
-
-			def fits(size_pt: float) -> tuple[bool, list[list[tuple[str, tuple]]]]:
-				# Wrap each paragraph independently; total height is sum of paragraph line heights
-				wrapped_paras = []
-				total_h = 0.0
-				for para in paragraph_specs:
-					para_tokens = build_tokens_for_para(para)
-					# Choose a representative font for measurement based on first non-empty token
-					font_name = "Georgia"
-					bold = False
-					italic = False
-					for _, sk in para_tokens:
-						font_name, bold, italic, _ = sk
-						break
-					fpath = _font_path_for(font_name, bold, italic)
-					try:
-						font = ImageFont.truetype(fpath, int(max(1, round(size_pt * DPI / 72.0)))) if fpath else ImageFont.load_default()
-					except Exception:
-						font = ImageFont.load_default()
-					wrapped = _wrap_tokens(para_tokens, font, inner_w)
-					wrapped_paras.append(wrapped)
-					lines = _count_lines_from_wrapped(wrapped)
-					try:
-						ascent, descent = font.getmetrics()
-						line_h = (ascent + descent) * 1.15
-					except Exception:
-						line_h = (size_pt * DPI / 72.0) * 1.2
-					total_h += (lines * line_h)
-				# Fit must respect total height
-				return (total_h <= inner_h), wrapped_paras
-
-			# Search with limited iterations
-			best_wrapped = None
-			for _ in range(18):
-				mid = (low + high) / 2.0
-				ok, wrapped_paras = fits(mid)
-				if ok:
-					best = mid
-					best_wrapped = wrapped_paras
-					low = mid
+		slide_count = 0
+		entries = []
+		with DeckWriter(path, Inches(13.33), Inches(7.5)) as writer:
+			for kind, name, message, specs, fingerprint, reuse in steps:
+				start = writer.slide_count
+				if reuse is not None:
+					for xml, images in reuse:
+						writer.add_slide_part(xml, images)
+					if reuse:
+						print(f"Reused slides {slide_count + 1}-{slide_count + len(reuse)}: {name} (unchanged)")
+					slide_count += len(reuse)
+				elif kind == "static":
+					parts = self.slide_library.section_parts(name)
+					for xml, images in parts:
+						writer.add_slide_part(xml, images)
+					if parts:
+						print(f"Created slides {slide_count + 1}-{slide_count + len(parts)}: {name} (static library)")
+					slide_count += len(parts)
+				elif specs is None:
+					# Placeholder sections only advance the slide numbering
+					slide_count = getattr(self, f"_create_{name}")(None, liturgical_data, slide_count)
 				else:
-					high = mid
+					for spec in specs:
+						writer.add_spec(next(fitted))
+						slide_count += 1
+						if spec.label:
+							print(f"Created slide {slide_count}: {spec.label}")
+				entries.append(deckindex.SectionEntry(name, fingerprint, writer.slide_count - start))
+				slide_progress(message)
+		if previous is not None:
+			rebuilt = [name for kind, name, _, specs, _, reuse in steps if specs is not None and reuse is None]
+			print(f"Incremental build: rebuilt {len(rebuilt)} changed section(s)"
+				+ (f" ({', '.join(rebuilt)})" if rebuilt else ""))
+		return entries
+
+	# --- Dynamic section builders (moved from legacy file) ---
 
-			if best_wrapped is None:
-				# Ensure we have wrapping for the smallest size
-				_, best_wrapped = fits(best)
+	def _add_static_slides(self, prs, name, slide_count, library_slide_ids):
+		"""Copy a static devotional section from the slide library.
 
-			# Rewrite text frame using wrapped tokens + computed size
-			tf.clear()
-			# Apply proportional margins in pptx units
+		Builds the section directly (to be fitted with the rest of the deck)
+		when the library is disabled or cannot be loaded.
+		"""
+		if self.slide_library is not None:
 			try:
-				tf.margin_left = Inches((mx / DPI))
-				tf.margin_right = Inches((mx / DPI))
-				tf.margin_top = Inches((my / DPI))
-				tf.margin_bottom = Inches((my / DPI))
-			except Exception:
-				pass
-			tf.word_wrap = True
-			tf.auto_size = MSO_AUTO_SIZE.NONE
-
-			for pi, (para_spec, wrapped_tokens) in enumerate(zip(paragraph_specs, best_wrapped)):
-				p = tf.paragraphs[0] if pi == 0 else tf.add_paragraph()
-				p.alignment = para_spec["alignment"]
-				p.space_before = Pt(0)
-				p.space_after = Pt(0)
-				# Rebuild runs, merging adjacent tokens with identical style
-				merged = []
-				for t, sk in wrapped_tokens:
-					if not merged or merged[-1][1] != sk:
-						merged.append([t, sk])
-					else:
-						merged[-1][0] += t
-				for text, sk in merged:
-					if text == "":
-						continue
-					font_name, bold, italic, color = sk
-					r = p.add_run()
-					r.text = text
-					r.font.name = font_name
-					r.font.bold = bold
-					r.font.italic = italic
-					try:
-						r.font.size = Pt(best)
-					except Exception:
-						pass
-					if color is not None:
-						try:
-							r.font.color.rgb = color
-						except Exception:
-							pass
+				slide_count, ids = self.slide_library.insert(prs, name, slide_count)
+				library_slide_ids.update(ids)
+				return slide_count
+			except Exception as e:
+				print(f"  WARNING: Static slide library unavailable, building {name} directly: {e}")
+		return STATIC_SECTIONS[name](prs, slide_count)
 
+	def _maximize_text_size(self, prs, skip_slide_ids=()):
+		"""Resize every text box to the largest font that fits its bounds.
+
+		python-pptx does not perform PowerPoint's layout engine; relying on auto-fit
+		often yields inconsistent results. The fit pass (see `textfit`) computes
+		wrapping + font size using real font metrics (Pillow) and rewrites each
+		text frame. Shapes are fitted in a process pool when there are enough
+		of them; the text frames are rewritten here, serially.
+		"""
 		try:
-			for slide in prs.slides:
-				for shape in slide.shapes:
-					if not getattr(shape, "has_text_frame", False) or not shape.has_text_frame:
-						continue
-					try:
-						_fit_shape(shape.text_frame, shape)
-					except Exception as e:
-						print(f"  WARNING: Text fit failed on a shape: {e}")
-		except Exception as e:
-			print(f"  WARNING: Maximize text size post-pass encountered an error: {e}")
+			import PIL  # noqa: F401
+		except Exception:
+			print("  WARNING: Pillow not available; skipping text fit pass")
+			return
+		from .textfit import maximize_text_size
+
+		maximize_text_size(prs, cache=self.fit_cache, jobs=self.fit_jobs, skip_slide_ids=skip_slide_ids)
+
+	def _render_section(self, prs, builder, liturgical_data, slide_count):
+		return render_slides(prs, builder(liturgical_data, self.reference_template), slide_count)
 
 	def _create_opening_slides(self, prs, liturgical_data, slide_count):
 		"""Create opening slides following reference template
-        
-		Uses auto-fit functionality to automatically adjust text size based on content length.
-		This ensures text always fits within the designated space regardless of antiphon length.
+
+		The antiphon and psalm boxes auto-fit, so text fits the designated space
+		regardless of antiphon length.
 		"""
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-		title_box = slide.shapes.add_textbox(Inches(0.3), Inches(0.1), Inches(12.7), Inches(1.2))
-		title_frame = title_box.text_frame
-		title_frame.text = "PSALMODY"
-		title_para = title_frame.paragraphs[0]
-		title_para.font.size = Pt(80)
-		title_para.font.name = "Georgia"
-		title_para.font.bold = True
-		title_para.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-		title_para.alignment = PP_ALIGN.CENTER
-
-		antiphon_1 = liturgical_data['morning_prayer']['psalmody']['antiphon_1']
-
-		antiphon_box = slide.shapes.add_textbox(Inches(0.3), Inches(1.5), Inches(12.7), Inches(3.5))
-		antiphon_frame = antiphon_box.text_frame
-		antiphon_frame.word_wrap = True
-		antiphon_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		first_para = antiphon_frame.paragraphs[0]
-		first_para.alignment = PP_ALIGN.CENTER
-
-		first_run = first_para.add_run()
-		first_run.text = "(All) Ant. 1 "
-		first_run.font.size = Pt(52)
-		first_run.font.name = "Georgia"
-		first_run.font.bold = True
-		first_run.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-
-		second_run = first_para.add_run()
-		second_run.text = antiphon_1['text']
-		second_run.font.size = Pt(52)
-		second_run.font.name = "Georgia"
-		second_run.font.bold = True
-		second_run.font.color.rgb = RGBColor(0, 0, 0)
-
-		psalm_box = slide.shapes.add_textbox(Inches(0.3), Inches(5.3), Inches(12.7), Inches(2.0))
-		psalm_frame = psalm_box.text_frame
-		psalm_frame.word_wrap = True
-		psalm_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-		psalm_title = antiphon_1.get('psalm_title', '')
-		psalm_subtitle = antiphon_1.get('psalm_subtitle', '')
-
-		if psalm_title or psalm_subtitle:
-			if psalm_title:
-				psalm_frame.text = psalm_title
-				psalm_para = psalm_frame.paragraphs[0]
-				psalm_para.font.size = Pt(44)
-				psalm_para.font.name = "Georgia"
-				psalm_para.font.bold = True
-				psalm_para.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-				psalm_para.alignment = PP_ALIGN.LEFT
-
-			if psalm_subtitle:
-				if psalm_title:
-					subtitle_para = psalm_frame.add_paragraph()
-					subtitle_para.text = psalm_subtitle
-					subtitle_para.font.size = Pt(44)
-					subtitle_para.font.name = "Georgia"
-					subtitle_para.font.bold = True
-					subtitle_para.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-					subtitle_para.alignment = PP_ALIGN.LEFT
-				else:
-					psalm_frame.text = psalm_subtitle
-					psalm_para = psalm_frame.paragraphs[0]
-					psalm_para.font.size = Pt(44)
-					psalm_para.font.name = "Georgia"
-					psalm_para.font.bold = True
-					psalm_para.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-					psalm_para.alignment = PP_ALIGN.LEFT
-
-		print(f"Created slide {slide_count}: PSALMODY title slide")
-		return slide_count
+		return self._render_section(prs, sections.opening_slides, liturgical_data, slide_count)
 
 	def _create_psalmody_section(self, prs, liturgical_data, slide_count):
-		psalm_1_verses = liturgical_data['morning_prayer']['psalmody']['psalm_1']
-		for verse in psalm_1_verses:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-			content_frame = content_box.text_frame
-			content_frame.word_wrap = True
-			content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			content_para = content_frame.paragraphs[0]
-			content_para.alignment = PP_ALIGN.LEFT
-			if "Glory to the Father" in verse['text'] or "Glory to the father" in verse['text']:
-				glory_run = content_para.add_run()
-				glory_run.text = verse['text']
-				glory_run.font.size = Pt(44)
-				glory_run.font.name = "Georgia"
-				glory_run.font.bold = True
-				glory_run.font.color.rgb = RGBColor(0, 0, 0)
-				print(f"Created slide {slide_count}: Psalm 1 - Glory Be")
-			elif verse['speaker'] == "Priest":
-				priest_run = content_para.add_run()
-				priest_run.text = f"Priest: {verse['text']}"
-				priest_run.font.size = Pt(44)
-				priest_run.font.name = "Georgia"
-				priest_run.font.bold = True
-				priest_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-				print(f"Created slide {slide_count}: Psalm 1 - {verse['speaker']}")
-			elif verse['speaker'] == "People":
-				people_label = content_para.add_run()
-				people_label.text = "People: "
-				people_label.font.size = Pt(44)
-				people_label.font.name = "Georgia"
-				people_label.font.bold = True
-				people_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-				people_text = content_para.add_run()
-				people_text.text = verse['text']
-				people_text.font.size = Pt(44)
-				people_text.font.name = "Georgia"
-				people_text.font.bold = True
-				people_text.font.color.rgb = RGBColor(0, 0, 0)
-				print(f"Created slide {slide_count}: Psalm 1 - {verse['speaker']}")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		antiphon_1 = liturgical_data['morning_prayer']['psalmody']['antiphon_1']
-		ant_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-		ant_frame = ant_box.text_frame
-		ant_frame.word_wrap = True
-		ant_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		ant_para = ant_frame.paragraphs[0]
-		ant_para.alignment = PP_ALIGN.CENTER
-		ant_label = ant_para.add_run()
-		ant_label.text = "(All) Ant. 1 "
-		ant_label.font.size = Pt(44)
-		ant_label.font.name = "Georgia"
-		ant_label.font.bold = True
-		ant_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-		ant_text = ant_para.add_run()
-		ant_text.text = antiphon_1['text']
-		ant_text.font.size = Pt(44)
-		ant_text.font.name = "Georgia"
-		ant_text.font.bold = True
-		ant_text.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: Repeated Antiphon 1")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		antiphon_2 = liturgical_data['morning_prayer']['psalmody']['antiphon_2']
-		ant2_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-		ant2_frame = ant2_box.text_frame
-		ant2_frame.word_wrap = True
-		ant2_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		ant2_para = ant2_frame.paragraphs[0]
-		ant2_para.alignment = PP_ALIGN.CENTER
-		ant2_label = ant2_para.add_run()
-		ant2_label.text = "Ant. 2 "
-		ant2_label.font.size = Pt(44)
-		ant2_label.font.name = "Georgia"
-		ant2_label.font.bold = True
-		ant2_label.font.color.rgb = RGBColor(0x00, 0, 0xFF)
-		ant2_text = ant2_para.add_run()
-		ant2_text.text = antiphon_2['text']
-		ant2_text.font.size = Pt(44)
-		ant2_text.font.name = "Georgia"
-		ant2_text.font.bold = True
-		ant2_text.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: Antiphon 2")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		canticle_info = liturgical_data['morning_prayer']['psalmody']['canticle_info']
-		canticle_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.33), Inches(3))
-		canticle_frame = canticle_box.text_frame
-		canticle_frame.word_wrap = True
-		canticle_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		canticle_para = canticle_frame.paragraphs[0]
-		canticle_para.alignment = PP_ALIGN.LEFT
-		canticle_title_run = canticle_para.add_run()
-		canticle_title_run.text = canticle_info['title']
-		canticle_title_run.font.size = Pt(44)
-		canticle_title_run.font.name = "Georgia"
-		canticle_title_run.font.bold = True
-		canticle_title_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-		if canticle_info['subtitle']:
-			canticle_subtitle_para = canticle_frame.add_paragraph()
-			canticle_subtitle_para.alignment = PP_ALIGN.LEFT
-			canticle_subtitle_run = canticle_subtitle_para.add_run()
-			canticle_subtitle_run.text = canticle_info['subtitle']
-			canticle_subtitle_run.font.size = Pt(44)
-			canticle_subtitle_run.font.name = "Georgia"
-			canticle_subtitle_run.font.bold = True
-			canticle_subtitle_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-		print(f"Created slide {slide_count}: Canticle info")
-
-		canticle_data = liturgical_data['morning_prayer']['psalmody']['canticle']
-		canticle_verses = (
-			canticle_data.get('verses', canticle_data) if isinstance(canticle_data, dict) else canticle_data
-		)
-		omit_glory_be = (
-			canticle_data.get('omit_glory_be', False) if isinstance(canticle_data, dict) else False
-		)
-		for verse in canticle_verses:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-			content_frame = content_box.text_frame
-			content_frame.word_wrap = True
-			content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			content_para = content_frame.paragraphs[0]
-			content_para.alignment = PP_ALIGN.LEFT
-			if "Glory to the Father" in verse['text'] or "Glory to the father" in verse['text']:
-				glory_run = content_para.add_run()
-				glory_run.text = verse['text']
-				glory_run.font.size = Pt(44)
-				glory_run.font.name = "Georgia"
-				glory_run.font.bold = True
-				glory_run.font.color.rgb = RGBColor(0, 0, 0)
-				print(f"Created slide {slide_count}: Canticle - Glory Be")
-			elif verse['speaker'] == "Priest":
-				priest_run = content_para.add_run()
-				priest_run.text = f"Priest: {verse['text']}"
-				priest_run.font.size = Pt(44)
-				priest_run.font.name = "Georgia"
-				priest_run.font.bold = True
-				priest_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-				print(f"Created slide {slide_count}: Canticle - {verse['speaker']}")
-			elif verse['speaker'] == "People":
-				people_label = content_para.add_run()
-				people_label.text = "People: "
-				people_label.font.size = Pt(44)
-				people_label.font.name = "Georgia"
-				people_label.font.bold = True
-				people_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-				people_text = content_para.add_run()
-				people_text.text = verse['text']
-				people_text.font.size = Pt(44)
-				people_text.font.name = "Georgia"
-				people_text.font.bold = True
-				people_text.font.color.rgb = RGBColor(0, 0, 0)
-				print(f"Created slide {slide_count}: Canticle - {verse['speaker']}")
-
-		if not omit_glory_be:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			glory_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-			glory_frame = glory_box.text_frame
-			glory_frame.word_wrap = True
-			glory_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			glory_para = glory_frame.paragraphs[0]
-			glory_para.alignment = PP_ALIGN.LEFT
-			glory_run = glory_para.add_run()
-			glory_run.text = (
-				"Glory to the Father, and to the Son, and to the Holy Spirit: as it was in the beginning, is now, and will be for ever. Amen."
-			)
-			glory_run.font.size = Pt(44)
-			glory_run.font.name = "Georgia"
-			glory_run.font.bold = True
-			glory_run.font.color.rgb = RGBColor(0, 0, 0)
-			print(f"Created slide {slide_count}: Canticle - Glory Be")
-		else:
-			print(f"  Skipping Glory Be slide (explicitly omitted for this canticle)")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		antiphon_2 = liturgical_data['morning_prayer']['psalmody']['antiphon_2']
-		ant2_repeat_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-		ant2_repeat_frame = ant2_repeat_box.text_frame
-		ant2_repeat_frame.word_wrap = True
-		ant2_repeat_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		ant2_repeat_para = ant2_repeat_frame.paragraphs[0]
-		ant2_repeat_para.alignment = PP_ALIGN.CENTER
-		ant2_repeat_label = ant2_repeat_para.add_run()
-		ant2_repeat_label.text = "(All) Ant. 2 "
-		ant2_repeat_label.font.size = Pt(44)
-		ant2_repeat_label.font.name = "Georgia"
-		ant2_repeat_label.font.bold = True
-		ant2_repeat_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-		ant2_repeat_text = ant2_repeat_para.add_run()
-		ant2_repeat_text.text = antiphon_2['text']
-		ant2_repeat_text.font.size = Pt(44)
-		ant2_repeat_text.font.name = "Georgia"
-		ant2_repeat_text.font.bold = True
-		ant2_repeat_text.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: Repeated Antiphon 2")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		antiphon_3 = liturgical_data['morning_prayer']['psalmody']['antiphon_3']
-		ant3_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-		ant3_frame = ant3_box.text_frame
-		ant3_frame.word_wrap = True
-		ant3_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		ant3_para = ant3_frame.paragraphs[0]
-		ant3_para.alignment = PP_ALIGN.CENTER
-		ant3_label = ant3_para.add_run()
-		ant3_label.text = "(All) Ant. 3 "
-		ant3_label.font.size = Pt(44)
-		ant3_label.font.name = "Georgia"
-		ant3_label.font.bold = True
-		ant3_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-		ant3_text = ant3_para.add_run()
-		ant3_text.text = antiphon_3['text']
-		ant3_text.font.size = Pt(44)
-		ant3_text.font.name = "Georgia"
-		ant3_text.font.bold = True
-		ant3_text.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: Antiphon 3")
-
-		if antiphon_3.get('psalm_title'):
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			psalm_info_box = slide.shapes.add_textbox(Inches(0.5), Inches(2), Inches(12.33), Inches(3.5))
-			psalm_info_frame = psalm_info_box.text_frame
-			psalm_info_frame.word_wrap = True
-			psalm_info_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			psalm_info_para = psalm_info_frame.paragraphs[0]
-			psalm_info_para.alignment = PP_ALIGN.CENTER
-			psalm_title_run = psalm_info_para.add_run()
-			psalm_title_run.text = antiphon_3['psalm_title']
-			psalm_title_run.font.size = Pt(48)
-			psalm_title_run.font.name = "Georgia"
-			psalm_title_run.font.bold = True
-			psalm_title_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			if antiphon_3.get('psalm_subtitle'):
-				psalm_info_para.add_run().text = "\n"
-				psalm_subtitle_run = psalm_info_para.add_run()
-				psalm_subtitle_run.text = antiphon_3['psalm_subtitle']
-				psalm_subtitle_run.font.size = Pt(36)
-				psalm_subtitle_run.font.name = "Georgia"
-				psalm_subtitle_run.font.italic = True
-				psalm_subtitle_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			print(f"Created slide {slide_count}: Psalm 3 Title and Subtitle")
-
-		psalm_3_verses = liturgical_data['morning_prayer']['psalmody']['psalm_3']
-		for verse in psalm_3_verses:
-			if "Glory to the Father" in verse['text'] or "Glory to the father" in verse['text']:
-				print(f"  Skipping Glory Be verse from extraction (will add manually)")
-				continue
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-			content_frame = content_box.text_frame
-			content_frame.word_wrap = True
-			content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			content_para = content_frame.paragraphs[0]
-			content_para.alignment = PP_ALIGN.LEFT
-			if verse['speaker'] == "Priest":
-				priest_run = content_para.add_run()
-				priest_run.text = f"Priest: {verse['text']}"
-				priest_run.font.size = Pt(44)
-				priest_run.font.name = "Georgia"
-				priest_run.font.bold = True
-				priest_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-				print(f"Created slide {slide_count}: Psalm 3 - {verse['speaker']}")
-			elif verse['speaker'] == "People":
-				people_label = content_para.add_run()
-				people_label.text = "People: "
-				people_label.font.size = Pt(44)
-				people_label.font.name = "Georgia"
-				people_label.font.bold = True
-				people_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-				people_text = content_para.add_run()
-				people_text.text = verse['text']
-				people_text.font.size = Pt(44)
-				people_text.font.name = "Georgia"
-				people_text.font.bold = True
-				people_text.font.color.rgb = RGBColor(0, 0, 0)
-				print(f"Created slide {slide_count}: Psalm 3 - {verse['speaker']}")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		glory_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-		glory_frame = glory_box.text_frame
-		glory_frame.word_wrap = True
-		glory_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		glory_para = glory_frame.paragraphs[0]
-		glory_para.alignment = PP_ALIGN.LEFT
-		glory_run = glory_para.add_run()
-		glory_run.text = (
-			"Glory to the Father, and to the Son, and to the Holy Spirit: as it was in the beginning, is now, and will be for ever. Amen."
-		)
-		glory_run.font.size = Pt(44)
-		glory_run.font.name = "Georgia"
-		glory_run.font.bold = True
-		glory_run.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: Psalm 3 - Glory Be")
-
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		ant3_repeat_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-		ant3_repeat_frame = ant3_repeat_box.text_frame
-		ant3_repeat_frame.word_wrap = True
-		ant3_repeat_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		ant3_repeat_para = ant3_repeat_frame.paragraphs[0]
-		ant3_repeat_para.alignment = PP_ALIGN.CENTER
-		ant3_repeat_label = ant3_repeat_para.add_run()
-		ant3_repeat_label.text = "(All) Ant. 3 "
-		ant3_repeat_label.font.size = Pt(44)
-		ant3_repeat_label.font.name = "Georgia"
-		ant3_repeat_label.font.bold = True
-		ant3_repeat_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-		ant3_repeat_text = ant3_repeat_para.add_run()
-		ant3_repeat_text.text = antiphon_3['text']
-		ant3_repeat_text.font.size = Pt(44)
-		ant3_repeat_text.font.name = "Georgia"
-		ant3_repeat_text.font.bold = True
-		ant3_repeat_text.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: Repeated Antiphon 3")
-		return slide_count
+		return self._render_section(prs, sections.psalmody_section, liturgical_data, slide_count)
 
 	def _create_reading_section(self, prs, liturgical_data, slide_count):
-		reading_data = (
-			liturgical_data.get('morning_prayer', {}).get('reading', {}).get('short_reading', {})
-		)
-		if not reading_data or not reading_data.get('text'):
-			print(f"  WARNING: No reading data available, skipping reading section")
-			return slide_count
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		title_box = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(11.33), Inches(1))
-		title_frame = title_box.text_frame
-		title_frame.word_wrap = True
-		title_frame.text = "READING"
-		for paragraph in title_frame.paragraphs:
-			paragraph.alignment = PP_ALIGN.CENTER
-			for run in paragraph.runs:
-				run.font.size = Pt(48)
-				run.font.bold = True
-				run.font.color.rgb = self.reference_template['formatting_rules']['title_color']
-		content_text = ""
-		if reading_data.get('citation'):
-			content_text = f"{reading_data['citation']}\n\n"
-		content_text += reading_data['text']
-		text_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.75), Inches(12.33), Inches(5))
-		text_frame = text_box.text_frame
-		text_frame.word_wrap = True
-		text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-		text_frame.text = content_text
-		for paragraph in text_frame.paragraphs:
-			paragraph.alignment = PP_ALIGN.CENTER
-			for run in paragraph.runs:
-				run.font.size = Pt(30)
-				run.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: READING (title + content)")
-		return slide_count
+		return self._render_section(prs, sections.reading_section, liturgical_data, slide_count)
 
 	def _create_responsory_section(self, prs, liturgical_data, slide_count):
 		"""Create responsory slides matching expected formatting (no speaker labels).
@@ -1224,223 +713,11 @@ class bbgrlslidegeneratorv1:
 		2. Two-line block (statement + em-dash response)
 		3. Three-line block beginning with Glory + em-dash repeated response lines.
 		"""
-		responsory_verses = (
-			liturgical_data.get('morning_prayer', {}).get('reading', {}).get('responsory', [])
-		)
-		if not responsory_verses:
-			print(f"\tWARNING: No responsory data available, skipping responsory section")
-			return slide_count
-		for idx, verse in enumerate(responsory_verses):
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			# Normalize verse text into lines
-			raw_lines = [ln.strip() for ln in verse.get('text', '').split('\n') if ln.strip()]
-			# Determine "before" (pre–em-dash) and "after" (post–em-dash) segments
-			dash_idx = None
-			for i, ln in enumerate(raw_lines):
-				if ln.startswith('—') or ln.startswith('\u2014'):
-					dash_idx = i
-					break
-			if dash_idx is not None:
-				before_seg = "\n".join(raw_lines[:dash_idx]).strip()
-				after_parts = [raw_lines[dash_idx].lstrip('—').lstrip('\u2014').strip()] + raw_lines[dash_idx + 1 :]
-				after_seg = "\n".join(after_parts).strip()
-			else:
-				# Fallback: split on the first em-dash in concatenated text
-				joined = " ".join(raw_lines)
-				parts = [p.strip() for p in joined.split('—')]
-				if len(parts) >= 2:
-					before_seg, after_seg = parts[0], "—".join(parts[1:]).strip()
-				else:
-					before_seg, after_seg = joined, ""
-			# Title at top if requested
-			if verse.get('include_title'):
-				title_box = slide.shapes.add_textbox(Inches(1), Inches(0.5), Inches(11.33), Inches(1))
-				title_frame = title_box.text_frame
-				title_frame.text = "RESPONSORY"
-				title_p = title_frame.paragraphs[0]
-				title_p.alignment = PP_ALIGN.CENTER
-				for run in title_p.runs:
-					run.font.size = Pt(48)
-					run.font.bold = True
-					run.font.color.rgb = self.reference_template['formatting_rules']['title_color']
-				content_top = Inches(1.75)
-			else:
-				content_top = Inches(1)
-			# Content box (single paragraph: red pre-dash, black post-dash)
-			content_box = slide.shapes.add_textbox(Inches(0.5), content_top, Inches(12.33), Inches(5.5))
-			content_frame = content_box.text_frame
-			content_frame.word_wrap = True
-			content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			para = content_frame.paragraphs[0]
-			para.alignment = PP_ALIGN.CENTER
-			# Red (pre–em-dash) segment
-			if before_seg:
-				run_before = para.add_run()
-				run_before.text = before_seg
-				run_before.font.name = 'Georgia'
-				run_before.font.size = Pt(36)
-				run_before.font.bold = True
-				run_before.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			# Separator em-dash
-			if after_seg:
-				sep_run = para.add_run()
-				sep_run.text = "\n— " if "\n" in before_seg else " — "
-				sep_run.font.name = 'Georgia'
-				sep_run.font.size = Pt(36)
-				sep_run.font.bold = True
-				sep_run.font.color.rgb = RGBColor(0, 0, 0)
-				# Black (post–em-dash) segment
-				run_after = para.add_run()
-				run_after.text = after_seg
-				run_after.font.name = 'Georgia'
-				run_after.font.size = Pt(36)
-				run_after.font.bold = True
-				run_after.font.color.rgb = RGBColor(0, 0, 0)
-			print(f"Created slide {slide_count}: Responsory (formatted with red/black, idx={idx+1})")
-		return slide_count
+		return self._render_section(prs, sections.responsory_section, liturgical_data, slide_count)
 
 	def _create_gospel_canticle_section(self, prs, liturgical_data, slide_count):
 		try:
-			gospel_canticle = liturgical_data['morning_prayer']['gospel_canticle']
-			antiphon_text = gospel_canticle.get('antiphon', '')
-			if not antiphon_text:
-				print("  WARNING: No gospel canticle antiphon found, skipping section")
-				return slide_count
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			slide_count += 1
-			header_left = Inches(0.5)
-			header_top = Inches(0.5)
-			header_width = Inches(12.33)
-			header_height = Inches(1)
-			header_box = slide.shapes.add_textbox(header_left, header_top, header_width, header_height)
-			header_frame = header_box.text_frame
-			header_frame.word_wrap = True
-			header_p = header_frame.paragraphs[0]
-			header_p.text = "GOSPEL CANTICLE"
-			header_p.alignment = PP_ALIGN.CENTER
-			header_p.font.size = Pt(48)
-			header_p.font.name = 'Georgia'
-			header_p.font.bold = True
-			header_p.font.color.rgb = RGBColor(0, 51, 102)
-			content_left = Inches(0.5)
-			content_top = Inches(2)
-			content_width = Inches(12.33)
-			content_height = Inches(5)
-			content_box = slide.shapes.add_textbox(content_left, content_top, content_width, content_height)
-			content_frame = content_box.text_frame
-			content_frame.word_wrap = True
-			content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			content_p = content_frame.paragraphs[0]
-			content_p.alignment = PP_ALIGN.CENTER
-			ant_label = content_p.add_run()
-			ant_label.text = "Ant. "
-			ant_label.font.size = Pt(44)
-			ant_label.font.name = 'Georgia'
-			ant_label.font.bold = True
-			ant_label.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			ant_text = content_p.add_run()
-			ant_text.text = antiphon_text
-			ant_text.font.size = Pt(44)
-			ant_text.font.name = 'Georgia'
-			ant_text.font.bold = True
-			# Render antiphon text in standard black to maintain consistency
-			ant_text.font.color.rgb = RGBColor(0, 0, 0)
-			print(f"Created slide {slide_count}: GOSPEL CANTICLE (with header and antiphon)")
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			canticle_left = Inches(0.5)
-			canticle_top = Inches(2.5)
-			canticle_width = Inches(12.33)
-			canticle_height = Inches(3)
-			canticle_box = slide.shapes.add_textbox(canticle_left, canticle_top, canticle_width, canticle_height)
-			canticle_frame = canticle_box.text_frame
-			canticle_frame.word_wrap = True
-			p1 = canticle_frame.paragraphs[0]
-			p1.text = "Canticle of Zechariah"
-			p1.alignment = PP_ALIGN.CENTER
-			p1.font.size = Pt(44)
-			p1.font.name = 'Georgia'
-			p1.font.bold = True
-			p1.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			p2 = canticle_frame.add_paragraph()
-			p2.text = "Luke 1:68-79"
-			p2.alignment = PP_ALIGN.CENTER
-			p2.font.size = Pt(44)
-			p2.font.name = 'Georgia'
-			p2.font.bold = True
-			p2.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			p3 = canticle_frame.add_paragraph()
-			p3.text = "The Messiah and his forerunner"
-			p3.alignment = PP_ALIGN.CENTER
-			p3.font.size = Pt(44)
-			p3.font.name = 'Georgia'
-			p3.font.bold = True
-			p3.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-			print(f"Created slide {slide_count}: Canticle of Zechariah (title)")
-			benedictus_verses = [
-				"Blessed + be the Lord, the God of Israel; *\nhe has come to his people and set them free.",
-				"He has raised up for us a mighty savior,*\nborn of the house of his servant David.",
-				"Through his holy prophets he promised of old †\nthat he would save us from our enemies, *\nfrom the hands of all who hate us.",
-				"He promised to show mercy to our fathers *\nand to remember his holy covenant.",
-				"This was the oath he swore to our father Abraham: *\nto set us free from the hands of our enemies,\nfree to worship him without fear, *\nholy and righteous in his sight\n  all the days of our life.",
-				"You, my child, shall be called the prophet of the Most High; *\nfor you will go before the Lord to prepare his way,\nto give his people knowledge of salvation *\nby the forgiveness of their sins.",
-				"In the tender compassion of our God *\nthe dawn from on high shall break upon us,\nto shine on those who dwell in darkness and the shadow of death, *\nand to guide our feet into the way of peace.",
-				"Glory to the Father, and to the Son, *\nand to the Holy Spirit:",
-				"as it was in the beginning, is now, *\nand will be forever. Amen.",
-			]
-			for i, verse_text in enumerate(benedictus_verses):
-				slide_count += 1
-				slide = prs.slides.add_slide(prs.slide_layouts[6])
-				is_red = (i % 2 == 0)
-				text_color = RGBColor(0x98, 0x00, 0x00) if is_red else RGBColor(0, 0, 0)
-				verse_left = Inches(0.5)
-				verse_top = Inches(1)
-				verse_width = Inches(12.33)
-				verse_height = Inches(5.5)
-				verse_box = slide.shapes.add_textbox(verse_left, verse_top, verse_width, verse_height)
-				verse_frame = verse_box.text_frame
-				verse_frame.word_wrap = True
-				verse_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-				verse_p = verse_frame.paragraphs[0]
-				# Clean liturgical markers: remove crosses '+' and '†', and asterisks '*'
-				cleaned_text = re.sub(r"\s*\+\s*", " ", verse_text)
-				cleaned_text = cleaned_text.replace("†", "")
-				cleaned_text = cleaned_text.replace("*", "")
-				cleaned_text = re.sub(r" {2,}", " ", cleaned_text)
-				verse_p.text = cleaned_text
-				verse_p.alignment = PP_ALIGN.LEFT
-				verse_p.font.size = Pt(44)
-				verse_p.font.name = 'Georgia'
-				verse_p.font.bold = True
-				verse_p.font.color.rgb = text_color
-				print(f"Created slide {slide_count}: Benedictus verse {i+1} ({'red' if is_red else 'black'})")
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			ant_left = Inches(0.5)
-			ant_top = Inches(1)
-			ant_width = Inches(12.33)
-			ant_height = Inches(5.5)
-			ant_box = slide.shapes.add_textbox(ant_left, ant_top, ant_width, ant_height)
-			ant_frame = ant_box.text_frame
-			ant_frame.word_wrap = True
-			ant_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-			ant_p = ant_frame.paragraphs[0]
-			ant_p.alignment = PP_ALIGN.CENTER
-			ant_label = ant_p.add_run()
-			ant_label.text = "Ant. "
-			ant_label.font.size = Pt(44)
-			ant_label.font.name = 'Georgia'
-			ant_label.font.bold = True
-			ant_label.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-			ant_text_run = ant_p.add_run()
-			ant_text_run.text = antiphon_text
-			ant_text_run.font.size = Pt(44)
-			ant_text_run.font.name = 'Georgia'
-			ant_text_run.font.bold = True
-			ant_text_run.font.color.rgb = RGBColor(0, 0, 0)
-			print(f"Created slide {slide_count}: Repeated Gospel Canticle Antiphon")
-			return slide_count
+			return self._render_section(prs, sections.gospel_canticle_section, liturgical_data, slide_count)
 		except Exception as e:
 			print(f"  WARNING: Error creating gospel canticle section: {e}")
 			traceback.print_exc()
@@ -1451,114 +728,7 @@ class bbgrlslidegeneratorv1:
 
 	def _create_intercessions_section(self, prs, liturgical_data, slide_count):
 		try:
-			intercessions_data = liturgical_data['morning_prayer'].get('intercessions', [])
-			if not intercessions_data:
-				print("  No intercessions data available")
-				return slide_count
-			
-			# Process each intercession group
-			for idx, group in enumerate(intercessions_data):
-				category = group.get('category')
-				introduction = group.get('introduction', '')
-				response_line = group.get('response_line', '')
-				intentions = group.get('intentions', [])
-				
-				# Create introduction slide with INTERCESSIONS title (only for first group)
-				slide_count += 1
-				slide = prs.slides.add_slide(prs.slide_layouts[6])
-				
-				if idx == 0:
-					# Add INTERCESSIONS title at top
-					title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(12.33), Inches(1))
-					title_frame = title_box.text_frame
-					title_frame.word_wrap = True
-					title_para = title_frame.paragraphs[0]
-					title_para.alignment = PP_ALIGN.CENTER
-					title_run = title_para.add_run()
-					title_run.text = "INTERCESSIONS"
-					title_run.font.name = "Georgia"
-					title_run.font.size = Pt(48)
-					title_run.font.bold = True
-					title_run.font.color.rgb = RGBColor(0, 51, 102)
-					content_top = Inches(2)
-					print(f"Created slide {slide_count}: INTERCESSIONS (title)")
-				else:
-					content_top = Inches(1)
-					print(f"Created slide {slide_count}: Intercessions Introduction{' - ' + category if category else ''}")
-				
-				# Add introduction and response on same slide
-				content_box = slide.shapes.add_textbox(Inches(0.5), content_top, Inches(12.33), Inches(5.5))
-				content_frame = content_box.text_frame
-				content_frame.word_wrap = True
-				content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-				content_para = content_frame.paragraphs[0]
-				content_para.alignment = PP_ALIGN.CENTER
-				if introduction:
-					intro_run = content_para.add_run()
-					intro_run.text = introduction
-					intro_run.font.name = "Georgia"
-					intro_run.font.size = Pt(30)
-					intro_run.font.bold = True
-					intro_run.font.color.rgb = RGBColor(0, 0, 0)
-				
-				# Create separate slide for response line
-				if response_line:
-					slide_count += 1
-					slide = prs.slides.add_slide(prs.slide_layouts[6])
-					response_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(12.33), Inches(3))
-					response_frame = response_box.text_frame
-					response_frame.word_wrap = True
-					response_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-					response_para = response_frame.paragraphs[0]
-					response_para.alignment = PP_ALIGN.CENTER
-					all_label_run = response_para.add_run()
-					all_label_run.text = "(All) "
-					all_label_run.font.name = "Georgia"
-					all_label_run.font.size = Pt(44)
-					all_label_run.font.bold = True
-					all_label_run.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)
-					response_run = response_para.add_run()
-					response_run.text = response_line
-					response_run.font.name = "Georgia"
-					response_run.font.size = Pt(44)
-					response_run.font.bold = True
-					response_run.font.color.rgb = RGBColor(0, 0, 0)
-					print(f"Created slide {slide_count}: Intercessions Response")
-				print(
-					f"Created slide {slide_count}: Intercessions Introduction{' - ' + category if category else ''}"
-				)
-				for intention in intentions:
-					slide_count += 1
-					slide = prs.slides.add_slide(prs.slide_layouts[6])
-					intention_box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
-					intention_frame = intention_box.text_frame
-					intention_frame.word_wrap = True
-					intention_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-					intention_para = intention_frame.paragraphs[0]
-					intention_para.alignment = PP_ALIGN.CENTER
-					# Pre–em-dash petition in red
-					petition_run = intention_para.add_run()
-					petition_run.text = intention['petition']
-					petition_run.font.name = "Georgia"
-					petition_run.font.size = Pt(30)
-					petition_run.font.bold = True
-					petition_run.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
-					# Em-dash separator in black
-					dash_run = intention_para.add_run()
-					dash_run.text = "\n— "
-					dash_run.font.name = "Georgia"
-					dash_run.font.size = Pt(30)
-					dash_run.font.bold = True
-					dash_run.font.color.rgb = RGBColor(0, 0, 0)
-					# Post–em-dash response in black
-					response_run = intention_para.add_run()
-					response_run.text = intention['response']
-					response_run.font.name = "Georgia"
-					response_run.font.size = Pt(30)
-					response_run.font.bold = True
-					response_run.font.color.rgb = RGBColor(0, 0, 0)
-					print(f"Created slide {slide_count}: Intercession Intention")
-			return slide_count
+			return self._render_section(prs, sections.intercessions_section, liturgical_data, slide_count)
 		except Exception as e:
 			print(f"  WARNING: Error creating intercessions section: {e}")
 			traceback.print_exc()
@@ -1566,73 +736,7 @@ class bbgrlslidegeneratorv1:
 
 	def _create_concluding_prayer_slides(self, prs, liturgical_data, slide_count):
 		try:
-			concluding_prayer = (
-				liturgical_data.get('morning_prayer', {}).get('concluding_prayer', '')
-			)
-			if not concluding_prayer:
-				print("  WARNING: No concluding prayer found, skipping slides")
-				return slide_count
-			lines = concluding_prayer.split('\n')
-			lines = [line.strip() for line in lines if line.strip()]
-			total_lines = len(lines)
-			mid_point = total_lines // 2
-			if total_lines > 1:
-				for i in range(len(lines)):
-					if lines[i].strip().startswith('—') and 'Amen' in lines[i]:
-						if i <= mid_point:
-							mid_point = max(1, i - 1)
-						break
-			first_half = '\n'.join(lines[:mid_point])
-			second_half = '\n'.join(lines[mid_point:])
-			if not first_half or not second_half:
-				print("  WARNING: Prayer text too short or improperly split, skipping")
-				return slide_count
-			slide_count += 1
-			slide1 = prs.slides.add_slide(prs.slide_layouts[6])
-			content_box1 = slide1.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(12.33), Inches(6.5))
-			content_frame1 = content_box1.text_frame
-			content_frame1.word_wrap = True
-			content_frame1.margin_top = Inches(0.2)
-			content_frame1.margin_bottom = Inches(0.2)
-			content_frame1.margin_left = Inches(0.3)
-			content_frame1.margin_right = Inches(0.3)
-			title_para1 = content_frame1.paragraphs[0]
-			title_para1.alignment = PP_ALIGN.CENTER
-			title_run1 = title_para1.add_run()
-			title_run1.text = "CONCLUDING PRAYER"
-			title_run1.font.name = "Georgia"
-			title_run1.font.size = Pt(36)
-			title_run1.font.bold = True
-			title_run1.font.color.rgb = RGBColor(0, 0, 0)
-			content_para1 = content_frame1.add_paragraph()
-			content_para1.alignment = PP_ALIGN.CENTER
-			content_para1.space_before = Pt(14)
-			content_run1 = content_para1.add_run()
-			content_run1.text = first_half
-			content_run1.font.name = "Georgia"
-			content_run1.font.size = Pt(32)
-			content_run1.font.bold = True
-			content_run1.font.color.rgb = RGBColor(0, 0, 0)
-			print(f"Created slide {slide_count}: Concluding Prayer (1/2)")
-			slide_count += 1
-			slide2 = prs.slides.add_slide(prs.slide_layouts[6])
-			content_box2 = slide2.shapes.add_textbox(Inches(0.5), Inches(0.75), Inches(12.33), Inches(6))
-			content_frame2 = content_box2.text_frame
-			content_frame2.word_wrap = True
-			content_frame2.margin_top = Inches(0.2)
-			content_frame2.margin_bottom = Inches(0.2)
-			content_frame2.margin_left = Inches(0.3)
-			content_frame2.margin_right = Inches(0.3)
-			content_para2 = content_frame2.paragraphs[0]
-			content_para2.alignment = PP_ALIGN.CENTER
-			content_run2 = content_para2.add_run()
-			content_run2.text = second_half
-			content_run2.font.name = "Georgia"
-			content_run2.font.size = Pt(32)
-			content_run2.font.bold = True
-			content_run2.font.color.rgb = RGBColor(0, 0, 0)
-			print(f"Created slide {slide_count}: Concluding Prayer (2/2)")
-			return slide_count
+			return self._render_section(prs, sections.concluding_prayer_slides, liturgical_data, slide_count)
 		except Exception as e:
 			print(f"  WARNING: Error creating concluding prayer slides: {e}")
 			traceback.print_exc()
@@ -1643,528 +747,31 @@ class bbgrlslidegeneratorv1:
 
 	def _create_mass_readings_section(self, prs, liturgical_data, slide_count):
 		try:
-			first_reading = liturgical_data.get('mass_readings', {}).get('first_reading', {})
-			citation = first_reading.get('citation', '')
-			verses = first_reading.get('verses', [])
-			if verses:
-				slide_count = self._create_first_reading_slides(prs, citation, verses, slide_count)
-			else:
-				print("  WARNING: No First Reading verses found")
-			responsorial_psalm = (
-				liturgical_data.get('mass_readings', {}).get('responsorial_psalm', {})
-			)
-			psalm_citation = responsorial_psalm.get('citation', '')
-			psalm_verses = responsorial_psalm.get('verses', [])
-			if psalm_verses:
-				slide_count = self._create_responsorial_psalm_slides(prs, psalm_citation, psalm_verses, slide_count)
-			else:
-				print("  WARNING: No Responsorial Psalm verses found")
-			gospel_acclamation = (
-				liturgical_data.get('mass_readings', {}).get('gospel_acclamation', {})
-			)
-			acclamation_citation = gospel_acclamation.get('citation', '')
-			acclamation_verse = gospel_acclamation.get('verse', '')
-			if acclamation_citation and acclamation_verse:
-				slide_count = self._create_gospel_acclamation_slides(prs, acclamation_citation, acclamation_verse, slide_count)
-			else:
-				print("  WARNING: No Gospel Acclamation found")
-			gospel = liturgical_data.get('mass_readings', {}).get('gospel', {})
-			gospel_citation = gospel.get('citation', '')
-			gospel_content = gospel.get('content', {})
-			if gospel_citation and gospel_content:
-				slide_count = self._create_gospel_slides(prs, gospel_citation, gospel_content, slide_count)
-			else:
-				print("  WARNING: No Gospel reading found")
-			return slide_count
+			return self._render_section(prs, sections.mass_readings_section, liturgical_data, slide_count)
 		except Exception as e:
 			print(f"  WARNING: Error creating mass readings section: {e}")
 			traceback.print_exc()
 			return slide_count
 
 	def _create_first_reading_slides(self, prs, citation, verses, slide_count):
-		try:
-			if not verses:
-				return slide_count
-			current_slide_lines = []
-			is_first_slide = True
-			for line in verses:
-				current_slide_lines.append(line)
-				max_lines = 4 if is_first_slide else 5
-				if len(current_slide_lines) >= max_lines:
-					slide_count = self._create_first_reading_content_slide(
-						prs, current_slide_lines, slide_count, is_first=is_first_slide, citation=citation if is_first_slide else None
-					)
-					current_slide_lines = []
-					is_first_slide = False
-			if current_slide_lines:
-				slide_count = self._create_first_reading_content_slide(
-					prs, current_slide_lines, slide_count, is_first=is_first_slide, citation=citation if is_first_slide else None
-				)
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating first reading slides: {e}")
-			traceback.print_exc()
-			return slide_count
+		return render_slides(prs, sections.first_reading_slides(citation, verses), slide_count)
 
 	def _create_first_reading_content_slide(self, prs, lines, slide_count, is_first=False, citation=None):
-		slide_count += 1
-		slide = prs.slides.add_slide(prs.slide_layouts[6])
-		text_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(12.33), Inches(6.5))
-		text_frame = text_box.text_frame
-		text_frame.word_wrap = True
-		text_frame.vertical_anchor = MSO_ANCHOR.TOP
-		para_index = 0
-		if is_first:
-			para = text_frame.paragraphs[0]
-			para.alignment = PP_ALIGN.CENTER
-			para.space_after = Pt(16)
-			run = para.add_run()
-			run.text = "First Reading"
-			run.font.name = "Georgia"
-			run.font.size = Pt(48)
-			run.font.bold = True
-			run.font.color.rgb = RGBColor(0, 0, 139)
-			if citation:
-				para = text_frame.add_paragraph()
-				para.alignment = PP_ALIGN.CENTER
-				para.space_after = Pt(20)
-				run = para.add_run()
-				run.text = citation
-				run.font.name = "Georgia"
-				run.font.size = Pt(36)
-				run.font.bold = False
-				run.font.color.rgb = RGBColor(0, 0, 0)
-			para_index = 2
-		for i, line in enumerate(lines):
-			if i == 0 and para_index == 0:
-				para = text_frame.paragraphs[0]
-			else:
-				para = text_frame.add_paragraph()
-			para.alignment = PP_ALIGN.CENTER
-			if i == 0:
-				para.space_after = Pt(12)
-				para.space_before = Pt(0)
-			elif i == 1 and not is_first:
-				para.space_before = Pt(8)
-			elif line.strip():
-				para.space_before = Pt(8)
-			else:
-				para.space_before = Pt(16)
-			run = para.add_run()
-			run.text = line
-			run.font.name = "Georgia"
-			run.font.size = Pt(32)
-			run.font.color.rgb = RGBColor(0, 0, 0)
-		print(f"Created slide {slide_count}: First Reading {'(header + content)' if is_first else '(content)'} ({len(lines)} lines)")
-		return slide_count
+		return render_slides(prs, [sections.first_reading_content_slide(lines, is_first, citation)], slide_count)
 
 	def _create_responsorial_psalm_slides(self, prs, citation, verses, slide_count):
-		try:
-			if not verses or len(verses) < 3:
-				return slide_count
-			main_response = verses[0] if verses else "\u211f. Response"
-			slide_count = self._create_responsorial_psalm_header_slide(
-				prs, citation, main_response, slide_count
-			)
-			i = 1
-			while i < len(verses):
-				line = verses[i]
-				if line == "":
-					i += 1
-					continue
-				if line.startswith("\u211f."):
-					slide_count = self._create_responsorial_psalm_response_slide(prs, line, slide_count)
-					i += 1
-					continue
-				slide_count = self._create_responsorial_psalm_verse_slide(prs, line, slide_count)
-				i += 1
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating responsorial psalm slides: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_responsorial_psalm_header_slide(self, prs, citation, response, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(1.5)
-			width = Inches(12.33)
-			height = Inches(6.0)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.TOP
-			text_frame.clear()
-			p = text_frame.paragraphs[0]
-			p.text = "Responsorial Psalm"
-			p.font.name = "Georgia"
-			p.font.size = Pt(48)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 51, 102)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(16)
-			p = text_frame.add_paragraph()
-			p.text = citation
-			p.font.name = "Georgia"
-			p.font.size = Pt(36)
-			p.font.bold = False
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(24)
-			p = text_frame.add_paragraph()
-			p.text = response
-			p.font.name = "Georgia"
-			p.font.size = Pt(40)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			print(f"Created slide {slide_count}: Responsorial Psalm (header + citation + response)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating psalm header slide: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_responsorial_psalm_response_slide(self, prs, response, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(2.5)
-			width = Inches(12.33)
-			height = Inches(4.0)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-			text_frame.clear()
-			p = text_frame.paragraphs[0]
-			p.text = response
-			p.font.name = "Georgia"
-			p.font.size = Pt(40)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			print(f"Created slide {slide_count}: Responsorial Psalm (response)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating psalm response slide: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_responsorial_psalm_verse_slide(self, prs, verse_stanza, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(1.5)
-			width = Inches(12.33)
-			height = Inches(6.0)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.TOP
-			text_frame.clear()
-			lines = verse_stanza.split('\n')
-			for line_idx, line in enumerate(lines):
-				if line_idx == 0:
-					p = text_frame.paragraphs[0]
-				else:
-					p = text_frame.add_paragraph()
-				p.text = line.strip()
-				p.font.name = "Georgia"
-				p.font.size = Pt(32)
-				p.font.color.rgb = RGBColor(0, 0, 0)
-				p.alignment = PP_ALIGN.CENTER
-				p.space_after = Pt(8)
-			print(f"Created slide {slide_count}: Responsorial Psalm (verse)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating psalm verse slide: {e}")
-			traceback.print_exc()
-			return slide_count
+		return render_slides(prs, sections.responsorial_psalm_slides(citation, verses), slide_count)
 
 	def _create_gospel_acclamation_slides(self, prs, citation, verse, slide_count):
-		try:
-			slide_count = self._create_gospel_acclamation_header_slide(prs, citation, slide_count)
-			slide_count = self._create_gospel_acclamation_verse_slide(prs, verse, slide_count)
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel acclamation slides: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_gospel_acclamation_header_slide(self, prs, citation, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(1.5)
-			width = Inches(12.33)
-			height = Inches(6.0)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.TOP
-			text_frame.clear()
-			p = text_frame.paragraphs[0]
-			p.text = "Acclamation before the Gospel"
-			p.font.name = "Georgia"
-			p.font.size = Pt(48)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 51, 102)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(16)
-			p = text_frame.add_paragraph()
-			p.text = citation
-			p.font.name = "Georgia"
-			p.font.size = Pt(36)
-			p.font.bold = False
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(24)
-			p = text_frame.add_paragraph()
-			p.text = "℟. Alleluia, alleluia."
-			p.font.name = "Georgia"
-			p.font.size = Pt(40)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			print(f"Created slide {slide_count}: Acclamation before the Gospel (header)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel acclamation header slide: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_gospel_acclamation_verse_slide(self, prs, verse, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(1.5)
-			width = Inches(12.33)
-			height = Inches(6.0)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-			text_frame.clear()
-			verse_lines = verse.split('\n')
-			for idx, line in enumerate(verse_lines):
-				if not line.strip():
-					continue
-				p = text_frame.paragraphs[0] if idx == 0 else text_frame.add_paragraph()
-				p.text = line.strip()
-				p.font.name = "Georgia"
-				p.font.size = Pt(44)
-				p.font.color.rgb = RGBColor(0, 0, 0)
-				p.alignment = PP_ALIGN.CENTER
-				p.space_after = Pt(8)
-			p = text_frame.add_paragraph()
-			p.text = ""
-			p.space_after = Pt(16)
-			p = text_frame.add_paragraph()
-			p.text = "℟. Alleluia, alleluia."
-			p.font.name = "Georgia"
-			p.font.size = Pt(40)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			print(f"Created slide {slide_count}: Acclamation before the Gospel (verse)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel acclamation verse slide: {e}")
-			traceback.print_exc()
-			return slide_count
+		slides = [sections.gospel_acclamation_header_slide(citation), sections.gospel_acclamation_verse_slide(verse)]
+		return render_slides(prs, slides, slide_count)
 
 	def _create_gospel_slides(self, prs, citation, gospel_content, slide_count):
-		try:
-			intro_text = gospel_content.get('intro_text', '')
-			proclamation = gospel_content.get('proclamation', '')
-			gospel_text = gospel_content.get('text', '')
-			closing = gospel_content.get('closing', 'The Gospel of the Lord.')
-			response = gospel_content.get('response', 'Praise to you, Lord Jesus Christ.')
-			slide_count = self._create_gospel_header_slide(prs, citation, intro_text, proclamation, slide_count)
-			text_chunks = self._chunk_gospel_text(gospel_text)
-			for chunk in text_chunks:
-				slide_count = self._create_gospel_text_slide(prs, chunk, slide_count)
-			slide_count = self._create_gospel_closing_slide(prs, closing, response, slide_count)
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel slides: {e}")
-			traceback.print_exc()
-			return slide_count
+		return render_slides(prs, sections.gospel_slides(citation, gospel_content), slide_count)
 
 	def _chunk_gospel_text(self, text, max_chars=300):
-		paragraphs = text.split('\n\n')
-		chunks = []
-		current_chunk = []
-		current_length = 0
-		for para in paragraphs:
-			para_length = len(para)
-			if para_length > max_chars:
-				if current_chunk:
-					chunks.append('\n\n'.join(current_chunk))
-					current_chunk = []
-					current_length = 0
-				lines = para.split('\n')
-				temp_chunk = []
-				temp_length = 0
-				for line in lines:
-					line_length = len(line)
-					if temp_length + line_length > max_chars and temp_chunk:
-						chunks.append('\n'.join(temp_chunk))
-						temp_chunk = [line]
-						temp_length = line_length
-					else:
-						temp_chunk.append(line)
-						temp_length += line_length + 1
-				if temp_chunk:
-					chunks.append('\n'.join(temp_chunk))
-			elif current_length + para_length > max_chars and current_chunk:
-				chunks.append('\n\n'.join(current_chunk))
-				current_chunk = [para]
-				current_length = para_length
-			else:
-				current_chunk.append(para)
-				current_length += para_length + 2
-		if current_chunk:
-			chunks.append('\n\n'.join(current_chunk))
-		return chunks
+		return sections.chunk_gospel_text(text, max_chars)
 
-	def _create_gospel_header_slide(self, prs, citation, intro_text, proclamation, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(1.0)
-			width = Inches(12.33)
-			height = Inches(6.5)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.TOP
-			text_frame.clear()
-			p = text_frame.paragraphs[0]
-			p.text = "Gospel"
-			p.font.name = "Georgia"
-			p.font.size = Pt(48)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 51, 102)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(12)
-			p = text_frame.add_paragraph()
-			p.text = citation
-			p.font.name = "Georgia"
-			p.font.size = Pt(36)
-			p.font.bold = False
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(20)
-			if intro_text:
-				p = text_frame.add_paragraph()
-				p.text = intro_text
-				p.font.name = "Georgia"
-				p.font.size = Pt(32)
-				p.font.italic = True
-				p.font.color.rgb = RGBColor(0, 0, 0)
-				p.alignment = PP_ALIGN.CENTER
-				p.space_after = Pt(20)
-			if proclamation:
-				p = text_frame.add_paragraph()
-				p.text = proclamation
-				p.font.name = "Georgia"
-				p.font.size = Pt(32)
-				p.font.bold = True
-				p.font.color.rgb = RGBColor(0, 0, 0)
-				p.alignment = PP_ALIGN.CENTER
-			print(f"Created slide {slide_count}: Gospel (header)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel header slide: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_gospel_text_slide(self, prs, text_chunk, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(1.0)
-			width = Inches(12.33)
-			height = Inches(6.5)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.TOP
-			text_frame.clear()
-			lines = text_chunk.split('\n')
-			for idx, line in enumerate(lines):
-				if not line.strip():
-					if idx > 0:
-						p = text_frame.add_paragraph()
-						p.text = ""
-						p.space_after = Pt(8)
-					continue
-				p = text_frame.paragraphs[0] if idx == 0 else text_frame.add_paragraph()
-				p.text = line
-				p.font.name = "Georgia"
-				p.font.size = Pt(32)
-				p.font.color.rgb = RGBColor(0, 0, 0)
-				p.alignment = PP_ALIGN.CENTER
-				p.space_after = Pt(6)
-			print(f"Created slide {slide_count}: Gospel (text)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel text slide: {e}")
-			traceback.print_exc()
-			return slide_count
-
-	def _create_gospel_closing_slide(self, prs, closing, response, slide_count):
-		try:
-			slide_count += 1
-			slide = prs.slides.add_slide(prs.slide_layouts[6])
-			left = Inches(0.5)
-			top = Inches(2.0)
-			width = Inches(12.33)
-			height = Inches(5.0)
-			textbox = slide.shapes.add_textbox(left, top, width, height)
-			text_frame = textbox.text_frame
-			text_frame.word_wrap = True
-			text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-			text_frame.clear()
-			p = text_frame.paragraphs[0]
-			p.text = closing
-			p.font.name = "Georgia"
-			p.font.size = Pt(40)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(24)
-			p = text_frame.add_paragraph()
-			p.text = "All reply:"
-			p.font.name = "Georgia"
-			p.font.size = Pt(32)
-			p.font.italic = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			p.space_after = Pt(24)
-			p = text_frame.add_paragraph()
-			p.text = response
-			p.font.name = "Georgia"
-			p.font.size = Pt(40)
-			p.font.bold = True
-			p.font.color.rgb = RGBColor(0, 0, 0)
-			p.alignment = PP_ALIGN.CENTER
-			print(f"Created slide {slide_count}: Gospel (closing)")
-			return slide_count
-		except Exception as e:
-			print(f"  WARNING: Error creating gospel closing slide: {e}")
-			traceback.print_exc()
-			return slide_count
 	# Opening slides, psalmody, reading, responsory, gospel canticle,
 	# intercessions, concluding prayer, sacred heart hymns, mass readings,
 	# and all other dynamic sections remain identical to the legacy class.
@@ -0,0 +1,250 @@
+"""Pre-rendered library of the static devotional slides.
+
+The devotional slides (Heart of Jesus, Salve Regina, St. Michael, ...) are
+the same in every deck. They are built once with the builders in
+``slides.py``, run through the text fit pass, and saved as a .pptx (slide
+XML plus media parts) in the cache directory. Each deck then copies them in
+instead of rebuilding and refitting them.
+
+The library file is named by a digest of ``slides.py``, the PNG images, the
+slide size and the fonts the fitter measures with, so it is rebuilt
+automatically whenever any of them change.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from copy import deepcopy
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.util import Inches
+
+from . import slides as _slides
+
+# Bump when the build or copy logic changes, to force a rebuild
+LIBRARY_VERSION = 2
+IMAGE_DIR = "png"
+
+# Static sections in library order: name -> builder(prs, slide_count)
+STATIC_SECTIONS: Dict[str, Callable] = {
+    "initial_blank": _slides.create_initial_blank_slide,
+    "daily_morning_prayer_image": _slides.create_daily_morning_prayer_image_slide,
+    "lords_prayer": _slides.create_lords_prayer_slide,
+    "heart_of_jesus_image": _slides.create_heart_of_jesus_slide,
+    "heart_of_jesus_prayers": _slides.create_heart_of_jesus_prayer_slides,
+    "oh_sacred_heart_image": _slides.create_oh_sacred_heart_slide,
+    "oh_sacred_heart_prayers": _slides.create_oh_sacred_heart_prayer_slides,
+    "novena_sacred_heart_image": _slides.create_novena_sacred_heart_slide,
+    "soul_of_christ": _slides.create_soul_of_christ_slides,
+    "prayer_of_thanksgiving": _slides.create_prayer_of_thanksgiving_slides,
+    "novena_of_confidence": _slides.create_novena_of_confidence_slides,
+    "novena_prayer": _slides.create_novena_prayer_slides,
+    "salve_regina": _slides.create_salve_regina_slides,
+    "st_michael": _slides.create_prayer_to_st_michael_slides,
+    "jubilee": _slides.create_jubilee_prayer_slides,
+    "st_joseph_image": _slides.create_st_joseph_prayer_image_slide,
+    "st_joseph_text": _slides.create_st_joseph_prayer_text_slides,
+}
+
+# Relationship attributes that may point at a copied image
+_REL_ATTRS = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+
+def _font_identity(bold: bool, italic: bool) -> List:
+    from .fonts import font_path_for
+
+    path = font_path_for("Georgia", bold, italic)
+    try:
+        st = os.stat(path) if path else None
+    except OSError:
+        st = None
+    return [path, st.st_size if st else None, st.st_mtime_ns if st else None]
+
+
+def _image_paths() -> List[str]:
+    # Builders load images relative to the working directory
+    try:
+        names = sorted(os.listdir(IMAGE_DIR))
+    except OSError:
+        return []
+    return [p for p in (os.path.join(IMAGE_DIR, n) for n in names) if os.path.isfile(p)]
+
+
+def _input_stats() -> List:
+    """Cheap stat-based signature of the library inputs."""
+    stats = []
+    for path in [_slides.__file__] + _image_paths():
+        try:
+            st = os.stat(path)
+            stats.append((path, st.st_size, st.st_mtime_ns))
+        except OSError:
+            stats.append((path, None, None))
+    stats.append(tuple(tuple(_font_identity(b, i)) for b in (False, True) for i in (False, True)))
+    return stats
+
+
+def library_digest(slide_width: int, slide_height: int) -> str:
+    """Digest of everything the pre-rendered slides depend on."""
+    from . import textfit
+
+    h = hashlib.sha256()
+    h.update(json.dumps({
+        "version": LIBRARY_VERSION,
+        "fit": [textfit.FIT_CACHE_VERSION, textfit.FIT_TOLERANCE_PT],
+        "size": [int(slide_width), int(slide_height)],
+        "sections": list(STATIC_SECTIONS),
+        "fonts": [_font_identity(b, i) for b in (False, True) for i in (False, True)],
+    }, sort_keys=True).encode("utf-8"))
+    with open(_slides.__file__, "rb") as f:
+        h.update(f.read())
+    for path in _image_paths():
+        h.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def _clone_slide(src, prs):
+    """Append a copy of ``src`` (from another presentation) to ``prs``."""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    rid_map = {}
+    for rid, rel in src.part.rels.items():
+        if not rel.is_external and rel.reltype == RT.IMAGE:
+            # Re-add by content so images are de-duplicated in the output
+            _, new_rid = slide.part.get_or_add_image_part(BytesIO(rel.target_part.blob))
+            rid_map[rid] = new_rid
+
+    src_csld = src._element.cSld
+    dst_csld = slide._element.cSld
+    if src_csld.bg is not None:
+        dst_csld._remove_bg()
+        dst_csld.insert(0, deepcopy(src_csld.bg))
+    # Refill the existing shape tree in place; ``slide.shapes`` holds on to it
+    tree = dst_csld.spTree
+    for child in list(tree):
+        tree.remove(child)
+    for child in src_csld.spTree:
+        child = deepcopy(child)
+        for el in child.iter():
+            for attr in _REL_ATTRS:
+                value = el.get(attr)
+                if value in rid_map:
+                    el.set(attr, rid_map[value])
+        tree.append(child)
+    return slide
+
+
+class SlideLibrary:
+    """Builds, caches and copies the static devotional slides."""
+
+    def __init__(self, root: Optional[str] = None, slide_width: int = Inches(13.33),
+                 slide_height: int = Inches(7.5)):
+        if root is None:
+            from .cache import default_cache_dir
+
+            root = os.path.join(default_cache_dir(), "library")
+        self.root = root
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        # (input stats, presentation, sections) of the library in memory
+        self._loaded: Optional[Tuple[List, object, Dict[str, List[int]]]] = None
+        self._lock = threading.Lock()
+        # Serialized slide parts per section, for the streaming writer
+        self._parts: Dict[str, list] = {}
+        self.built = False  # True once this instance rebuilt the library
+
+    def _paths(self, digest: str) -> Tuple[str, str]:
+        base = os.path.join(self.root, f"static_slides_{digest[:32]}")
+        return base + ".pptx", base + ".json"
+
+    def _build(self, digest: str):
+        from .cache import _atomic_write
+        from .textfit import maximize_text_size
+
+        print("Building static slide library...")
+        prs = Presentation()
+        prs.slide_width = self.slide_width
+        prs.slide_height = self.slide_height
+        sections: Dict[str, List[int]] = {}
+        count = 0
+        for name, builder in STATIC_SECTIONS.items():
+            start = count
+            count = builder(prs, count)
+            sections[name] = list(range(start, count))
+        maximize_text_size(prs)
+
+        pptx_path, index_path = self._paths(digest)
+        buf = BytesIO()
+        prs.save(buf)
+        _atomic_write(self.root, pptx_path, buf.getvalue())
+        _atomic_write(self.root, index_path, json.dumps({"digest": digest, "sections": sections}).encode("utf-8"))
+        # Drop libraries built from older inputs
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith("static_slides_") and path not in (pptx_path, index_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        self.built = True
+        return Presentation(BytesIO(buf.getvalue())), sections
+
+    def load(self):
+        """(presentation, section -> slide indexes), building if stale."""
+        stats = _input_stats()
+        with self._lock:
+            # Only hash the inputs again once something about them changed
+            if self._loaded is not None and self._loaded[0] == stats:
+                return self._loaded[1], self._loaded[2]
+            digest = library_digest(self.slide_width, self.slide_height)
+            pptx_path, index_path = self._paths(digest)
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    sections = json.load(f)["sections"]
+                prs = Presentation(pptx_path)
+            except (OSError, ValueError, KeyError):
+                prs, sections = self._build(digest)
+            except Exception as e:
+                print(f"  WARNING: Rebuilding unreadable static slide library: {e}")
+                prs, sections = self._build(digest)
+            self._loaded = (stats, prs, sections)
+            self._parts = {}
+            return prs, sections
+
+    def insert(self, prs, name: str, slide_count: int) -> Tuple[int, List[int]]:
+        """Copy section ``name`` into ``prs``; returns (slide_count, slide ids)."""
+        library, sections = self.load()
+        indexes = sections[name]
+        src_slides = list(library.slides)
+        ids = []
+        with self._lock:
+            for i in indexes:
+                ids.append(_clone_slide(src_slides[i], prs).slide_id)
+        if indexes:
+            print(f"Created slides {slide_count + 1}-{slide_count + len(indexes)}: {name} (static library)")
+        return slide_count + len(indexes), ids
+
+    def section_parts(self, name: str) -> List[Tuple[bytes, list]]:
+        """(slide XML, images) for each slide of section ``name``.
+
+        For :meth:`~bbgrl.generator.ooxml.DeckWriter.add_slide_part`; kept in
+        memory so repeated decks skip serializing the library slides again.
+        """
+        from .ooxml import slide_part
+
+        library, sections = self.load()
+        with self._lock:
+            parts = self._parts.get(name)
+            if parts is None:
+                src_slides = list(library.slides)
+                parts = self._parts[name] = [slide_part(src_slides[i]) for i in sections[name]]
+        return parts
+
+
+__all__ = ["STATIC_SECTIONS", "SlideLibrary", "library_digest"]
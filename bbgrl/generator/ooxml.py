@@ -0,0 +1,264 @@
+"""Streaming .pptx writer.
+
+Writes a deck straight into the zip file one part at a time instead of
+building the whole presentation in python-pptx and serializing it with
+``prs.save``. The fixed parts (masters, layouts, theme, document properties)
+come from python-pptx's default template, serialized once per slide size.
+Slides are emitted from precompiled XML templates: spec slides through
+``specs.textbox_body_xml``, library slides by copying their XML and images.
+Only the slide being written is held in memory.
+
+The package matches what python-pptx saves for the same slides part for
+part (same part names, relationships, content types and XML), so it opens
+identically; ``test/test_ooxml.py`` checks this.
+"""
+
+from __future__ import annotations
+import hashlib
+import zipfile
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, IO, List, NamedTuple, Tuple, Union
+
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.opc.package import _ContentTypeMap
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.oxml.slide import CT_Slide
+from pptx.util import Inches
+
+from .specs import SlideSpec, textbox_body_xml
+
+# Index of the "Blank" layout every deck slide uses
+BLANK_LAYOUT = 6
+
+_SLIDE_XML = serialize_part_xml(CT_Slide.new()).decode("utf-8")
+_SLIDE_HEAD, _SLIDE_TAIL = _SLIDE_XML.split("</p:spTree>")
+_SLIDE_TAIL = "</p:spTree>" + _SLIDE_TAIL
+
+# python-pptx's textbox template (``CT_Shape._textbox_sp_tmpl``) without whitespace
+_TEXTBOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {n}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>{body}</p:sp>'
+)
+
+_PRESENTATION_PART = PackURI("/ppt/presentation.xml")
+_SLIDE_PARTNAME = "/ppt/slides/slide%d.xml"
+_IMAGE_PARTNAME = "/ppt/media/image%d.%s"
+
+# Relationship attributes that may point at a copied image
+_REL_ATTRS = tuple("{%s}%s" % ("http://schemas.openxmlformats.org/officeDocument/2006/relationships", a)
+                   for a in ("embed", "link", "id"))
+
+
+class _Part(NamedTuple):
+    partname: PackURI
+    content_type: str
+
+
+class SlideImage(NamedTuple):
+    """An image referenced by a copied slide: source rId, ext, content type, bytes."""
+
+    rId: str
+    ext: str
+    content_type: str
+    blob: bytes
+
+
+class _BasePackage(NamedTuple):
+    members: Dict[str, bytes]  # zip member -> bytes, presentation part excluded
+    parts: Tuple[_Part, ...]
+    presentation: bytes
+    presentation_rels: Tuple[Tuple[str, str, str, bool], ...]  # (rId, reltype, target, external)
+    layout: PackURI
+
+
+@lru_cache(maxsize=None)
+def _base_package(slide_width: int, slide_height: int) -> _BasePackage:
+    prs = Presentation()
+    prs.slide_width = slide_width
+    prs.slide_height = slide_height
+    buf = BytesIO()
+    prs.save(buf)
+    with zipfile.ZipFile(buf) as zf:
+        members = {name: zf.read(name) for name in zf.namelist()}
+    for name in ("[Content_Types].xml", _PRESENTATION_PART.membername, _PRESENTATION_PART.rels_uri.membername):
+        members.pop(name, None)
+    parts = tuple(_Part(p.partname, p.content_type) for p in prs.part.package.iter_parts())
+    rels = tuple((rel.rId, rel.reltype, rel.target_ref, rel.is_external) for rel in prs.part.rels.values())
+    return _BasePackage(members, parts, serialize_part_xml(prs.part._element), rels,
+                        prs.slide_layouts[BLANK_LAYOUT].part.partname)
+
+
+def _next_rId(used) -> str:
+    # First unused rId, filling gaps (as python-pptx's ``_Relationships._next_rId``)
+    for n in range(len(used) + 1, 0, -1):
+        if "rId%d" % n not in used:
+            return "rId%d" % n
+    raise ValueError("no free rId")
+
+
+def _rels_xml(rels) -> bytes:
+    rels_elm = CT_Relationships.new()
+    for rId, reltype, target, external in sorted(rels, key=lambda r: int(r[0][3:])):
+        rels_elm.add_rel(rId, reltype, target, external)
+    return rels_elm.xml_file_bytes
+
+
+def slide_xml(spec: SlideSpec) -> str:
+    """Slide part XML (with declaration) for ``spec``, as python-pptx writes it once rendered."""
+    shapes = []
+    for i, box in enumerate(spec.boxes):
+        shapes.append(_TEXTBOX_XML.format(
+            id=i + 2, n=i + 1, x=int(box.left), y=int(box.top), cx=int(box.width), cy=int(box.height),
+            body=textbox_body_xml(box, namespaces=False),
+        ))
+    return _SLIDE_HEAD + "".join(shapes) + _SLIDE_TAIL
+
+
+class DeckWriter:
+    """Write a .pptx one slide at a time.
+
+    Use as a context manager; slides are added with :meth:`add_spec` and
+    :meth:`add_slide_part`, and the presentation part and content types are
+    written on exit.
+    """
+
+    def __init__(self, target: Union[str, IO[bytes]], slide_width: int = Inches(13.33),
+                 slide_height: int = Inches(7.5)):
+        self._base = _base_package(int(slide_width), int(slide_height))
+        self._zip = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED)
+        self._slides_base = PackURI(_SLIDE_PARTNAME % 1).baseURI
+        self._layout_ref = self._base.layout.relative_ref(self._slides_base)
+        self._slides: List[PackURI] = []
+        self._images: Dict[str, _Part] = {}  # sha1 of the image -> part
+        for name, blob in self._base.members.items():
+            self._zip.writestr(name, blob)
+
+    def __enter__(self) -> "DeckWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
+
+    @property
+    def slide_count(self) -> int:
+        return len(self._slides)
+
+    def _write_slide(self, xml: bytes, rels) -> None:
+        partname = PackURI(_SLIDE_PARTNAME % (len(self._slides) + 1))
+        self._zip.writestr(partname.membername, xml)
+        self._zip.writestr(partname.rels_uri.membername, _rels_xml(rels))
+        self._slides.append(partname)
+
+    def _image_part(self, image: SlideImage) -> _Part:
+        # De-duplicated by content, numbered in order of first use
+        sha1 = hashlib.sha1(image.blob).hexdigest()
+        part = self._images.get(sha1)
+        if part is None:
+            part = _Part(PackURI(_IMAGE_PARTNAME % (len(self._images) + 1, image.ext)), image.content_type)
+            self._zip.writestr(part.partname.membername, image.blob)
+            self._images[sha1] = part
+        return part
+
+    def add_spec(self, spec: SlideSpec) -> None:
+        """Append a slide rendered from ``spec``."""
+        self._write_slide(slide_xml(spec).encode("utf-8"), [("rId1", RT.SLIDE_LAYOUT, self._layout_ref, False)])
+
+    def add_slide_part(self, xml: bytes, images: List[SlideImage] = ()) -> None:
+        """Append a copy of a blank-layout slide from another presentation.
+
+        ``xml`` is the source slide part and ``images`` its image relationships,
+        in relationship order; image rIds are renumbered for the new slide.
+        """
+        rels = [("rId1", RT.SLIDE_LAYOUT, self._layout_ref, False)]
+        targets: Dict[str, str] = {}
+        rid_map: Dict[str, str] = {}
+        for image in images:
+            ref = self._image_part(image).partname.relative_ref(self._slides_base)
+            if ref not in targets:
+                targets[ref] = _next_rId({r[0] for r in rels})
+                rels.append((targets[ref], RT.IMAGE, ref, False))
+            rid_map[image.rId] = targets[ref]
+        if any(old != new for old, new in rid_map.items()):
+            root = etree.fromstring(xml)
+            for el in root.iter():
+                for attr in _REL_ATTRS:
+                    value = el.get(attr)
+                    if value in rid_map:
+                        el.set(attr, rid_map[value])
+            xml = serialize_part_xml(root)
+        self._write_slide(xml, rels)
+
+    def close(self) -> None:
+        """Write the presentation part, its relationships and the content types."""
+        if self._zip.fp is None:
+            return
+        base = self._base
+        presentation = parse_xml(base.presentation)
+        rels = list(base.presentation_rels)
+        sldIdLst = presentation.get_or_add_sldIdLst()
+        for partname in self._slides:
+            rId = _next_rId({r[0] for r in rels})
+            rels.append((rId, RT.SLIDE, partname.relative_ref(_PRESENTATION_PART.baseURI), False))
+            sldIdLst.add_sldId(rId)
+        self._zip.writestr(_PRESENTATION_PART.membername, serialize_part_xml(presentation))
+        self._zip.writestr(_PRESENTATION_PART.rels_uri.membername, _rels_xml(rels))
+
+        parts = list(base.parts)
+        parts += [_Part(partname, CT.PML_SLIDE) for partname in self._slides]
+        parts += list(self._images.values())
+        self._zip.writestr("[Content_Types].xml", serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.close()
+
+
+def slide_part(slide) -> Tuple[bytes, List[SlideImage]]:
+    """(slide XML, images) of a python-pptx slide, for :meth:`DeckWriter.add_slide_part`."""
+    images = []
+    for rId, rel in slide.part.rels.items():
+        if not rel.is_external and rel.reltype == RT.IMAGE:
+            part = rel.target_part
+            images.append(SlideImage(rId, part.partname.ext, part.content_type, part.blob))
+    return slide.part.blob, images
+
+
+def _read_rels(zf: zipfile.ZipFile, partname: PackURI) -> List[Tuple[str, str, str, bool]]:
+    rels = parse_xml(zf.read(partname.rels_uri.membername))
+    return [(rel.rId, rel.reltype, rel.target_ref, rel.targetMode == "External")
+            for rel in rels.relationship_lst]
+
+
+def read_slide_parts(source: Union[str, IO[bytes]]) -> List[Tuple[bytes, List[SlideImage]]]:
+    """(slide XML, images) of every slide of a saved deck, in deck order.
+
+    Reads the zip directly, without loading the deck into python-pptx; the
+    result can be passed back to :meth:`DeckWriter.add_slide_part`.
+    """
+    with zipfile.ZipFile(source) as zf:
+        content_types = _ContentTypeMap.from_xml(zf.read("[Content_Types].xml"))
+        presentation = parse_xml(zf.read(_PRESENTATION_PART.membername))
+        targets = {rId: target for rId, reltype, target, external in _read_rels(zf, _PRESENTATION_PART)
+                   if reltype == RT.SLIDE and not external}
+        slides = []
+        for sldId in presentation.iter(qn("p:sldId")):
+            partname = PackURI.from_rel_ref(_PRESENTATION_PART.baseURI, targets[sldId.rId])
+            images = []
+            for rId, reltype, target, external in _read_rels(zf, partname):
+                if reltype == RT.IMAGE and not external:
+                    image = PackURI.from_rel_ref(partname.baseURI, target)
+                    images.append(SlideImage(rId, image.ext, content_types[image], zf.read(image.membername)))
+            slides.append((zf.read(partname.membername), images))
+    return slides
+
+
+__all__ = ["DeckWriter", "SlideImage", "read_slide_parts", "slide_part", "slide_xml"]
@@ -1,6 +1,78 @@
 from __future__ import annotations
+import os
 import re
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Union
+
+
+# bs4 tree builders we accept from BBGRL_HTML_PARSER, fastest first
+HTML_PARSERS = ("lxml", "html.parser")
+
+_parser_name: Optional[str] = None
+_selectolax_parser: Any = False  # False = not probed yet, None = unavailable
+
+
+def html_parser_name() -> str:
+    """bs4 tree builder used for every parse.
+
+    BBGRL_HTML_PARSER picks one of HTML_PARSERS explicitly; otherwise lxml
+    when it is installed, falling back to the pure-Python html.parser.
+    """
+    global _parser_name
+    if _parser_name is None:
+        requested = os.environ.get("BBGRL_HTML_PARSER", "").strip().lower()
+        if requested and requested not in HTML_PARSERS:
+            print(f"  WARNING: Unknown BBGRL_HTML_PARSER '{requested}', choosing automatically")
+            requested = ""
+        if requested:
+            _parser_name = requested
+        else:
+            try:
+                import lxml  # type: ignore  # noqa: F401
+                _parser_name = "lxml"
+            except ImportError:
+                _parser_name = "html.parser"
+    return _parser_name
+
+
+def _import_selectolax():
+    try:
+        from selectolax.lexbor import LexborHTMLParser  # type: ignore
+        return LexborHTMLParser
+    except ImportError:
+        # selectolax < 1.0 only ships the Modest backend
+        from selectolax.parser import HTMLParser  # type: ignore
+        return HTMLParser
+
+
+def _selectolax():
+    """selectolax's HTMLParser for the hot span lookups, or None.
+
+    Optional: used when installed unless BBGRL_SELECTOLAX=0.
+    """
+    global _selectolax_parser
+    if _selectolax_parser is False:
+        _selectolax_parser = None
+        if os.environ.get("BBGRL_SELECTOLAX", "1").strip().lower() not in ("0", "false", "no"):
+            try:
+                _selectolax_parser = _import_selectolax()
+            except ImportError:
+                pass
+    return _selectolax_parser
+
+
+def set_html_backend(parser: Optional[str] = None, selectolax: Optional[bool] = None) -> None:
+    """Override the backend chosen from the environment (None = re-detect)."""
+    global _parser_name, _selectolax_parser
+    if parser is not None and parser not in HTML_PARSERS:
+        raise ValueError(f"Unsupported HTML parser: {parser}")
+    _parser_name = parser
+    if selectolax is None:
+        _selectolax_parser = False
+    elif selectolax:
+        _selectolax_parser = _import_selectolax()
+    else:
+        _selectolax_parser = None
 
 
 def _bs4(text_or_html: str):
@@ -8,7 +80,223 @@ def _bs4(text_or_html: str):
         from bs4 import BeautifulSoup  # type: ignore
     except Exception:
         raise
-    return BeautifulSoup(text_or_html, 'html.parser')
+    return BeautifulSoup(text_or_html, html_parser_name())
+
+
+# Section markers found by SectionIndex, as (name, pattern). All patterns are
+# matched case-insensitively. No two may match at the same offset; variants
+# that share a prefix (e.g. "Ant. 2" vs "Ant. B") are told apart by the
+# extractors with a bounded ``refine`` match instead.
+SECTION_MARKERS = (
+    ("psalmody", r"PSALMODY"),
+    ("ant", r"Ant\."),
+    ("canticle_colon", r"Canticle:"),
+    ("zechariah", r"CANTICLE\s+OF\s+ZECHARIAH"),
+    ("gospel_canticle", r"GOSPEL\s+CANTICLE"),
+    ("benedictus", r"Benedictus"),
+    ("reading", r"READING"),
+    ("first_reading", r"FIRST\s+READING"),
+    ("mass_readings", r"MASS\s+READINGS"),
+    ("responsory", r"RESPONSORY"),
+    ("intercessions", r"INTERCESSIONS"),
+    ("lords_prayer", r"THE LORD.S PRAYER"),
+    ("let_us_pray", r"Let us pray"),
+    ("concluding_prayer", r"CONCLUDING\s+PRAYER"),
+    ("sacred_heart", r"SACRED\s+HEART"),
+    ("or", r"\bOr:"),
+)
+
+
+def _compile_markers(markers) -> "re.Pattern[str]":
+    # A zero-width lookahead reports markers that start inside another
+    # marker (READING inside MASS READINGS); the leading character class
+    # lets the C scanner skip positions where no marker can start.
+    first_chars = sorted({pattern.replace("\\b", "")[0] for _, pattern in markers})
+    guard = "".join(re.escape(c) for c in first_chars)
+    body = "|".join(f"(?P<{name}>{pattern})" for name, pattern in markers)
+    return re.compile(f"(?=[{guard}])(?=(?:{body}))", re.IGNORECASE)
+
+
+_SECTION_RE = _compile_markers(SECTION_MARKERS)
+_ANT_LETTER = re.compile(r'Ant\.\s+[A-Z]', re.IGNORECASE)
+_LET_US_PRAY_STOP = re.compile(r'Let us pray\.', re.IGNORECASE)
+
+
+class SectionIndex:
+    """Offsets of every section marker in a text, found in one pass.
+
+    ``find`` and friends search only within ``[lo, hi)`` and never slice the
+    text, so extractors can bound their work to one region. ``region`` returns
+    a view over a sub-range sharing the same offset table.
+    """
+
+    def __init__(self, text: str, lo: int = 0, hi: Optional[int] = None, _spans=None):
+        self.text = text
+        self.lo = lo
+        self.hi = len(text) if hi is None else hi
+        if _spans is None:
+            _spans = {name: ([], []) for name, _ in SECTION_MARKERS}
+            for m in _SECTION_RE.finditer(text):
+                name = m.lastgroup
+                starts, ends = _spans[name]
+                starts.append(m.start(name))
+                ends.append(m.end(name))
+        self._spans = _spans
+
+    @classmethod
+    def of(cls, value: Union[str, "SectionIndex"]) -> "SectionIndex":
+        return value if isinstance(value, SectionIndex) else cls(value)
+
+    def region(self, lo: int, hi: Optional[int] = None) -> "SectionIndex":
+        lo = max(self.lo, lo)
+        hi = self.hi if hi is None else min(self.hi, hi)
+        return SectionIndex(self.text, lo, hi, _spans=self._spans)
+
+    def __str__(self) -> str:
+        return self.text[self.lo:self.hi]
+
+    def find(self, name: str, start: Optional[int] = None, limit: Optional[int] = None,
+             refine: Optional["re.Pattern[str]"] = None):
+        """First ``(start, end)`` of marker ``name`` lying within the bounds.
+
+        ``refine``, if given, must match at the marker offset; its match end
+        becomes the span end. Returns None when nothing is found.
+        """
+        from bisect import bisect_left
+
+        lo = self.lo if start is None else max(self.lo, start)
+        hi = self.hi if limit is None else min(self.hi, limit)
+        starts, ends = self._spans[name]
+        for i in range(bisect_left(starts, lo), len(starts)):
+            pos = starts[i]
+            if pos >= hi:
+                break
+            if refine is not None:
+                m = refine.match(self.text, pos, hi)
+                if not m:
+                    continue
+                end = m.end()
+            else:
+                end = ends[i]
+            if end <= hi:
+                return pos, end
+        return None
+
+    def find_all(self, name: str) -> List[tuple]:
+        starts, ends = self._spans[name]
+        return [(s, e) for s, e in zip(starts, ends) if s >= self.lo and e <= self.hi]
+
+    def first_of(self, markers, start: Optional[int] = None, limit: Optional[int] = None):
+        """Span of the first marker, in *list order*, present in the bounds.
+
+        ``markers`` holds names or ``(name, refine)`` pairs. This mirrors the
+        stop-pattern loops: an earlier entry wins even if a later one occurs
+        sooner in the text.
+        """
+        for marker in markers:
+            name, refine = marker if isinstance(marker, tuple) else (marker, None)
+            span = self.find(name, start, limit, refine)
+            if span:
+                return span
+        return None
+
+
+class ParsedPage:
+    """An iBreviary page parsed once and shared by every extractor.
+
+    The soup, its text renderings and the section offsets are computed on
+    first use and cached, so passing one ``ParsedPage`` to all the parsers
+    costs a single DOM parse. Extractors must treat ``soup`` as read-only.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+
+    @classmethod
+    def of(cls, value: Union[str, "ParsedPage"]) -> "ParsedPage":
+        return value if isinstance(value, ParsedPage) else cls(value)
+
+    @cached_property
+    def soup(self):
+        return _bs4(self.html)
+
+    @cached_property
+    def text(self) -> str:
+        """``soup.get_text()`` — the rendering the readings parsers use."""
+        return self.soup.get_text()
+
+    @cached_property
+    def lines_text(self) -> str:
+        """``soup.get_text(separator="\\n")`` — one text node per line."""
+        return self.soup.get_text(separator="\n")
+
+    @cached_property
+    def soup_html(self) -> str:
+        """The soup re-serialized (normalized markup, as ``str(soup)``)."""
+        return str(self.soup)
+
+    @cached_property
+    def _fast_tree(self):
+        parser = _selectolax()
+        return parser(self.html) if parser else None
+
+    def span_texts(self, css_class: str) -> List[str]:
+        """Text of every ``<span class=css_class>`` in document order."""
+        tree = self._fast_tree
+        if tree is not None:
+            return [node.text(deep=True) for node in tree.css(f"span.{css_class}")]
+        return [span.get_text() for span in self.soup.find_all('span', class_=css_class)]
+
+    def titled_citation(self, title_pattern: str) -> Optional[str]:
+        """Citation beside the first ``span.titolo`` whose text matches.
+
+        iBreviary renders section headings as ``<p><span class="titolo">Gospel
+        </span> <span class="citazione">Lk 17:7-10</span></p>``. Returns the
+        stripped citation ("" when the paragraph has none), or None when no
+        heading matches.
+        """
+        regex = re.compile(title_pattern, re.IGNORECASE)
+        tree = self._fast_tree
+        if tree is not None:
+            for node in tree.css("span.titolo"):
+                if not regex.search(node.text(deep=True)):
+                    continue
+                parent = node.parent
+                while parent is not None and parent.tag != "p":
+                    parent = parent.parent
+                if parent is None:
+                    return None
+                citation = parent.css_first("span.citazione")
+                return citation.text(deep=True).strip() if citation is not None else ""
+            return None
+        title_span = self.soup.find('span', class_='titolo', string=regex)
+        if not title_span:
+            return None
+        title_p = title_span.find_parent('p')
+        if title_p is None:
+            return None
+        citation_span = title_p.find('span', class_='citazione')
+        return citation_span.get_text().strip() if citation_span else ""
+
+    @cached_property
+    def sections(self) -> SectionIndex:
+        """Section marker offsets in ``lines_text``."""
+        return SectionIndex(self.lines_text)
+
+    @cached_property
+    def html_sections(self) -> SectionIndex:
+        """Section marker offsets in ``soup_html``."""
+        return SectionIndex(self.soup_html)
+
+    @cached_property
+    def psalmody_offset(self) -> int:
+        """Offset of "PSALMODY" in ``lines_text``, or -1."""
+        span = self.sections.find("psalmody")
+        return span[0] if span else -1
+
+
+def _soup_of(value):
+    return value.soup if isinstance(value, ParsedPage) else value
 
 
 # ---- Psalm helpers ----
@@ -24,6 +312,7 @@ def get_fallback_verses(psalm_number: int) -> List[Dict[str, str]]:
 
 
 def extract_antiphon_and_psalm_info(text: Any, number: int, text_after_psalmody: Optional[str] = None) -> Dict[str, str]:
+    text = _soup_of(text)
     if hasattr(text, 'find_all'):
         soup = text
         text_content = text_after_psalmody if text_after_psalmody else soup.get_text()
@@ -170,6 +459,7 @@ def extract_antiphon(text: str, number: int) -> Dict[str, str]:
 
 def extract_psalm_verses_from_html(soup, psalm_number: int) -> List[Dict[str, str]]:
     verses: List[Dict[str, str]] = []
+    soup = _soup_of(soup)
     try:
         ant_pattern = rf'Ant\.\s*{psalm_number}\s*$'
         ant_span = None
@@ -313,6 +603,7 @@ def get_fallback_canticle_verses() -> Dict[str, Any]:
 
 def extract_canticle_verses(soup, text: Optional[str] = None) -> Dict[str, Any]:
     verses: List[Dict[str, str]] = []
+    soup = _soup_of(soup)
     omit_glory_be = False
     try:
         canticle_span = None
@@ -382,8 +673,12 @@ def extract_canticle_verses(soup, text: Optional[str] = None) -> Dict[str, Any]:
 
 def extract_canticle_info(soup, text: str) -> Dict[str, str]:
     try:
-        for span in soup.find_all('span', class_='rubrica'):
-            span_text = span.get_text().strip()
+        if isinstance(soup, ParsedPage):
+            rubrica_texts = soup.span_texts('rubrica')
+        else:
+            rubrica_texts = [span.get_text() for span in soup.find_all('span', class_='rubrica')]
+        for span_text in rubrica_texts:
+            span_text = span_text.strip()
             if span_text.startswith('Canticle:') and re.search(r'\d+:\d+', span_text):
                 match = re.match(r'(Canticle:\s+[A-Za-z\s]+\d+:\d+(?:[-—]\d+(?::\d+)?)?(?:,\s*\d+)?)(.*)', span_text, re.IGNORECASE)
                 if match:
@@ -413,28 +708,27 @@ def extract_canticle_info(soup, text: str) -> Dict[str, str]:
 
 # ---- Reading, Responsory, Gospel ----
 
-def extract_short_reading(text: str) -> Dict[str, str]:
+def extract_short_reading(text: Union[str, SectionIndex]) -> Dict[str, str]:
     try:
-        reading_matches = list(re.finditer(r'READING', text, re.IGNORECASE))
+        sections = SectionIndex.of(text)
+        reading_matches = sections.find_all("reading")
         if not reading_matches:
             print("  WARNING: No READING marker found")
             return {"citation": "", "text": ""}
         reading_start = None
-        for match in reading_matches:
-            test_start = match.end()
-            responsory_test = re.search(r'RESPONSORY', text[test_start:test_start + 1000], re.IGNORECASE)
-            if responsory_test:
+        for _, test_start in reading_matches:
+            if sections.find("responsory", test_start, test_start + 1000):
                 reading_start = test_start
                 break
         if reading_start is None:
             print("  WARNING: No READING with RESPONSORY found")
             return {"citation": "", "text": ""}
-        responsory_match = re.search(r'RESPONSORY', text[reading_start:], re.IGNORECASE)
+        responsory_match = sections.find("responsory", reading_start)
         if not responsory_match:
             print("  WARNING: No RESPONSORY marker found after READING")
             return {"citation": "", "text": ""}
-        reading_end = reading_start + responsory_match.start()
-        reading_section = text[reading_start:reading_end].strip()
+        reading_end = responsory_match[0]
+        reading_section = sections.text[reading_start:reading_end].strip()
         reading_section = re.sub(r'^\[.*?\]\s*', '', reading_section)
         citation_match = re.match(r'^([1-3]?\s*[A-Za-z]+\s+\d+:\d+[a-z]?(?:-\d+[a-z]?)?)', reading_section)
         if citation_match:
@@ -451,28 +745,25 @@ def extract_short_reading(text: str) -> Dict[str, str]:
         return {"citation": "", "text": ""}
 
 
-def extract_responsory_from_html(soup, text: str) -> List[Dict[str, Any]]:
+def extract_responsory_from_html(soup, text: Union[str, SectionIndex]) -> List[Dict[str, Any]]:
     try:
-        responsory_match = re.search(r'RESPONSORY', text, re.IGNORECASE)
+        sections = SectionIndex.of(text)
+        responsory_match = sections.find("responsory")
         if not responsory_match:
             print("  WARNING: No RESPONSORY marker found in text")
             return []
-        responsory_start = responsory_match.end()
+        responsory_start = responsory_match[1]
         # Stop at Gospel Canticle or intercessions markers
-        stop_patterns = [
-            r'GOSPEL\s+CANTICLE',
-            r'Ant\.\s+[A-Z]',  # Antiphon for Gospel Canticle
-            r'CANTICLE\s+OF\s+ZECHARIAH',
-            r'\bOr:',
-            r'INTERCESSIONS'
+        stop_markers = [
+            "gospel_canticle",
+            ("ant", _ANT_LETTER),  # Antiphon for Gospel Canticle
+            "zechariah",
+            "or",
+            "intercessions",
         ]
-        responsory_end = len(text)
-        for pattern in stop_patterns:
-            stop_match = re.search(pattern, text[responsory_start:], re.IGNORECASE)
-            if stop_match:
-                responsory_end = responsory_start + stop_match.start()
-                break
-        responsory_section = text[responsory_start:responsory_end].strip()
+        stop_match = sections.first_of(stop_markers, responsory_start)
+        responsory_end = stop_match[0] if stop_match else sections.hi
+        responsory_section = sections.text[responsory_start:responsory_end].strip()
         
         normalized_section = responsory_section.replace('\u2014', '—').replace('\u2013', '—').replace('\u2015', '—')
         em_dash_parts = [part.strip() for part in normalized_section.split('—') if part.strip()]
@@ -616,26 +907,23 @@ def extract_responsory(text: str) -> List[Dict[str, str]]:
         return []
 
 
-def extract_gospel_antiphon(text: str) -> str:
+def extract_gospel_antiphon(text: Union[str, SectionIndex]) -> str:
     try:
-        gc_match = re.search(r'GOSPEL\s+CANTICLE', text, re.IGNORECASE)
+        sections = SectionIndex.of(text)
+        gc_match = sections.find("gospel_canticle")
         if not gc_match:
             print("  WARNING: No GOSPEL CANTICLE marker found")
             return ""
-        start_pos = gc_match.end()
-        ant_match = re.search(r'Ant\.', text[start_pos:start_pos + 500], re.IGNORECASE)
+        start_pos = gc_match[1]
+        ant_match = sections.find("ant", start_pos, start_pos + 500)
         if not ant_match:
             print("  WARNING: No antiphon marker found after GOSPEL CANTICLE")
             return ""
-        ant_start = start_pos + ant_match.end()
-        stop_patterns = [r'Canticle\s+of\s+Zechariah', r'Benedictus', r'Canticle:', r'INTERCESSIONS', r'Let us pray']
-        end_pos = len(text)
-        for pattern in stop_patterns:
-            stop_match = re.search(pattern, text[ant_start:ant_start + 2000], re.IGNORECASE)
-            if stop_match:
-                end_pos = ant_start + stop_match.start()
-                break
-        antiphon_text = text[ant_start:end_pos].strip()
+        ant_start = ant_match[1]
+        stop_markers = ["zechariah", "benedictus", "canticle_colon", "intercessions", "let_us_pray"]
+        stop_match = sections.first_of(stop_markers, ant_start, ant_start + 2000)
+        end_pos = stop_match[0] if stop_match else sections.hi
+        antiphon_text = sections.text[ant_start:end_pos].strip()
         antiphon_text = re.sub(r'\s+', ' ', antiphon_text).strip()
         antiphon_text = re.sub(r'(Canticle|Benedictus|INTERCESSIONS).*$', '', antiphon_text, flags=re.IGNORECASE).strip()
         if antiphon_text:
@@ -782,11 +1070,11 @@ def extract_first_reading_verses(text: str) -> List[str]:
         return []
 
 
-def extract_psalm_citation(html_or_text: str) -> str:
-    from bs4 import BeautifulSoup  # type: ignore
-    if html_or_text.strip().startswith('<'):
-        soup = BeautifulSoup(html_or_text, 'html.parser')
-        text = soup.get_text()
+def extract_psalm_citation(html_or_text: Union[str, ParsedPage]) -> str:
+    if isinstance(html_or_text, ParsedPage):
+        text = html_or_text.text
+    elif html_or_text.strip().startswith('<'):
+        text = ParsedPage(html_or_text).text
     else:
         text = html_or_text
     match = re.search(r'(?:Responsorial Psalm|RESPONSORIAL PSALM)\s*([Pp]s?\s*[\d:,\s-]+)', text, re.IGNORECASE)
@@ -798,10 +1086,9 @@ def extract_psalm_citation(html_or_text: str) -> str:
     return "Ps [citation not found]"
 
 
-def extract_psalm_response_verses(html_content: str) -> List[str]:
-    from bs4 import BeautifulSoup  # type: ignore
-    if html_content.strip().startswith('<'):
-        soup = BeautifulSoup(html_content, 'html.parser')
+def extract_psalm_response_verses(html_content: Union[str, ParsedPage]) -> List[str]:
+    if isinstance(html_content, ParsedPage) or html_content.strip().startswith('<'):
+        soup = ParsedPage.of(html_content).soup
         psalm_heading = soup.find(string=re.compile(r'Responsorial Psalm', re.IGNORECASE))
         if not psalm_heading:
             return ["\u211f. [Response not found]", "[Verses not found]"]
@@ -821,7 +1108,7 @@ def extract_psalm_response_verses(html_content: str) -> List[str]:
                 if i + 1 < len(psalm_paragraphs):
                     next_p = psalm_paragraphs[i + 1]
                     html_str = str(next_p).replace('<br>', '\n').replace('<br/>', '\n').replace('<br />', '\n')
-                    temp_soup = BeautifulSoup(html_str, 'html.parser')
+                    temp_soup = _bs4(html_str)
                     resp_text = temp_soup.get_text()
                     response_match = re.search(r'\u211f\.\s*\(([^)]+)\)\s*([^\n]+?)(?=\s*or:|\s*\n|$)', resp_text)
                     if response_match:
@@ -842,7 +1129,7 @@ def extract_psalm_response_verses(html_content: str) -> List[str]:
             if any(x in text_content for x in ['R. :', 'Ps ', 'Responsorial Psalm', 'Second Reading']):
                 continue
             html_str = str(p).replace('<br>', '\n').replace('<br/>', '\n').replace('<br />', '\n')
-            temp_soup = BeautifulSoup(html_str, 'html.parser')
+            temp_soup = _bs4(html_str)
             verse_text = temp_soup.get_text()
             verse_text = re.sub(r'\u211f\.\s*[^\n]*(?:\n\s*or:\s*\n\s*\u211f\.\s*[^\n]*)?', '\n\n', verse_text)
             stanzas = re.split(r'\n\s*\n+', verse_text)
@@ -868,10 +1155,9 @@ def extract_psalm_response_verses(html_content: str) -> List[str]:
         return ["\u211f. [Response not found]", "[Verses - HTML parsing required]"]
 
 
-def extract_gospel_acclamation(html_content: str) -> Dict[str, str]:
+def extract_gospel_acclamation(html_content: Union[str, ParsedPage]) -> Dict[str, str]:
     try:
-        from bs4 import BeautifulSoup  # type: ignore
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = ParsedPage.of(html_content).soup
         title_span = soup.find('span', class_='titolo', string=re.compile(r'Acclamation before the Gospel', re.IGNORECASE))
         if not title_span:
             print("  WARNING: Could not find Acclamation section")
@@ -885,7 +1171,7 @@ def extract_gospel_acclamation(html_content: str) -> Dict[str, str]:
             return {"citation": citation, "verse": ""}
         verse_html = str(verse_p)
         verse_html = re.sub(r'<span class="rubrica">℟\.</span>\s*<strong>Alleluia, alleluia\.</strong>', '', verse_html, flags=re.IGNORECASE)
-        verse_soup = BeautifulSoup(verse_html, 'html.parser')
+        verse_soup = _bs4(verse_html)
         for br in verse_soup.find_all('br'):
             br.replace_with('\n')
         verse_text = verse_soup.get_text().strip()
@@ -900,27 +1186,21 @@ def extract_gospel_acclamation(html_content: str) -> Dict[str, str]:
         return {"citation": "", "verse": ""}
 
 
-def extract_gospel_citation(html_content: str) -> str:
+def extract_gospel_citation(html_content: Union[str, ParsedPage]) -> str:
     try:
-        from bs4 import BeautifulSoup  # type: ignore
-        soup = BeautifulSoup(html_content, 'html.parser')
-        title_span = soup.find('span', class_='titolo', string=re.compile(r'^Gospel$', re.IGNORECASE))
-        if not title_span:
+        citation = ParsedPage.of(html_content).titled_citation(r'^Gospel$')
+        if citation is None:
             print("  WARNING: Could not find Gospel section")
             return ""
-        title_p = title_span.find_parent('p')
-        citation_span = title_p.find('span', class_='citazione')
-        citation = citation_span.get_text().strip() if citation_span else ""
         return citation
     except Exception as e:
         print(f"  WARNING: Error extracting gospel citation: {e}")
         return ""
 
 
-def extract_gospel_verses(html_content: str) -> Dict[str, str]:
+def extract_gospel_verses(html_content: Union[str, ParsedPage]) -> Dict[str, str]:
     try:
-        from bs4 import BeautifulSoup  # type: ignore
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = ParsedPage.of(html_content).soup
         title_span = soup.find('span', class_='titolo', string=re.compile(r'^Gospel$', re.IGNORECASE))
         if not title_span:
             print("  WARNING: Could not find Gospel section")
@@ -945,7 +1225,7 @@ def extract_gospel_verses(html_content: str) -> Dict[str, str]:
             gospel_text_html = gospel_html[:gospel_end_match.start()]
         else:
             gospel_text_html = gospel_html
-        gospel_soup = BeautifulSoup(gospel_text_html, 'html.parser')
+        gospel_soup = _bs4(gospel_text_html)
         for rubrica in gospel_soup.find_all('span', class_='rubrica'):
             rubrica.decompose()
         for br in gospel_soup.find_all('br'):
@@ -987,18 +1267,23 @@ def extract_gospel_verses(html_content: str) -> Dict[str, str]:
 
 def extract_intercessions_html(soup, text: str) -> List[Dict[str, Any]]:
     try:
-        html_content = str(soup)
-        intercessions_matches = list(re.finditer(r'INTERCESSIONS', html_content, re.IGNORECASE))
+        sections = soup.html_sections if isinstance(soup, ParsedPage) else SectionIndex(str(soup))
+        html_content = sections.text
+        intercessions_matches = sections.find_all("intercessions")
         if not intercessions_matches:
             print("  WARNING: No INTERCESSIONS marker found")
             return []
-        intercessions_pos = intercessions_matches[-1].start()
-        html_from_intercessions = html_content[intercessions_pos:]
-        end_match = re.search(r"THE LORD.S PRAYER|Let us pray\.", html_from_intercessions, re.IGNORECASE)
-        if end_match:
-            intercessions_section = html_from_intercessions[: end_match.start()]
+        intercessions_pos = intercessions_matches[-1][0]
+        end_matches = [
+            span for span in (
+                sections.find("lords_prayer", intercessions_pos),
+                sections.find("let_us_pray", intercessions_pos, refine=_LET_US_PRAY_STOP),
+            ) if span
+        ]
+        if end_matches:
+            intercessions_section = html_content[intercessions_pos:min(end_matches)[0]]
         else:
-            intercessions_section = html_from_intercessions[:3000]
+            intercessions_section = html_content[intercessions_pos:intercessions_pos + 3000]
         print(f"  Found INTERCESSIONS section ({len(intercessions_section)} chars)")
         intercessions_groups: List[Dict[str, Any]] = []
         category_pattern = r'\[(Martyrs|Pastors|Doctors|Virgins|Holy Men and Women)\]'
@@ -1088,21 +1373,17 @@ def extract_intercessions_html(soup, text: str) -> List[Dict[str, Any]]:
 
 # ---- Concluding Prayer ----
 
-def extract_concluding_prayer(text: str) -> str:
+def extract_concluding_prayer(text: Union[str, SectionIndex]) -> str:
     try:
-        prayer_match = re.search(r'CONCLUDING\s+PRAYER', text, re.IGNORECASE)
+        sections = SectionIndex.of(text)
+        prayer_match = sections.find("concluding_prayer")
         if not prayer_match:
             print("  WARNING: No CONCLUDING PRAYER marker found")
             return ""
-        prayer_start = prayer_match.end()
-        stop_patterns = [r'\bOr:', r'SACRED\s+HEART', r'MASS\s+READINGS', r'FIRST\s+READING']
-        prayer_end = len(text)
-        for pattern in stop_patterns:
-            stop_match = re.search(pattern, text[prayer_start:], re.IGNORECASE)
-            if stop_match:
-                prayer_end = prayer_start + stop_match.start()
-                break
-        prayer_section = text[prayer_start:prayer_end].strip()
+        prayer_start = prayer_match[1]
+        stop_match = sections.first_of(["or", "sacred_heart", "mass_readings", "first_reading"], prayer_start)
+        prayer_end = stop_match[0] if stop_match else sections.hi
+        prayer_section = sections.text[prayer_start:prayer_end].strip()
         amen_match = re.search(r'—\s*Amen\.?', prayer_section, re.IGNORECASE)
         if amen_match:
             prayer_section = prayer_section[:amen_match.end()].strip()
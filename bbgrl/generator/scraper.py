@@ -1,207 +1,352 @@
 from __future__ import annotations
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.select import Select
-from selenium.common.exceptions import WebDriverException, TimeoutException
 import time
 import requests
-from typing import Optional
+from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Optional
+
+from .cache import HtmlCache
+from .driver_pool import WebDriverPool, get_default_pool
+
+if TYPE_CHECKING:
+    # Selenium is only imported when the fallback runs; it is slow to import
+    from selenium import webdriver
+    from selenium.webdriver.support.ui import WebDriverWait
+
+
+HTTP_TIMEOUT = 15
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Page kinds served by the mobile site, with the marker each page must contain
+# before we trust it (the site silently serves today's content on failures).
+PAGE_PATHS = {
+    "morning_prayer": "breviario.php?s=lodi",
+    "readings": "letture.php?s=letture",
+}
+PAGE_MARKERS = {
+    "morning_prayer": ("PSALMODY",),
+    "readings": ("Gospel",),
+}
 
 
 class IBreviaryScraper:
-    """Thin Selenium wrapper for iBreviary navigation.
+    """Navigation wrapper for iBreviary.
 
-    This class owns the WebDriver lifecycle. Navigation routines can be
-    added here over time to fully extract scraping concerns out of the
-    main generator.
+    The primary path is plain HTTP: the date form on ``opzioni.php`` is
+    replayed on a ``requests`` session and the target pages are fetched with
+    the same session cookies. Selenium is kept as an opt-in fallback for when
+    the HTTP result fails validation; drivers for it are checked out of the
+    process-wide :class:`WebDriverPool` and returned warm after each job.
+    Validated pages are kept in an optional :class:`HtmlCache`.
     """
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, selenium_fallback: bool = False,
+                 pool: Optional[WebDriverPool] = None,
+                 cache: Optional[HtmlCache] = None, refresh: bool = False):
         self.base_url = base_url
-        self.driver: webdriver.Chrome | None = None
+        self.selenium_fallback = selenium_fallback
+        self._pool = pool
+        # Dated pages are served from ``cache`` unless ``refresh`` is set;
+        # fresh fetches that pass validation are always written back.
+        self.cache = cache
+        self.refresh = refresh
+        # One HTTP session per page kind, so pages can be fetched concurrently;
+        # each entry is (date set on the server, session).
+        self._http_sessions: dict = {}
+
+    @property
+    def pool(self) -> WebDriverPool:
+        # Resolved lazily so HTTP-only runs never touch the browser pool
+        if self._pool is None:
+            self._pool = get_default_pool()
+        return self._pool
 
-    def init_driver(self, force_reinit: bool = False) -> webdriver.Chrome:
-        """Initialize (or reinitialize) a headless Chrome WebDriver and return it.
+    # ----------------- HTTP navigation -----------------
 
-        Adds stability flags and retries for environments where the driver
-        may crash intermittently (observed stacktrace with Chrome headless).
+    def _http_session_for(self, target_date, page: str) -> requests.Session:
+        """Return ``page``'s session with its iBreviary date set to ``target_date``.
+
+        Replays the ``opzioni.php`` form the 'More' menu shows: every field is
+        submitted with its current value except ``giorno``/``mese``/``anno``.
         """
-        if self.driver is not None and not force_reinit:
-            return self.driver
+        current = self._http_sessions.get(page)
+        if current is not None and current[0] == target_date.date():
+            return current[1]
 
-        if self.driver is not None and force_reinit:
-            try:
-                self.driver.quit()
-            except Exception:
-                pass
-            self.driver = None
-
-        chrome_options = Options()
-        # Use the new headless mode explicitly; some versions need --headless=new
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--log-level=3")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])  # reduce noise
-        # Performance: block images/fonts to reduce load variation
-        prefs = {"profile.managed_default_content_settings.images": 2,
-                 "profile.managed_default_content_settings.stylesheets": 1,
-                 "profile.managed_default_content_settings.cookies": 1}
-        chrome_options.add_experimental_option("prefs", prefs)
+        session = requests.Session()
+        session.headers.update(HTTP_HEADERS)
+        options_url = f"{self.base_url}opzioni.php"
+        resp = session.get(options_url, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+
+        soup = BeautifulSoup(resp.text, "html.parser")
+        day_input = soup.find(attrs={"name": "giorno"})
+        form = day_input.find_parent("form") if day_input else None
+        if form is None:
+            raise RuntimeError("Date form not found on opzioni.php")
+
+        fields = {}
+        for inp in form.find_all("input"):
+            name = inp.get("name")
+            input_type = inp.get("type", "text").lower()
+            if not name or input_type in ("submit", "button", "image", "reset"):
+                continue
+            if input_type in ("checkbox", "radio") and not inp.has_attr("checked"):
+                continue
+            fields[name] = inp.get("value", "")
+        for sel in form.find_all("select"):
+            name = sel.get("name")
+            if not name:
+                continue
+            chosen = sel.find("option", selected=True) or sel.find("option")
+            fields[name] = chosen.get("value", chosen.get_text(strip=True)) if chosen else ""
+
+        # Month is a dropdown; Selenium selected it by index, so do the same
+        month_options = form.find(attrs={"name": "mese"}).find_all("option")
+        if len(month_options) < target_date.month:
+            raise RuntimeError("Unexpected month dropdown on opzioni.php")
+        month_opt = month_options[target_date.month - 1]
+        fields["giorno"] = str(target_date.day)
+        fields["mese"] = month_opt.get("value", month_opt.get_text(strip=True))
+        fields["anno"] = str(target_date.year)
+        ok_button = form.find(attrs={"name": "ok"})
+        if ok_button is not None:
+            fields["ok"] = ok_button.get("value", "ok")
 
+        action = requests.compat.urljoin(options_url, form.get("action") or "opzioni.php")
+        if (form.get("method") or "get").lower() == "post":
+            resp = session.post(action, data=fields, timeout=HTTP_TIMEOUT)
+        else:
+            resp = session.get(action, params=fields, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+
+        self._http_sessions[page] = (target_date.date(), session)
+        return session
+
+    def reset_http_session(self, page: Optional[str] = None) -> None:
+        """Forget dated HTTP sessions (all, or ``page``'s) so the date is set again."""
+        if page is None:
+            self._http_sessions = {}
+        else:
+            self._http_sessions.pop(page, None)
+
+    def fetch_page_http(self, target_date, page: str) -> Optional[str]:
+        """Fetch ``page`` ("morning_prayer" or "readings") for a date over HTTP.
+
+        Returns the HTML only when it passes validation, otherwise None.
+        """
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-        except WebDriverException as e:
-            raise RuntimeError(f"Failed to initialize ChromeDriver: {e}")
-        return self.driver
-
-    def quit(self) -> None:
-        """Dispose the driver if present."""
-        if self.driver:
-            try:
-                self.driver.quit()
-            finally:
-                self.driver = None
+            session = self._http_session_for(target_date, page)
+            resp = session.get(f"{self.base_url}{PAGE_PATHS[page]}", timeout=HTTP_TIMEOUT)
+        except Exception as e:
+            print(f"  WARNING: HTTP navigation failed for {page}: {e}")
+            self.reset_http_session(page)
+            return None
+        html = resp.text
+        if resp.status_code != 200 or not self._is_valid_page(html, page):
+            print(f"  WARNING: HTTP {page} page failed validation (status {resp.status_code}, length {len(html)})")
+            return None
+        return html
 
-    def navigate_morning_prayer_html(self, target_date) -> Optional[str]:
-        """Navigate to Morning Prayer for a given date and return page HTML.
+    @staticmethod
+    def _is_valid_page(html: str, page: str) -> bool:
+        if not html or len(html) <= 5000:
+            return False
+        upper = html.upper()
+        return all(marker.upper() in upper for marker in PAGE_MARKERS[page])
+
+    def _cached(self, target_date, page: str, refresh: bool = False) -> Optional[str]:
+        if self.cache is None or self.refresh or refresh or target_date is None:
+            return None
+        html = self.cache.get(target_date, page)
+        if html and self._is_valid_page(html, page):
+            print(f"  ✓ Using cached {page} page for {target_date.strftime('%B %d, %Y')}")
+            return html
+        return None
+
+    def _store(self, target_date, page: str, html: Optional[str]) -> Optional[str]:
+        if html and self.cache is not None and target_date is not None and self._is_valid_page(html, page):
+            self.cache.put(target_date, page, html)
+        return html
+
+    # ----------------- page navigation -----------------
+
+    def navigate_morning_prayer_html(self, target_date, refresh: bool = False) -> Optional[str]:
+        """Return Morning Prayer HTML for a given date.
 
         Strategy:
-        1. Attempt Selenium navigation with up to 2 retries (driver re-init on crash).
-        2. If Selenium repeatedly fails, attempt a lightweight requests fallback
-           (will return current day content if date switching unsupported without UI).
+        1. Replay the date form over HTTP and fetch the page (no browser).
+        2. If that fails validation and Selenium fallback is enabled, drive
+           Chrome with up to 2 retries (driver re-init on crash).
+        3. As a last resort, fetch the page without setting a date
+           (will return current day content).
+
+        Pages for the date already in the cache skip all of the above
+        unless ``refresh`` is set.
+        """
+        html = self._cached(target_date, "morning_prayer", refresh)
+        if html:
+            return html
+        print(f"  -> Fetching Morning Prayer for {target_date.strftime('%d/%m/%Y')} over HTTP...")
+        html = self.fetch_page_http(target_date, "morning_prayer")
+        if html:
+            print(f"  Successfully fetched Morning Prayer for {target_date.strftime('%B %d, %Y')}")
+            return self._store(target_date, "morning_prayer", html)
+        if self.selenium_fallback:
+            html = self._selenium_page_html(target_date, "morning_prayer")
+            if html:
+                return self._store(target_date, "morning_prayer", html)
+        return self._undated_fallback_html("morning_prayer")
+
+    def navigate_readings_html(self, target_date=None) -> Optional[str]:
+        """Return Readings page HTML.
+
+        Navigates directly to the Readings page for ``target_date`` on its own
+        HTTP session (or its own browser when falling back to Selenium), so it
+        does not depend on Morning Prayer having been fetched first and the
+        two pages can be fetched concurrently.
+        """
+        html = self._cached(target_date, "readings")
+        if html:
+            return html
+        if target_date is not None:
+            print("  -> Fetching Readings over HTTP...")
+            html = self.fetch_page_http(target_date, "readings")
+            if html:
+                print("  Successfully fetched Readings page")
+                return self._store(target_date, "readings", html)
+        if self.selenium_fallback:
+            html = self._selenium_page_html(target_date, "readings")
+            if html:
+                return self._store(target_date, "readings", html)
+        return self._undated_fallback_html("readings")
+
+    # ----------------- Selenium fallback -----------------
+
+    def _selenium_page_html(self, target_date, page: str) -> Optional[str]:
+        """Navigate a pooled browser to ``page`` for a date and return its HTML.
+
+        Up to 2 attempts; a driver that errors is returned to the pool as
+        broken so the retry gets a fresh browser.
         """
-        attempt = 0
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        label = "Morning Prayer" if page == "morning_prayer" else "Readings"
         last_error: Optional[str] = None
-        while attempt < 2:
+        for attempt in range(2):
             try:
-                driver = self.init_driver(force_reinit=(attempt > 0))
-                wait = WebDriverWait(driver, 15)
-                print(f"  -> [Attempt {attempt+1}] Navigating to iBreviary mobile site...")
-                driver.get(self.base_url)
-                # Try to dismiss any cookie/consent banners if present
-                self._attempt_consent_dismiss(driver)
-
-                # Open 'More' to set date
-                more_link = self._robust_find_any(wait, [
-                    (By.LINK_TEXT, "More"),
-                    (By.PARTIAL_LINK_TEXT, "More"),
-                    (By.XPATH, "//a[contains(@href, 'opzioni.php')]")
-                ], description="'More' menu")
-                if not more_link:
-                    raise RuntimeError("Could not locate 'More' navigation link")
-                more_link.click()
-
-                # Date inputs
-                print(f"  -> Setting date to {target_date.strftime('%d/%m/%Y')}...")
-                day_field = wait.until(EC.presence_of_element_located((By.NAME, "giorno")))
-                month_dropdown_el = wait.until(EC.presence_of_element_located((By.NAME, "mese")))
-                year_field = wait.until(EC.presence_of_element_located((By.NAME, "anno")))
-                day_field.clear(); day_field.send_keys(str(target_date.day))
-                Select(month_dropdown_el).select_by_index(target_date.month - 1)
-                year_field.clear(); year_field.send_keys(str(target_date.year))
-                ok_button = wait.until(EC.element_to_be_clickable((By.NAME, "ok")))
-                ok_button.click()
-
-                # Breviary link
-                breviary_link = self._robust_find_any(wait, [
-                    (By.LINK_TEXT, "Breviary"),
-                    (By.PARTIAL_LINK_TEXT, "Breviary"),
-                    (By.XPATH, "//a[contains(@href,'breviario.php')]")
-                ], description="'Breviary' link")
-                if not breviary_link:
-                    raise RuntimeError("Could not locate 'Breviary' link after date set")
-                breviary_link.click()
-
-                # Morning Prayer link variants
-                morning_prayer_link = self._robust_find_any(wait, [
-                    (By.PARTIAL_LINK_TEXT, "Morning Prayer"),
-                    (By.PARTIAL_LINK_TEXT, "Lauds"),
-                    (By.PARTIAL_LINK_TEXT, "Lodi"),
-                ], description="Morning Prayer/Lauds/Lodi link")
-                if not morning_prayer_link:
-                    raise RuntimeError("Could not locate Morning Prayer link")
-                morning_prayer_link.click()
-
-                html = driver.page_source
-                print(f"  Successfully navigated to Morning Prayer for {target_date.strftime('%B %d, %Y')}")
+                with self.pool.driver() as driver:
+                    wait = WebDriverWait(driver, 15)
+                    print(f"  -> [Attempt {attempt+1}] Navigating to {label} with Selenium...")
+                    driver.get(self.base_url)
+                    # Try to dismiss any cookie/consent banners if present
+                    self._attempt_consent_dismiss(driver)
+                    if target_date is not None:
+                        self._selenium_set_date(wait, target_date)
+                    if page == "morning_prayer":
+                        self._selenium_open_morning_prayer(wait)
+                    else:
+                        self._selenium_open_readings(wait)
+                    html = driver.page_source
+                print(f"  Successfully navigated to {label}")
                 return html
             except Exception as e:
                 last_error = str(e)
                 print(f"  Error during Selenium navigation attempt {attempt+1}: {e}")
-                attempt += 1
         print(f"  WARNING: Selenium navigation failed after retries: {last_error}")
-        # Fallback: try direct request (may not reflect requested past date)
-        try:
-            fallback_url = f"{self.base_url}breviario.php?s=lodi"
-            resp = requests.get(fallback_url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
-            if resp.status_code == 200 and len(resp.text) > 5000:
-                print("  ✓ Using requests fallback for Morning Prayer (date control may be inaccurate).")
-                return resp.text
-            else:
-                print(f"  WARNING: Fallback HTTP fetch unsuccessful (status {resp.status_code}, length {len(resp.text)})")
-        except Exception as e:
-            print(f"  WARNING: Fallback requests fetch failed: {e}")
         return None
 
-    def navigate_readings_html(self) -> Optional[str]:
-        """Navigate from current context to Readings page and return page HTML.
+    def _selenium_set_date(self, wait: WebDriverWait, target_date) -> None:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.select import Select
 
-        Includes retry and direct HTTP fallback similar to Morning Prayer.
-        """
-        attempt = 0
-        last_error: Optional[str] = None
-        while attempt < 2:
-            try:
-                driver = self.init_driver(force_reinit=(attempt > 0))
-                wait = WebDriverWait(driver, 15)
-                print(f"  -> [Attempt {attempt+1}] Navigating to readings (tab + link)...")
-                reading_tab = self._robust_find_any(wait, [
-                    (By.LINK_TEXT, "Reading"),
-                    (By.PARTIAL_LINK_TEXT, "Reading"),
-                    (By.XPATH, "//a[contains(@href, 'letture.php')]")
-                ], description="Reading tab")
-                if not reading_tab:
-                    raise RuntimeError("Could not locate Reading tab")
-                reading_tab.click()
-                readings_link = self._robust_find_any(wait, [
-                    (By.PARTIAL_LINK_TEXT, "Readings"),
-                    (By.PARTIAL_LINK_TEXT, "Letture"),
-                    (By.PARTIAL_LINK_TEXT, "readings"),
-                ], description="Readings link")
-                if not readings_link:
-                    raise RuntimeError("Could not locate Readings link")
-                readings_link.click()
-                html = driver.page_source
-                print("  Successfully navigated to Readings page")
-                return html
-            except Exception as e:
-                last_error = str(e)
-                print(f"  Error navigating to Readings attempt {attempt+1}: {e}")
-                attempt += 1
-        print(f"  WARNING: Selenium readings navigation failed after retries: {last_error}")
+        # Open 'More' to set date
+        more_link = self._robust_find_any(wait, [
+            (By.LINK_TEXT, "More"),
+            (By.PARTIAL_LINK_TEXT, "More"),
+            (By.XPATH, "//a[contains(@href, 'opzioni.php')]")
+        ], description="'More' menu")
+        if not more_link:
+            raise RuntimeError("Could not locate 'More' navigation link")
+        more_link.click()
+
+        # Date inputs
+        print(f"  -> Setting date to {target_date.strftime('%d/%m/%Y')}...")
+        day_field = wait.until(EC.presence_of_element_located((By.NAME, "giorno")))
+        month_dropdown_el = wait.until(EC.presence_of_element_located((By.NAME, "mese")))
+        year_field = wait.until(EC.presence_of_element_located((By.NAME, "anno")))
+        day_field.clear(); day_field.send_keys(str(target_date.day))
+        Select(month_dropdown_el).select_by_index(target_date.month - 1)
+        year_field.clear(); year_field.send_keys(str(target_date.year))
+        ok_button = wait.until(EC.element_to_be_clickable((By.NAME, "ok")))
+        ok_button.click()
+
+    def _selenium_open_morning_prayer(self, wait: WebDriverWait) -> None:
+        from selenium.webdriver.common.by import By
+
+        # Breviary link
+        breviary_link = self._robust_find_any(wait, [
+            (By.LINK_TEXT, "Breviary"),
+            (By.PARTIAL_LINK_TEXT, "Breviary"),
+            (By.XPATH, "//a[contains(@href,'breviario.php')]")
+        ], description="'Breviary' link")
+        if not breviary_link:
+            raise RuntimeError("Could not locate 'Breviary' link after date set")
+        breviary_link.click()
+
+        # Morning Prayer link variants
+        morning_prayer_link = self._robust_find_any(wait, [
+            (By.PARTIAL_LINK_TEXT, "Morning Prayer"),
+            (By.PARTIAL_LINK_TEXT, "Lauds"),
+            (By.PARTIAL_LINK_TEXT, "Lodi"),
+        ], description="Morning Prayer/Lauds/Lodi link")
+        if not morning_prayer_link:
+            raise RuntimeError("Could not locate Morning Prayer link")
+        morning_prayer_link.click()
+
+    def _selenium_open_readings(self, wait: WebDriverWait) -> None:
+        from selenium.webdriver.common.by import By
+
+        reading_tab = self._robust_find_any(wait, [
+            (By.LINK_TEXT, "Reading"),
+            (By.PARTIAL_LINK_TEXT, "Reading"),
+            (By.XPATH, "//a[contains(@href, 'letture.php')]")
+        ], description="Reading tab")
+        if not reading_tab:
+            raise RuntimeError("Could not locate Reading tab")
+        reading_tab.click()
+        readings_link = self._robust_find_any(wait, [
+            (By.PARTIAL_LINK_TEXT, "Readings"),
+            (By.PARTIAL_LINK_TEXT, "Letture"),
+            (By.PARTIAL_LINK_TEXT, "readings"),
+        ], description="Readings link")
+        if not readings_link:
+            raise RuntimeError("Could not locate Readings link")
+        readings_link.click()
+
+    def _undated_fallback_html(self, page: str) -> Optional[str]:
+        """Fetch a page without setting a date (may not reflect requested date)."""
         try:
-            fallback_url = f"{self.base_url}letture.php?s=letture"
-            resp = requests.get(fallback_url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
+            fallback_url = f"{self.base_url}{PAGE_PATHS[page]}"
+            resp = requests.get(fallback_url, timeout=HTTP_TIMEOUT, headers={"User-Agent": "Mozilla/5.0"})
             if resp.status_code == 200 and len(resp.text) > 5000:
-                print("  ✓ Using requests fallback for Readings page.")
+                print(f"  ✓ Using undated requests fallback for {page} (date control may be inaccurate).")
                 return resp.text
             else:
-                print(f"  WARNING: Fallback Readings HTTP fetch unsuccessful (status {resp.status_code})")
+                print(f"  WARNING: Fallback HTTP fetch unsuccessful (status {resp.status_code}, length {len(resp.text)})")
         except Exception as e:
-            print(f"  WARNING: Fallback readings requests fetch failed: {e}")
+            print(f"  WARNING: Fallback requests fetch failed: {e}")
         return None
 
     # ----------------- helper utilities -----------------
 
     def _robust_find_any(self, wait: WebDriverWait, locator_variants, description: str):
         """Try a list of locator variants, return the first element found or None."""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+
         for by, value in locator_variants:
             try:
                 elem = wait.until(EC.element_to_be_clickable((by, value)))
@@ -215,6 +360,8 @@ class IBreviaryScraper:
 
     def _attempt_consent_dismiss(self, driver: webdriver.Chrome):
         """Attempt to dismiss cookie/consent modals that can block clicks."""
+        from selenium.webdriver.common.by import By
+
         try:
             # Common button texts in multiple languages
             for txt in ["Accept", "Accetta", "OK", "Chiudi", "Close"]:
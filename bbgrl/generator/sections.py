@@ -0,0 +1,603 @@
+"""Slide specs for the date-dependent sections of the deck.
+
+Each builder takes ``liturgical_data`` (plus the reference template, for
+section titles and shared colours) and returns the section's slides as a
+list of :class:`~bbgrl.generator.specs.SlideSpec`; nothing here touches
+python-pptx. The generator renders them with ``specs.render_slides``.
+"""
+
+from __future__ import annotations
+import re
+from typing import Any, Dict, List, Optional
+
+from pptx.util import Inches
+
+from .specs import FontSpec, ParagraphSpec, RunSpec, SlideSpec, TextBoxSpec, text_paragraphs, text_runs
+
+GEORGIA = "Georgia"
+
+RED = "980000"
+BLUE = "0000FF"
+BLACK = "000000"
+NAVY = "003366"
+DARK_BLUE = "00008B"
+
+GLORY_BE = (
+    "Glory to the Father, and to the Son, and to the Holy Spirit: as it was in the beginning, is now, and will be for ever. Amen."
+)
+
+BENEDICTUS_VERSES = [
+    "Blessed + be the Lord, the God of Israel; *\nhe has come to his people and set them free.",
+    "He has raised up for us a mighty savior,*\nborn of the house of his servant David.",
+    "Through his holy prophets he promised of old †\nthat he would save us from our enemies, *\nfrom the hands of all who hate us.",
+    "He promised to show mercy to our fathers *\nand to remember his holy covenant.",
+    "This was the oath he swore to our father Abraham: *\nto set us free from the hands of our enemies,\nfree to worship him without fear, *\nholy and righteous in his sight\n  all the days of our life.",
+    "You, my child, shall be called the prophet of the Most High; *\nfor you will go before the Lord to prepare his way,\nto give his people knowledge of salvation *\nby the forgiveness of their sins.",
+    "In the tender compassion of our God *\nthe dawn from on high shall break upon us,\nto shine on those who dwell in darkness and the shadow of death, *\nand to guide our feet into the way of peace.",
+    "Glory to the Father, and to the Son, *\nand to the Holy Spirit:",
+    "as it was in the beginning, is now, *\nand will be forever. Amen.",
+]
+
+ALLELUIA = "℟. Alleluia, alleluia."
+
+
+def georgia(size: float, color: Optional[str] = BLACK, bold: Optional[bool] = True,
+            italic: Optional[bool] = None) -> FontSpec:
+    return FontSpec(name=GEORGIA, size=size, bold=bold, italic=italic, color=color)
+
+
+def _box(left, top, width, height, paragraphs, word_wrap=True, auto_size="text_to_fit_shape", **kwargs) -> TextBoxSpec:
+    return TextBoxSpec(Inches(left), Inches(top), Inches(width), Inches(height), tuple(paragraphs),
+                       word_wrap=word_wrap, auto_size=auto_size, **kwargs)
+
+
+def _title_text(template: Dict[str, Any], section: str, default: str) -> str:
+    title = template.get("section_templates", {}).get(section, {}).get("title_slide", {})
+    return title.get("text", default)
+
+
+def _title_color(template: Dict[str, Any]) -> str:
+    color = template.get("formatting_rules", {}).get("title_color")
+    return str(color) if color is not None else NAVY
+
+
+def _frame_paragraphs(text: str, alignment: str, font: FontSpec) -> List[ParagraphSpec]:
+    """``text_frame.text = text`` with only the first paragraph formatted."""
+    first, *rest = text.split("\n")
+    return [ParagraphSpec(runs=text_runs(first), alignment=alignment, font=font)] + [
+        ParagraphSpec(runs=text_runs(line)) for line in rest
+    ]
+
+
+def _is_glory_be(text: str) -> bool:
+    return "Glory to the Father" in text or "Glory to the father" in text
+
+
+# ----------------- morning prayer -----------------
+
+def _antiphon_slide(label: str, text: str, slide_label: str, size: float = 44) -> SlideSpec:
+    para = ParagraphSpec(
+        runs=(RunSpec(label, georgia(size, BLUE)), RunSpec(text, georgia(size))),
+        alignment="center",
+    )
+    return SlideSpec((_box(0.5, 1, 12.33, 5.5, [para]),), slide_label)
+
+
+def _verse_slide(verse: Dict[str, Any], name: str, glory: bool = True) -> SlideSpec:
+    """Priest/People verse slide (or a Glory Be when ``glory`` is set)."""
+    text = verse["text"]
+    if glory and _is_glory_be(text):
+        runs = (RunSpec(text, georgia(44)),)
+        label = f"{name} - Glory Be"
+    elif verse["speaker"] == "Priest":
+        runs = (RunSpec(f"Priest: {text}", georgia(44, RED)),)
+        label = f"{name} - {verse['speaker']}"
+    elif verse["speaker"] == "People":
+        runs = (RunSpec("People: ", georgia(44, BLUE)), RunSpec(text, georgia(44)))
+        label = f"{name} - {verse['speaker']}"
+    else:
+        runs, label = (), ""
+    para = ParagraphSpec(runs=runs, alignment="left")
+    return SlideSpec((_box(0.5, 1, 12.33, 5.5, [para]),), label)
+
+
+def _glory_be_slide(name: str) -> SlideSpec:
+    para = ParagraphSpec(runs=(RunSpec(GLORY_BE, georgia(44)),), alignment="left")
+    return SlideSpec((_box(0.5, 1, 12.33, 5.5, [para]),), f"{name} - Glory Be")
+
+
+def opening_slides(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    """PSALMODY title with the first antiphon and psalm heading."""
+    antiphon_1 = liturgical_data["morning_prayer"]["psalmody"]["antiphon_1"]
+    title = _box(0.3, 0.1, 12.7, 1.2, _frame_paragraphs(_title_text(template, "psalmody_section", "PSALMODY"),
+                                                        "center", georgia(80, RED)),
+                 word_wrap=None, auto_size=None)
+    antiphon = _box(0.3, 1.5, 12.7, 3.5, [ParagraphSpec(
+        runs=(RunSpec("(All) Ant. 1 ", georgia(52, BLUE)), RunSpec(antiphon_1["text"], georgia(52))),
+        alignment="center",
+    )])
+    psalm_title = antiphon_1.get("psalm_title", "")
+    psalm_subtitle = antiphon_1.get("psalm_subtitle", "")
+    heading = [ParagraphSpec()]
+    if psalm_title or psalm_subtitle:
+        heading = _frame_paragraphs(psalm_title or psalm_subtitle, "left", georgia(44, RED))
+        if psalm_title and psalm_subtitle:
+            heading.append(ParagraphSpec(runs=text_runs(psalm_subtitle), alignment="left", font=georgia(44, RED)))
+    psalm = _box(0.3, 5.3, 12.7, 2.0, heading)
+    return [SlideSpec((title, antiphon, psalm), "PSALMODY title slide")]
+
+
+def psalmody_section(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    psalmody = liturgical_data["morning_prayer"]["psalmody"]
+    antiphon_1 = psalmody["antiphon_1"]
+    antiphon_2 = psalmody["antiphon_2"]
+    antiphon_3 = psalmody["antiphon_3"]
+    slides = [_verse_slide(verse, "Psalm 1") for verse in psalmody["psalm_1"]]
+    slides.append(_antiphon_slide("(All) Ant. 1 ", antiphon_1["text"], "Repeated Antiphon 1"))
+    slides.append(_antiphon_slide("Ant. 2 ", antiphon_2["text"], "Antiphon 2"))
+
+    canticle_info = psalmody["canticle_info"]
+    info = [ParagraphSpec(runs=(RunSpec(canticle_info["title"], georgia(44, RED)),), alignment="left")]
+    if canticle_info["subtitle"]:
+        info.append(ParagraphSpec(runs=(RunSpec(canticle_info["subtitle"], georgia(44, RED)),), alignment="left"))
+    slides.append(SlideSpec((_box(0.5, 2.5, 12.33, 3, info),), "Canticle info"))
+
+    canticle_data = psalmody["canticle"]
+    canticle_verses = canticle_data.get("verses", canticle_data) if isinstance(canticle_data, dict) else canticle_data
+    omit_glory_be = canticle_data.get("omit_glory_be", False) if isinstance(canticle_data, dict) else False
+    slides += [_verse_slide(verse, "Canticle") for verse in canticle_verses]
+    if not omit_glory_be:
+        slides.append(_glory_be_slide("Canticle"))
+    else:
+        print("  Skipping Glory Be slide (explicitly omitted for this canticle)")
+    slides.append(_antiphon_slide("(All) Ant. 2 ", antiphon_2["text"], "Repeated Antiphon 2"))
+    slides.append(_antiphon_slide("(All) Ant. 3 ", antiphon_3["text"], "Antiphon 3"))
+
+    if antiphon_3.get("psalm_title"):
+        runs = [RunSpec(antiphon_3["psalm_title"], georgia(48, RED))]
+        if antiphon_3.get("psalm_subtitle"):
+            runs.append(RunSpec("\n"))
+            runs.append(RunSpec(antiphon_3["psalm_subtitle"], georgia(36, RED, bold=None, italic=True)))
+        para = ParagraphSpec(runs=tuple(runs), alignment="center")
+        slides.append(SlideSpec((_box(0.5, 2, 12.33, 3.5, [para]),), "Psalm 3 Title and Subtitle"))
+
+    for verse in psalmody["psalm_3"]:
+        if _is_glory_be(verse["text"]):
+            print("  Skipping Glory Be verse from extraction (will add manually)")
+            continue
+        slides.append(_verse_slide(verse, "Psalm 3", glory=False))
+    slides.append(_glory_be_slide("Psalm 3"))
+    slides.append(_antiphon_slide("(All) Ant. 3 ", antiphon_3["text"], "Repeated Antiphon 3"))
+    return slides
+
+
+def reading_section(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    reading_data = liturgical_data.get("morning_prayer", {}).get("reading", {}).get("short_reading", {})
+    if not reading_data or not reading_data.get("text"):
+        print("  WARNING: No reading data available, skipping reading section")
+        return []
+    title_font = FontSpec(size=48, bold=True, color=_title_color(template))
+    title = _box(1, 0.5, 11.33, 1, text_paragraphs(_title_text(template, "reading_section", "READING"),
+                                                   title_font, "center"), auto_size=None)
+    content_text = ""
+    if reading_data.get("citation"):
+        content_text = f"{reading_data['citation']}\n\n"
+    content_text += reading_data["text"]
+    content = _box(0.5, 1.75, 12.33, 5, text_paragraphs(content_text, FontSpec(size=30, color=BLACK), "center"))
+    return [SlideSpec((title, content), "READING (title + content)")]
+
+
+def split_responsory_verse(text: str):
+    """(before, after) the em-dash response of a responsory verse."""
+    raw_lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
+    dash_idx = None
+    for i, ln in enumerate(raw_lines):
+        if ln.startswith("—") or ln.startswith("—"):
+            dash_idx = i
+            break
+    if dash_idx is not None:
+        before_seg = "\n".join(raw_lines[:dash_idx]).strip()
+        after_parts = [raw_lines[dash_idx].lstrip("—").lstrip("—").strip()] + raw_lines[dash_idx + 1:]
+        return before_seg, "\n".join(after_parts).strip()
+    # Fallback: split on the first em-dash in concatenated text
+    joined = " ".join(raw_lines)
+    parts = [p.strip() for p in joined.split("—")]
+    if len(parts) >= 2:
+        return parts[0], "—".join(parts[1:]).strip()
+    return joined, ""
+
+
+def responsory_section(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    """Responsory slides: red pre-dash text, black response, no speaker labels."""
+    verses = liturgical_data.get("morning_prayer", {}).get("reading", {}).get("responsory", [])
+    if not verses:
+        print("\tWARNING: No responsory data available, skipping responsory section")
+        return []
+    slides = []
+    for idx, verse in enumerate(verses):
+        before_seg, after_seg = split_responsory_verse(verse.get("text", ""))
+        boxes = []
+        content_top = 1
+        if verse.get("include_title"):
+            title_font = FontSpec(size=48, bold=True, color=_title_color(template))
+            boxes.append(_box(1, 0.5, 11.33, 1, [ParagraphSpec(runs=(RunSpec("RESPONSORY", title_font),), alignment="center")],
+                              word_wrap=None, auto_size=None))
+            content_top = 1.75
+        runs = []
+        if before_seg:
+            runs.append(RunSpec(before_seg, georgia(36, RED)))
+        if after_seg:
+            runs.append(RunSpec("\n— " if "\n" in before_seg else " — ", georgia(36)))
+            runs.append(RunSpec(after_seg, georgia(36)))
+        boxes.append(_box(0.5, content_top, 12.33, 5.5, [ParagraphSpec(runs=tuple(runs), alignment="center")]))
+        slides.append(SlideSpec(tuple(boxes), f"Responsory (formatted with red/black, idx={idx + 1})"))
+    return slides
+
+
+def _clean_canticle_markers(text: str) -> str:
+    # Remove liturgical markers: crosses '+' and '†', and asterisks '*'
+    text = re.sub(r"\s*\+\s*", " ", text)
+    text = text.replace("†", "").replace("*", "")
+    return re.sub(r" {2,}", " ", text)
+
+
+def gospel_canticle_section(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    antiphon_text = liturgical_data["morning_prayer"]["gospel_canticle"].get("antiphon", "")
+    if not antiphon_text:
+        print("  WARNING: No gospel canticle antiphon found, skipping section")
+        return []
+    header = _box(0.5, 0.5, 12.33, 1, [ParagraphSpec(
+        runs=text_runs(_title_text(template, "gospel_canticle_section", "GOSPEL CANTICLE")),
+        alignment="center",
+        font=georgia(48, _title_color(template)),
+    )], auto_size=None)
+    antiphon = _box(0.5, 2, 12.33, 5, [ParagraphSpec(
+        runs=(RunSpec("Ant. ", georgia(44, RED)), RunSpec(antiphon_text, georgia(44))),
+        alignment="center",
+    )])
+    slides = [SlideSpec((header, antiphon), "GOSPEL CANTICLE (with header and antiphon)")]
+
+    title = [
+        ParagraphSpec(runs=text_runs(line), alignment="center", font=georgia(44, RED))
+        for line in ("Canticle of Zechariah", "Luke 1:68-79", "The Messiah and his forerunner")
+    ]
+    slides.append(SlideSpec((_box(0.5, 2.5, 12.33, 3, title, auto_size=None),), "Canticle of Zechariah (title)"))
+
+    for i, verse_text in enumerate(BENEDICTUS_VERSES):
+        is_red = i % 2 == 0
+        para = ParagraphSpec(
+            runs=text_runs(_clean_canticle_markers(verse_text)),
+            alignment="left",
+            font=georgia(44, RED if is_red else BLACK),
+        )
+        slides.append(SlideSpec((_box(0.5, 1, 12.33, 5.5, [para]),),
+                                f"Benedictus verse {i + 1} ({'red' if is_red else 'black'})"))
+
+    para = ParagraphSpec(runs=(RunSpec("Ant. ", georgia(44, BLUE)), RunSpec(antiphon_text, georgia(44))), alignment="center")
+    slides.append(SlideSpec((_box(0.5, 1, 12.33, 5.5, [para]),), "Repeated Gospel Canticle Antiphon"))
+    return slides
+
+
+def intercessions_section(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    groups = liturgical_data["morning_prayer"].get("intercessions", [])
+    if not groups:
+        print("  No intercessions data available")
+        return []
+    slides = []
+    for idx, group in enumerate(groups):
+        category = group.get("category")
+        introduction = group.get("introduction", "")
+        response_line = group.get("response_line", "")
+
+        boxes = []
+        if idx == 0:
+            title_run = RunSpec(_title_text(template, "intercessions_section", "INTERCESSIONS"), georgia(48, _title_color(template)))
+            boxes.append(_box(0.5, 0.5, 12.33, 1, [ParagraphSpec(runs=(title_run,), alignment="center")], auto_size=None))
+            label = "INTERCESSIONS (title)"
+        else:
+            label = f"Intercessions Introduction{' - ' + category if category else ''}"
+        runs = (RunSpec(introduction, georgia(30)),) if introduction else ()
+        boxes.append(_box(0.5, 2 if idx == 0 else 1, 12.33, 5.5, [ParagraphSpec(runs=runs, alignment="center")]))
+        slides.append(SlideSpec(tuple(boxes), label))
+
+        if response_line:
+            para = ParagraphSpec(
+                runs=(RunSpec("(All) ", georgia(44, BLUE)), RunSpec(response_line, georgia(44))),
+                alignment="center",
+            )
+            slides.append(SlideSpec((_box(0.5, 2.5, 12.33, 3, [para]),), "Intercessions Response"))
+        for intention in group.get("intentions", []):
+            para = ParagraphSpec(
+                runs=(
+                    RunSpec(intention["petition"], georgia(30, RED)),
+                    RunSpec("\n— ", georgia(30)),
+                    RunSpec(intention["response"], georgia(30)),
+                ),
+                alignment="center",
+            )
+            slides.append(SlideSpec((_box(0.5, 1, 12.33, 5.5, [para]),), "Intercession Intention"))
+    return slides
+
+
+def split_concluding_prayer(prayer: str):
+    """Split the concluding prayer in two, keeping the closing response together."""
+    lines = [line.strip() for line in prayer.split("\n") if line.strip()]
+    mid_point = len(lines) // 2
+    if len(lines) > 1:
+        for i, line in enumerate(lines):
+            if line.startswith("—") and "Amen" in line:
+                if i <= mid_point:
+                    mid_point = max(1, i - 1)
+                break
+    return "\n".join(lines[:mid_point]), "\n".join(lines[mid_point:])
+
+
+def concluding_prayer_slides(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    prayer = liturgical_data.get("morning_prayer", {}).get("concluding_prayer", "")
+    if not prayer:
+        print("  WARNING: No concluding prayer found, skipping slides")
+        return []
+    first_half, second_half = split_concluding_prayer(prayer)
+    if not first_half or not second_half:
+        print("  WARNING: Prayer text too short or improperly split, skipping")
+        return []
+    margins = (Inches(0.3), Inches(0.2), Inches(0.3), Inches(0.2))
+    first = [
+        ParagraphSpec(runs=(RunSpec("CONCLUDING PRAYER", georgia(36)),), alignment="center"),
+        ParagraphSpec(runs=(RunSpec(first_half, georgia(32)),), alignment="center", space_before=14),
+    ]
+    second = [ParagraphSpec(runs=(RunSpec(second_half, georgia(32)),), alignment="center")]
+    return [
+        SlideSpec((_box(0.5, 0.5, 12.33, 6.5, first, auto_size=None, margins=margins),), "Concluding Prayer (1/2)"),
+        SlideSpec((_box(0.5, 0.75, 12.33, 6, second, auto_size=None, margins=margins),), "Concluding Prayer (2/2)"),
+    ]
+
+
+# ----------------- mass readings -----------------
+
+def _reading_box(top, height, paragraphs, anchor) -> TextBoxSpec:
+    return _box(0.5, top, 12.33, height, paragraphs, auto_size=None, vertical_anchor=anchor)
+
+
+def _header_paragraph(text: str, size: float, color: str, bold: Optional[bool], space_after=None, italic=None) -> ParagraphSpec:
+    return ParagraphSpec(runs=text_runs(text), alignment="center", space_after=space_after,
+                         font=georgia(size, color, bold=bold, italic=italic))
+
+
+def first_reading_content_slide(lines: List[str], is_first: bool = False, citation: Optional[str] = None) -> SlideSpec:
+    paragraphs = []
+    if is_first:
+        paragraphs.append(ParagraphSpec(runs=(RunSpec("First Reading", georgia(48, DARK_BLUE)),),
+                                        alignment="center", space_after=16))
+        if citation:
+            paragraphs.append(ParagraphSpec(runs=(RunSpec(citation, georgia(36, bold=False)),),
+                                            alignment="center", space_after=20))
+    for i, line in enumerate(lines):
+        space_before = space_after = None
+        if i == 0:
+            space_after, space_before = 12, 0
+        elif (i == 1 and not is_first) or line.strip():
+            space_before = 8
+        else:
+            space_before = 16
+        paragraphs.append(ParagraphSpec(runs=(RunSpec(line, georgia(32, bold=None)),), alignment="center",
+                                        space_before=space_before, space_after=space_after))
+    label = f"First Reading {'(header + content)' if is_first else '(content)'} ({len(lines)} lines)"
+    return SlideSpec((_reading_box(0.5, 6.5, paragraphs or [ParagraphSpec()], "top"),), label)
+
+
+def first_reading_slides(citation: str, verses: List[str]) -> List[SlideSpec]:
+    """First reading: four lines under the header, then five per slide."""
+    slides = []
+    current: List[str] = []
+    is_first = True
+    for line in verses:
+        current.append(line)
+        if len(current) >= (4 if is_first else 5):
+            slides.append(first_reading_content_slide(current, is_first, citation if is_first else None))
+            current = []
+            is_first = False
+    if current:
+        slides.append(first_reading_content_slide(current, is_first, citation if is_first else None))
+    return slides
+
+
+def responsorial_psalm_header_slide(citation: str, response: str) -> SlideSpec:
+    paragraphs = [
+        _header_paragraph("Responsorial Psalm", 48, NAVY, True, space_after=16),
+        _header_paragraph(citation, 36, BLACK, False, space_after=24),
+        _header_paragraph(response, 40, BLACK, True),
+    ]
+    return SlideSpec((_reading_box(1.5, 6.0, paragraphs, "top"),), "Responsorial Psalm (header + citation + response)")
+
+
+def responsorial_psalm_response_slide(response: str) -> SlideSpec:
+    return SlideSpec((_reading_box(2.5, 4.0, [_header_paragraph(response, 40, BLACK, True)], "middle"),),
+                     "Responsorial Psalm (response)")
+
+
+def responsorial_psalm_verse_slide(verse_stanza: str) -> SlideSpec:
+    paragraphs = [_header_paragraph(line.strip(), 32, BLACK, None, space_after=8) for line in verse_stanza.split("\n")]
+    return SlideSpec((_reading_box(1.5, 6.0, paragraphs, "top"),), "Responsorial Psalm (verse)")
+
+
+def responsorial_psalm_slides(citation: str, verses: List[str]) -> List[SlideSpec]:
+    if not verses or len(verses) < 3:
+        return []
+    slides = [responsorial_psalm_header_slide(citation, verses[0])]
+    for line in verses[1:]:
+        if line == "":
+            continue
+        if line.startswith("℟."):
+            slides.append(responsorial_psalm_response_slide(line))
+        else:
+            slides.append(responsorial_psalm_verse_slide(line))
+    return slides
+
+
+def gospel_acclamation_header_slide(citation: str) -> SlideSpec:
+    paragraphs = [
+        _header_paragraph("Acclamation before the Gospel", 48, NAVY, True, space_after=16),
+        _header_paragraph(citation, 36, BLACK, False, space_after=24),
+        _header_paragraph(ALLELUIA, 40, BLACK, True),
+    ]
+    return SlideSpec((_reading_box(1.5, 6.0, paragraphs, "top"),), "Acclamation before the Gospel (header)")
+
+
+def gospel_acclamation_verse_slide(verse: str) -> SlideSpec:
+    paragraphs = [ParagraphSpec()]
+    for idx, line in enumerate(verse.split("\n")):
+        if not line.strip():
+            continue
+        para = _header_paragraph(line.strip(), 44, BLACK, None, space_after=8)
+        if idx == 0:
+            paragraphs[0] = para
+        else:
+            paragraphs.append(para)
+    paragraphs.append(ParagraphSpec(space_after=16))
+    paragraphs.append(_header_paragraph(ALLELUIA, 40, BLACK, True))
+    return SlideSpec((_reading_box(1.5, 6.0, paragraphs, "middle"),), "Acclamation before the Gospel (verse)")
+
+
+def chunk_gospel_text(text: str, max_chars: int = 300) -> List[str]:
+    """Split the gospel into slide-sized chunks, preferring paragraph breaks."""
+    chunks = []
+    current_chunk: List[str] = []
+    current_length = 0
+    for para in text.split("\n\n"):
+        para_length = len(para)
+        if para_length > max_chars:
+            if current_chunk:
+                chunks.append("\n\n".join(current_chunk))
+                current_chunk = []
+                current_length = 0
+            temp_chunk: List[str] = []
+            temp_length = 0
+            for line in para.split("\n"):
+                line_length = len(line)
+                if temp_length + line_length > max_chars and temp_chunk:
+                    chunks.append("\n".join(temp_chunk))
+                    temp_chunk = [line]
+                    temp_length = line_length
+                else:
+                    temp_chunk.append(line)
+                    temp_length += line_length + 1
+            if temp_chunk:
+                chunks.append("\n".join(temp_chunk))
+        elif current_length + para_length > max_chars and current_chunk:
+            chunks.append("\n\n".join(current_chunk))
+            current_chunk = [para]
+            current_length = para_length
+        else:
+            current_chunk.append(para)
+            current_length += para_length + 2
+    if current_chunk:
+        chunks.append("\n\n".join(current_chunk))
+    return chunks
+
+
+def gospel_header_slide(citation: str, intro_text: str, proclamation: str) -> SlideSpec:
+    paragraphs = [
+        _header_paragraph("Gospel", 48, NAVY, True, space_after=12),
+        _header_paragraph(citation, 36, BLACK, False, space_after=20),
+    ]
+    if intro_text:
+        paragraphs.append(_header_paragraph(intro_text, 32, BLACK, None, space_after=20, italic=True))
+    if proclamation:
+        paragraphs.append(_header_paragraph(proclamation, 32, BLACK, True))
+    return SlideSpec((_reading_box(1.0, 6.5, paragraphs, "top"),), "Gospel (header)")
+
+
+def gospel_text_slide(text_chunk: str) -> SlideSpec:
+    paragraphs = [ParagraphSpec()]
+    for idx, line in enumerate(text_chunk.split("\n")):
+        if not line.strip():
+            if idx > 0:
+                paragraphs.append(ParagraphSpec(space_after=8))
+            continue
+        para = _header_paragraph(line, 32, BLACK, None, space_after=6)
+        if idx == 0:
+            paragraphs[0] = para
+        else:
+            paragraphs.append(para)
+    return SlideSpec((_reading_box(1.0, 6.5, paragraphs, "top"),), "Gospel (text)")
+
+
+def gospel_closing_slide(closing: str, response: str) -> SlideSpec:
+    paragraphs = [
+        _header_paragraph(closing, 40, BLACK, True, space_after=24),
+        _header_paragraph("All reply:", 32, BLACK, None, space_after=24, italic=True),
+        _header_paragraph(response, 40, BLACK, True),
+    ]
+    return SlideSpec((_reading_box(2.0, 5.0, paragraphs, "middle"),), "Gospel (closing)")
+
+
+def gospel_slides(citation: str, gospel_content: Dict[str, Any]) -> List[SlideSpec]:
+    slides = [gospel_header_slide(citation, gospel_content.get("intro_text", ""), gospel_content.get("proclamation", ""))]
+    slides += [gospel_text_slide(chunk) for chunk in chunk_gospel_text(gospel_content.get("text", ""))]
+    slides.append(gospel_closing_slide(
+        gospel_content.get("closing", "The Gospel of the Lord."),
+        gospel_content.get("response", "Praise to you, Lord Jesus Christ."),
+    ))
+    return slides
+
+
+def mass_readings_section(liturgical_data: Dict[str, Any], template: Dict[str, Any]) -> List[SlideSpec]:
+    readings = liturgical_data.get("mass_readings", {})
+    slides: List[SlideSpec] = []
+    first_reading = readings.get("first_reading", {})
+    if first_reading.get("verses", []):
+        slides += first_reading_slides(first_reading.get("citation", ""), first_reading["verses"])
+    else:
+        print("  WARNING: No First Reading verses found")
+    psalm = readings.get("responsorial_psalm", {})
+    if psalm.get("verses", []):
+        slides += responsorial_psalm_slides(psalm.get("citation", ""), psalm["verses"])
+    else:
+        print("  WARNING: No Responsorial Psalm verses found")
+    acclamation = readings.get("gospel_acclamation", {})
+    if acclamation.get("citation", "") and acclamation.get("verse", ""):
+        slides += [gospel_acclamation_header_slide(acclamation["citation"]),
+                   gospel_acclamation_verse_slide(acclamation["verse"])]
+    else:
+        print("  WARNING: No Gospel Acclamation found")
+    gospel = readings.get("gospel", {})
+    if gospel.get("citation", "") and gospel.get("content", {}):
+        slides += gospel_slides(gospel["citation"], gospel["content"])
+    else:
+        print("  WARNING: No Gospel reading found")
+    return slides
+
+
+# Date-dependent sections in deck order, keyed like the generator's
+# ``_create_<name>`` methods (the static devotional sections between them
+# come from the slide library)
+SECTION_BUILDERS = {
+    "opening_slides": opening_slides,
+    "psalmody_section": psalmody_section,
+    "reading_section": reading_section,
+    "responsory_section": responsory_section,
+    "gospel_canticle_section": gospel_canticle_section,
+    "intercessions_section": intercessions_section,
+    "concluding_prayer_slides": concluding_prayer_slides,
+    "mass_readings_section": mass_readings_section,
+}
+
+
+__all__ = [
+    "SECTION_BUILDERS",
+    "chunk_gospel_text",
+    "concluding_prayer_slides",
+    "first_reading_slides",
+    "gospel_acclamation_header_slide",
+    "gospel_acclamation_verse_slide",
+    "gospel_canticle_section",
+    "gospel_slides",
+    "intercessions_section",
+    "mass_readings_section",
+    "opening_slides",
+    "psalmody_section",
+    "reading_section",
+    "responsorial_psalm_slides",
+    "responsory_section",
+]
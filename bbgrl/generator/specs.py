@@ -0,0 +1,217 @@
+"""Declarative slide specs and the engine that renders them.
+
+Section builders (see ``sections``) describe each slide as plain, frozen
+data: a :class:`SlideSpec` holds text boxes, paragraphs and runs with their
+geometry and formatting. Specs can be hashed (:meth:`SlideSpec.digest`),
+compared and cached independently of python-pptx. :func:`render_slides`
+turns them into slides, writing each text box body as a single XML fragment
+rather than setting properties one at a time.
+
+Sizes are in points, geometry in EMU, colours as ``"RRGGBB"`` hex strings.
+A run whose text is :data:`LINE_BREAK` becomes a line break (``<a:br/>``)
+inside its paragraph, the same as a vertical tab in python-pptx.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+LINE_BREAK = "\v"
+
+ALIGNMENTS = {"left": "l", "center": "ctr", "right": "r", "justify": "just"}
+ANCHORS = {"top": "t", "middle": "ctr", "bottom": "b"}
+AUTO_SIZES = {"none": "a:noAutofit", "shape_to_fit_text": "a:spAutoFit", "text_to_fit_shape": "a:normAutofit"}
+
+
+@dataclass(frozen=True)
+class FontSpec:
+    """Character formatting; None leaves a property unset (inherited)."""
+
+    name: Optional[str] = None
+    size: Optional[float] = None
+    bold: Optional[bool] = None
+    italic: Optional[bool] = None
+    color: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    text: str
+    font: FontSpec = FontSpec()
+
+
+@dataclass(frozen=True)
+class ParagraphSpec:
+    """A paragraph; ``font`` is the paragraph-level default run format."""
+
+    runs: Tuple[RunSpec, ...] = ()
+    alignment: Optional[str] = None
+    font: FontSpec = FontSpec()
+    space_before: Optional[float] = None
+    space_after: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TextBoxSpec:
+    """A text box. ``margins`` are (left, top, right, bottom) in EMU."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    paragraphs: Tuple[ParagraphSpec, ...] = (ParagraphSpec(),)
+    word_wrap: Optional[bool] = None
+    auto_size: Optional[str] = None
+    vertical_anchor: Optional[str] = None
+    margins: Optional[Tuple[int, int, int, int]] = None
+
+
+@dataclass(frozen=True)
+class SlideSpec:
+    """One blank-layout slide; ``label`` names it in the progress log."""
+
+    boxes: Tuple[TextBoxSpec, ...] = ()
+    label: str = ""
+
+    def digest(self) -> str:
+        raw = json.dumps(asdict(self), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def specs_digest(slides: Iterable[SlideSpec]) -> str:
+    """Digest of an ordered list of slide specs."""
+    h = hashlib.sha256()
+    for spec in slides:
+        h.update(spec.digest().encode("ascii"))
+    return h.hexdigest()
+
+
+def text_runs(text: str, font: FontSpec = FontSpec()) -> Tuple[RunSpec, ...]:
+    """Runs for ``text`` with newlines as line breaks (like ``paragraph.text``)."""
+    runs: List[RunSpec] = []
+    for i, part in enumerate(re.split(r"[\n\v]", text)):
+        if i:
+            runs.append(RunSpec(LINE_BREAK))
+        if part:
+            runs.append(RunSpec(part, font))
+    return tuple(runs)
+
+
+def text_paragraphs(text: str, font: FontSpec = FontSpec(), alignment: Optional[str] = None) -> Tuple[ParagraphSpec, ...]:
+    """One paragraph per line of ``text`` (like ``text_frame.text``), each run in ``font``."""
+    return tuple(ParagraphSpec(runs=text_runs(line, font), alignment=alignment) for line in text.split("\n"))
+
+
+# ----------------- rendering -----------------
+
+def _escape_text(s: str) -> str:
+    # Control characters other than tab/newline are not valid XML; python-pptx
+    # writes them as _xHHHH_ escapes, and so do we.
+    s = re.sub(r"([\x00-\x08\x0B-\x1F])", lambda m: "_x%04X_" % ord(m.group(1)), s)
+    return escape(s)
+
+
+def _font_xml(tag: str, font: FontSpec) -> str:
+    attrs = ""
+    if font.size is not None:
+        attrs += f' sz="{int(round(font.size * 100))}"'
+    if font.bold is not None:
+        attrs += f' b="{int(font.bold)}"'
+    if font.italic is not None:
+        attrs += f' i="{int(font.italic)}"'
+    children = ""
+    if font.color is not None:
+        children += f'<a:solidFill><a:srgbClr val="{font.color.upper()}"/></a:solidFill>'
+    if font.name is not None:
+        children += f"<a:latin typeface={quoteattr(font.name)}/>"
+    if not attrs and not children:
+        return ""
+    return f"<{tag}{attrs}>{children}</{tag}>" if children else f"<{tag}{attrs}/>"
+
+
+def _spacing_xml(tag: str, points: Optional[float]) -> str:
+    if points is None:
+        return ""
+    return f'<{tag}><a:spcPts val="{int(round(points * 100))}"/></{tag}>'
+
+
+def _paragraph_xml(para: ParagraphSpec) -> str:
+    ppr_attrs = f' algn="{ALIGNMENTS[para.alignment]}"' if para.alignment else ""
+    ppr_children = (
+        _spacing_xml("a:spcBef", para.space_before)
+        + _spacing_xml("a:spcAft", para.space_after)
+        + _font_xml("a:defRPr", para.font)
+    )
+    if ppr_children:
+        ppr = f"<a:pPr{ppr_attrs}>{ppr_children}</a:pPr>"
+    else:
+        ppr = f"<a:pPr{ppr_attrs}/>" if ppr_attrs else ""
+    runs = "".join(
+        "<a:br/>" if run.text == LINE_BREAK
+        else f"<a:r>{_font_xml('a:rPr', run.font)}<a:t>{_escape_text(run.text)}</a:t></a:r>"
+        for run in para.runs
+    )
+    return f"<a:p>{ppr}{runs}</a:p>"
+
+
+def textbox_body_xml(box: TextBoxSpec, namespaces: bool = True) -> str:
+    """The ``<p:txBody>`` element for a text box spec.
+
+    ``namespaces=False`` leaves out the namespace declarations, for embedding
+    in a slide document that already declares them.
+    """
+    attrs = ' wrap="square"' if box.word_wrap else ' wrap="none"'
+    if box.margins is not None:
+        left, top, right, bottom = box.margins
+        attrs += f' lIns="{int(left)}" tIns="{int(top)}" rIns="{int(right)}" bIns="{int(bottom)}"'
+    if box.vertical_anchor is not None:
+        attrs += f' anchor="{ANCHORS[box.vertical_anchor]}"'
+    autofit = AUTO_SIZES[box.auto_size or "shape_to_fit_text"]
+    paragraphs = "".join(_paragraph_xml(p) for p in box.paragraphs) or "<a:p/>"
+    return (
+        f"<p:txBody{' ' + nsdecls('a', 'p') if namespaces else ''}><a:bodyPr{attrs}><{autofit}/></a:bodyPr>"
+        f"<a:lstStyle/>{paragraphs}</p:txBody>"
+    )
+
+
+def render_slide(prs, spec: SlideSpec):
+    """Append ``spec`` to ``prs`` as a blank-layout slide and return it."""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for box in spec.boxes:
+        shape = slide.shapes.add_textbox(box.left, box.top, box.width, box.height)
+        sp = shape._element
+        sp.replace(sp.txBody, parse_xml(textbox_body_xml(box)))
+    return slide
+
+
+def render_slides(prs, slides: Iterable[SlideSpec], slide_count: int = 0) -> int:
+    """Render specs in order; returns the updated slide count."""
+    for spec in slides:
+        render_slide(prs, spec)
+        slide_count += 1
+        if spec.label:
+            print(f"Created slide {slide_count}: {spec.label}")
+    return slide_count
+
+
+__all__ = [
+    "FontSpec",
+    "LINE_BREAK",
+    "ParagraphSpec",
+    "RunSpec",
+    "SlideSpec",
+    "TextBoxSpec",
+    "render_slide",
+    "render_slides",
+    "specs_digest",
+    "text_paragraphs",
+    "text_runs",
+    "textbox_body_xml",
+]
@@ -0,0 +1,821 @@
+"""Text fit pass: size every text box to the largest font that fits.
+
+python-pptx does not run PowerPoint's layout engine, and relying on auto-fit
+gives inconsistent results. This pass wraps text with real font metrics
+(Pillow) and rewrites each text frame with the chosen size.
+
+Advance widths scale linearly with pixel size, so every token (and, for words
+that may need hard breaks, every character) is measured once at
+``REFERENCE_PX`` and candidate sizes are tested by comparing those reference
+widths against the box width divided by the scale factor. Line breaking uses
+prefix sums with bisection, so testing a size is close to linear in the
+number of lines rather than tokens.
+
+The pass runs in three steps: each shape is reduced to a pure-data fit
+request, requests are solved (in a process pool when there are enough of
+them), and the results are applied to the text frames serially.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+from bisect import bisect_right
+from dataclasses import replace
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.text.text import Font
+from pptx.util import Inches, Pt
+
+from .fonts import FontMetrics, font_generation, font_path_for, get_font_metrics
+from .specs import LINE_BREAK, FontSpec, ParagraphSpec, RunSpec, SlideSpec, TextBoxSpec
+
+EMU_PER_INCH = 914400
+# Deterministic inches->pixels mapping used for measurement only
+DPI = 96
+# Pixel size at which token widths are measured before scaling
+REFERENCE_PX = 200
+# Margins, as a fraction of the shape's width/height
+MARGIN_RATIO = 0.02
+# The size search stops once the fit/no-fit bracket is narrower than this
+FIT_TOLERANCE_PT = float(os.environ.get("BBGRL_FIT_TOLERANCE_PT", "0.25"))
+# Safety cap on measure passes per shape
+MAX_FIT_ITERATIONS = 32
+# Bump whenever wrapping or sizing changes, to invalidate cached fits
+FIT_CACHE_VERSION = 2
+# Worker processes for the fit step (1 = fit in this process); the shared
+# pool has this many, a call's ``jobs`` only limits how many it keeps busy
+FIT_JOBS = int(os.environ.get("BBGRL_FIT_JOBS", "0") or 0) or (os.cpu_count() or 1)
+# Below this many uncached shapes the pool is not worth the round trip
+MIN_PARALLEL_SHAPES = 16
+
+Token = Tuple[str, tuple]
+
+
+def split_tokens_preserve_ws(s: str) -> List[str]:
+    # Keep whitespace as tokens so we can wrap cleanly.
+    return re.split(r"(\s+)", s)
+
+
+class ParagraphLayout:
+    """One paragraph's tokens with widths measured once at the reference size.
+
+    The paragraph is measured with the font of its first token. Explicit
+    newlines split it into segments; each segment keeps parallel lists of
+    token texts, styles, reference widths and prefix sums.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        font_name, bold, italic = "Georgia", False, False
+        for _, style in tokens:
+            font_name, bold, italic, _ = style
+            break
+        self.metrics: FontMetrics = get_font_metrics(font_path_for(font_name, bold, italic), REFERENCE_PX)
+        self.scalable = self.metrics.scalable
+        # Each segment: (texts, styles, widths, is_space, prefix); segments
+        # after the first begin with an explicit newline carrying ``style``.
+        self.segments: List[Tuple[Optional[tuple], List[str], List[tuple], List[float], List[bool], List[float]]] = []
+        self._char_prefix: Dict[str, List[float]] = {}
+        current = self._new_segment(None)
+        for text, style in tokens:
+            if text == "":
+                continue
+            for pi, part in enumerate(text.split("\n")):
+                if pi > 0:
+                    current = self._new_segment(style)
+                if part == "":
+                    continue
+                current[1].append(part)
+                current[2].append(style)
+                current[3].append(self.metrics.length(part))
+                current[4].append(part.isspace())
+        for seg in self.segments:
+            seg[5].extend(accumulate(seg[3], initial=0.0))
+
+    def _new_segment(self, break_style):
+        seg = (break_style, [], [], [], [], [])
+        self.segments.append(seg)
+        return seg
+
+    # ----------------- scaling -----------------
+
+    def scale(self, size_pt: float) -> float:
+        """Factor from reference widths to widths at ``size_pt``."""
+        if not self.scalable:
+            # Pillow's default font does not follow the requested size
+            return 1.0
+        return (size_pt * DPI / 72.0) / float(REFERENCE_PX)
+
+    def area(self) -> float:
+        """Reference-size ink area: total token width times line height."""
+        m = self.metrics
+        line_h = (m.ascent + m.descent) * 1.15 if m.ascent is not None else REFERENCE_PX * 1.2
+        return sum(seg[5][-1] for seg in self.segments) * line_h
+
+    def line_height(self, size_pt: float) -> float:
+        m = self.metrics
+        if m.ascent is None:
+            return (size_pt * DPI / 72.0) * 1.2
+        return (m.ascent + m.descent) * self.scale(size_pt) * 1.15
+
+    # ----------------- wrapping -----------------
+
+    def _hard_break(self, part: str, max_ref: float) -> List[int]:
+        """Chunk end offsets for a word wider than the line (>= 1 char each)."""
+        prefix = self._char_prefix.get(part)
+        if prefix is None:
+            prefix = list(accumulate((self.metrics.advance(ch) for ch in part), initial=0.0))
+            self._char_prefix[part] = prefix
+        ends = []
+        pos = 0
+        n = len(part)
+        while pos < n:
+            end = bisect_right(prefix, prefix[pos] + max_ref, pos + 1, n + 1) - 1
+            if end <= pos:
+                end = pos + 1
+            ends.append(end)
+            pos = end
+        return ends
+
+    def count_lines(self, max_ref: float) -> int:
+        """Number of lines when wrapped to ``max_ref`` reference pixels."""
+        return self.measure(max_ref)[0]
+
+    def measure(self, max_ref: float) -> Tuple[int, float]:
+        """Line count and widest line when wrapped to ``max_ref``.
+
+        Greedy wrapping keeps exactly the same breaks for any narrower width
+        that is still at least the widest line. So the widest line tells the
+        solver how far the size can grow before the line count can change.
+        A lone word wider than the line is excluded, since it stays on its
+        own line at any width.
+        """
+        lines = 1
+        widest = 0.0
+        for si, (_, texts, _, widths, spaces, prefix) in enumerate(self.segments):
+            if si > 0:
+                lines += 1
+            line_w = 0.0
+            i = 0
+            n = len(texts)
+            while i < n:
+                if line_w == 0.0:
+                    # Whitespace at a line start is dropped; anything else
+                    # is placed even if it is wider than the line.
+                    if not spaces[i]:
+                        line_w = widths[i]
+                    i += 1
+                    continue
+                # Furthest run of tokens that still fits on this line
+                m = bisect_right(prefix, prefix[i] + (max_ref - line_w), i, n + 1) - 1
+                if m > i:
+                    line_w += prefix[m] - prefix[i]
+                    i = m
+                    continue
+                if line_w <= max_ref:
+                    widest = max(widest, line_w)
+                lines += 1
+                w = widths[i]
+                if not spaces[i] and w > max_ref:
+                    ends = self._hard_break(texts[i], max_ref)
+                    lines += len(ends) - 1
+                    chunk_prefix = self._char_prefix[texts[i]]
+                    start = 0
+                    for end in ends:
+                        chunk_w = chunk_prefix[end] - chunk_prefix[start]
+                        if chunk_w <= max_ref:
+                            widest = max(widest, chunk_w)
+                        line_w = chunk_w
+                        start = end
+                else:
+                    line_w = w
+                i += 1
+            if line_w <= max_ref:
+                widest = max(widest, line_w)
+        return lines, widest
+
+    def wrap(self, max_ref: float) -> List[Token]:
+        """Tokens with newline tokens inserted at the line breaks."""
+        wrapped: List[Token] = []
+        for break_style, texts, styles, widths, spaces, _ in self.segments:
+            if break_style is not None:
+                wrapped.append(("\n", break_style))
+            line_w = 0.0
+            for part, style, w, is_space in zip(texts, styles, widths, spaces):
+                if is_space and line_w == 0.0:
+                    continue
+                if line_w > 0.0 and (line_w + w) > max_ref:
+                    wrapped.append(("\n", style))
+                    line_w = 0.0
+                    if not is_space and w > max_ref:
+                        # Hard-break long words
+                        ends = self._hard_break(part, max_ref)
+                        prefix = self._char_prefix[part]
+                        start = 0
+                        for end in ends[:-1]:
+                            wrapped.append((part[start:end] + "\n", style))
+                            start = end
+                        wrapped.append((part[start:], style))
+                        line_w = prefix[len(part)] - prefix[start]
+                        continue
+                wrapped.append((part, style))
+                line_w += w
+        return wrapped
+
+
+def _font_value(run_font, para_font, attr):
+    # Run property, falling back to the paragraph default; fonts may be None
+    value = getattr(run_font, attr) if run_font is not None else None
+    if value is None and para_font is not None:
+        value = getattr(para_font, attr)
+    return value
+
+
+def _paragraph_specs(tf) -> List[Dict[str, Any]]:
+    # Capture original paragraphs/runs with styles. Properties are read from
+    # the XML directly: python-pptx's ``p.font``, ``p.alignment`` and
+    # ``r.font`` add empty pPr/defRPr/rPr elements as a side effect.
+    specs = []
+    for p in tf.paragraphs:
+        pPr = p._p.pPr
+        para_font = Font(pPr.defRPr) if pPr is not None and pPr.defRPr is not None else None
+        para_runs = []
+        for r in p.runs:
+            run_font = Font(r._r.rPr) if r._r.rPr is not None else None
+            para_runs.append({
+                "text": r.text or "",
+                "name": (_font_value(run_font, None, "name") or _font_value(None, para_font, "name") or "Georgia"),
+                "bold": bool(_font_value(run_font, para_font, "bold")),
+                "italic": bool(_font_value(run_font, para_font, "italic")),
+                "color": getattr(getattr(run_font, "color", None), "rgb", None),
+            })
+        specs.append({"alignment": pPr.algn if pPr is not None else None, "runs": para_runs})
+    return specs
+
+
+def spec_paragraph_specs(box: TextBoxSpec) -> List[Dict[str, Any]]:
+    """``_paragraph_specs`` for a text box spec, read the way python-pptx reads the rendered box."""
+    specs = []
+    for para in box.paragraphs:
+        para_runs = []
+        for run in para.runs:
+            if run.text == LINE_BREAK:
+                continue
+            font = run.font
+            para_runs.append({
+                "text": run.text,
+                "name": (font.name or para.font.name or "Georgia"),
+                "bold": bool(font.bold if font.bold is not None else para.font.bold),
+                "italic": bool(font.italic if font.italic is not None else para.font.italic),
+                "color": font.color,
+            })
+        specs.append({"alignment": para.alignment, "runs": para_runs})
+    return specs
+
+
+def _merge_wrapped(wrapped_tokens) -> List[list]:
+    # Merge adjacent wrapped tokens with identical style into runs
+    merged: List[list] = []
+    for t, sk in wrapped_tokens:
+        if not merged or merged[-1][1] != sk:
+            merged.append([t, sk])
+        else:
+            merged[-1][0] += t
+    return merged
+
+
+def _run_style(run) -> tuple:
+    return (run["name"], run["bold"], run["italic"], run["color"])
+
+
+def _styles_in_order(paragraph_specs) -> List[tuple]:
+    styles: List[tuple] = []
+    for para in paragraph_specs:
+        for run in para["runs"]:
+            style = _run_style(run)
+            if style not in styles:
+                styles.append(style)
+    return styles
+
+
+def _box_geometry(width_emu, height_emu) -> Tuple[float, float, float, float]:
+    """Margins and inner box size in pixels: (mx, my, inner_w, inner_h)."""
+    # Available box size in pixels, using EMU -> inches -> px
+    w_in = float(width_emu) / EMU_PER_INCH if width_emu else 1.0
+    h_in = float(height_emu) / EMU_PER_INCH if height_emu else 1.0
+    w_px = max(1.0, w_in * DPI)
+    h_px = max(1.0, h_in * DPI)
+
+    # Margins: proportional to shape size (no fixed absolute sizing)
+    mx = w_px * MARGIN_RATIO
+    my = h_px * MARGIN_RATIO
+    return mx, my, max(1.0, w_px - (2.0 * mx)), max(1.0, h_px - (2.0 * my))
+
+
+def fit_request(paragraph_specs, width_emu, height_emu,
+                tolerance_pt: float = FIT_TOLERANCE_PT) -> Optional[Dict[str, Any]]:
+    """Pure-data description of one shape's fit problem, or None if empty.
+
+    Holds only built-in types so it can be pickled to a worker process and
+    hashed for the fit cache. Runs refer to ``styles`` by index; colours are
+    left out since they do not affect measurement.
+    """
+    # If there's no content, skip.
+    if not any(any(r["text"] for r in ps["runs"]) for ps in paragraph_specs):
+        return None
+    styles = _styles_in_order(paragraph_specs)
+    return {
+        "width": int(width_emu or 0),
+        "height": int(height_emu or 0),
+        "tolerance": tolerance_pt,
+        "styles": [[name, bold, italic] for name, bold, italic, _ in styles],
+        "paragraphs": [[[r["text"], styles.index(_run_style(r))] for r in para["runs"]]
+                       for para in paragraph_specs],
+    }
+
+
+def _tokens_for_paragraph(request, para) -> List[Token]:
+    # Flatten tokens per paragraph; the style index rides along as the
+    # fourth style field so wrapped tokens map back to the original runs.
+    tokens = []
+    for text, si in para:
+        name, bold, italic = request["styles"][si]
+        style_key = (name, bold, italic, si)
+        for tok in split_tokens_preserve_ws(text):
+            if tok == "":
+                continue
+            tokens.append((tok, style_key))
+    return tokens
+
+
+def solve_font_size(layouts: List[ParagraphLayout], inner_w: float, inner_h: float,
+                    tolerance_pt: float = FIT_TOLERANCE_PT) -> Tuple[float, int]:
+    """Largest point size at which the paragraphs fit, and the passes used.
+
+    The text height is a step function of size. While the line breaks stay
+    the same it grows linearly, and it jumps where a paragraph's breaks
+    change. Each measure pass at size ``s`` gives, in closed form:
+
+    * ``cap``: the size at which the current line counts exactly fill the
+      box height, and
+    * ``brk``: the largest size up to which the current line breaks are
+      guaranteed to hold (see ``ParagraphLayout.measure``).
+
+    If the text fits and ``cap <= brk``, ``cap`` is the answer. After an
+    overshoot, ``cap`` is a size that is sure to fit. The search starts from
+    the size at which the text's area equals the box area, jumps between
+    these breakpoints and falls back to bisection. It stops once the bracket
+    is narrower than ``tolerance_pt``.
+    """
+    low = 1.0  # minimal readable size, used when nothing fits
+    high = max(1.0, (inner_h / DPI) * 72.0)  # upper bound from box height
+    tolerance_pt = max(1e-3, tolerance_pt)
+    iterations = 0
+
+    def measure(size_pt: float) -> Tuple[bool, float, float]:
+        # Height is split into the part proportional to size and the fixed
+        # part from fonts that ignore size; paragraphs wrap independently.
+        nonlocal iterations
+        iterations += 1
+        linear = fixed = 0.0
+        brk = float("inf")
+        for layout in layouts:
+            max_ref = inner_w / layout.scale(size_pt)
+            lines, widest = layout.measure(max_ref)
+            h = lines * layout.line_height(size_pt)
+            if layout.scalable:
+                linear += h / size_pt
+                if widest > 0.0:
+                    # max_ref shrinks as 1/size; breaks hold while it >= widest
+                    brk = min(brk, size_pt * max_ref / widest * (1.0 - 1e-9))
+            else:
+                fixed += h
+        cap = float("inf") if linear <= 0.0 else (inner_h - fixed) / linear
+        return linear * size_pt + fixed <= inner_h, cap, max(size_pt, brk)
+
+    area = sum(layout.area() for layout in layouts if layout.scalable)
+    if area > 0.0:
+        scale = (inner_w * inner_h / area) ** 0.5
+        size = scale * REFERENCE_PX * 72.0 / DPI
+    else:
+        size = high
+    size = min(high, max(low, size))
+
+    best = low
+    while iterations < MAX_FIT_ITERATIONS:
+        ok, cap, brk = measure(size)
+        if ok:
+            if cap <= brk:
+                # Same breaks all the way to the height limit
+                best = min(high, cap * (1.0 - 1e-9))
+                break
+            # Breaks hold (and still fit) up to brk; beyond it they change
+            best = low = min(high, brk)
+            if high - low < tolerance_pt:
+                break
+            size = cap if cap < high else (low + high) / 2.0
+        else:
+            high = size
+            if high - low < tolerance_pt:
+                break
+            # With these line counts the text exactly fills the box at cap,
+            # and a smaller size can only have fewer lines, so cap fits
+            size = cap if low < cap < high else (low + high) / 2.0
+    return best, iterations
+
+
+def _font_identity(name: str, bold: bool, italic: bool) -> List[Any]:
+    # Keyed on the font generation: a font installed or removed while the
+    # process runs changes the fit cache keys that depend on it
+    return _font_identity_at(name, bold, italic, font_generation())
+
+
+@lru_cache(maxsize=1024)
+def _font_identity_at(name: str, bold: bool, italic: bool, generation: int) -> List[Any]:
+    path = font_path_for(name, bold, italic)
+    if not path:
+        return [name, bold, italic, None]
+    try:
+        st = os.stat(path)
+        return [name, bold, italic, path, st.st_size, st.st_mtime_ns]
+    except OSError:
+        return [name, bold, italic, path]
+
+
+def fit_cache_key(request: Dict[str, Any]) -> str:
+    """Digest of everything a fit result depends on."""
+    payload = {
+        "version": FIT_CACHE_VERSION,
+        "reference_px": REFERENCE_PX,
+        "dpi": DPI,
+        "margin": MARGIN_RATIO,
+        "request": request,
+        "fonts": [_font_identity(name, bold, italic) for name, bold, italic in request["styles"]],
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def compute_fit(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Solve a fit request: chosen size, wrapped lines and passes used.
+
+    Wrapped lines are ``[text, style index]`` pairs per paragraph. Safe to
+    run in a worker process.
+    """
+    _, _, inner_w, inner_h = _box_geometry(request["width"], request["height"])
+    layouts = [ParagraphLayout(_tokens_for_paragraph(request, para)) for para in request["paragraphs"]]
+    best, iterations = solve_font_size(layouts, inner_w, inner_h, request["tolerance"])
+    wrapped = [[[text, style[3]] for text, style in layout.wrap(inner_w / layout.scale(best))]
+               for layout in layouts]
+    return {"size": best, "wrapped": wrapped, "iterations": iterations}
+
+
+def _compute_fit_safe(request: Dict[str, Any]) -> Dict[str, Any]:
+    # Worker entry point: a failing shape must not sink the whole map()
+    try:
+        return compute_fit(request)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def apply_fit(tf, paragraph_specs, request: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Rewrite ``tf`` from a solved (or cached) fit result."""
+    mx, my, _, _ = _box_geometry(request["width"], request["height"])
+    styles = _styles_in_order(paragraph_specs)
+    wrapped = [[(text, styles[si]) for text, si in para] for para in result["wrapped"]]
+    _rewrite_text_frame(tf, paragraph_specs, wrapped, result["size"], mx, my)
+
+
+def fitted_box(box: TextBoxSpec, paragraph_specs, request: Dict[str, Any], result: Dict[str, Any]) -> TextBoxSpec:
+    """``box`` as :func:`apply_fit` would leave it once rendered.
+
+    Mirrors ``_rewrite_text_frame``: the first paragraph keeps its default run
+    format (``tf.clear()`` keeps its properties), sizes are rounded down to
+    whole centipoints like ``Font.size``.
+    """
+    mx, my, _, _ = _box_geometry(request["width"], request["height"])
+    styles = _styles_in_order(paragraph_specs)
+    size_pt = Pt(result["size"]).centipoints / 100.0
+    paragraphs = []
+    for pi, (para_spec, para) in enumerate(zip(paragraph_specs, result["wrapped"])):
+        runs = []
+        for text, si in _merge_wrapped([(text, styles[si]) for text, si in para]):
+            if text == "":
+                continue
+            font_name, bold, italic, color = si
+            runs.append(RunSpec(text, FontSpec(font_name, size_pt, bold, italic, color)))
+        paragraphs.append(ParagraphSpec(
+            runs=tuple(runs),
+            alignment=para_spec["alignment"],
+            font=box.paragraphs[0].font if pi == 0 else FontSpec(),
+            space_before=0,
+            space_after=0,
+        ))
+    margin_x, margin_y = int(Inches(mx / DPI)), int(Inches(my / DPI))
+    return replace(box, paragraphs=tuple(paragraphs), word_wrap=True, auto_size="none",
+                   margins=(margin_x, margin_y, margin_x, margin_y))
+
+
+def fit_shape(tf, shape, tolerance_pt: float = FIT_TOLERANCE_PT, cache=None) -> Optional[Tuple[int, bool]]:
+    """Rewrite ``tf`` with its text wrapped at the largest size that fits.
+
+    ``cache`` is an optional :class:`~bbgrl.generator.cache.FitCache`; on a
+    hit the stored size and line breaks are applied without measuring.
+    Returns ``(measure passes, cache hit)``, or None for empty frames.
+    """
+    paragraph_specs = _paragraph_specs(tf)
+    request = fit_request(paragraph_specs, shape.width, shape.height, tolerance_pt)
+    if request is None:
+        return None
+    key = fit_cache_key(request) if cache is not None else None
+    result = cache.get(key) if key is not None else None
+    if result is not None:
+        apply_fit(tf, paragraph_specs, request, result)
+        return 0, True
+    result = compute_fit(request)
+    if key is not None:
+        cache.put(key, {"size": result["size"], "wrapped": result["wrapped"]})
+    apply_fit(tf, paragraph_specs, request, result)
+    return result["iterations"], False
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _fit_pool() -> ProcessPoolExecutor:
+    """Process pool of FIT_JOBS workers kept alive across decks, so workers keep their fonts.
+
+    Workers are spawned rather than forked: the UI server calls this from
+    one of its many threads, and forking a threaded process is unsafe.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=FIT_JOBS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop ``pool`` after it broke, unless another caller already replaced it."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_fit_pool() -> None:
+    """Stop the fit worker processes (they are restarted on demand)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _compute_fit_chunk(requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [_compute_fit_safe(request) for request in requests]
+
+
+def _map_chunks(pool: ProcessPoolExecutor, requests: List[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+    # About four chunks per worker for balance, but at most ``workers`` in
+    # flight, so one deck never takes more of the shared pool than it asked for
+    size = max(1, len(requests) // (workers * 4))
+    chunks = iter(enumerate(requests[i:i + size] for i in range(0, len(requests), size)))
+    results: Dict[int, List[Dict[str, Any]]] = {}
+    running = {}
+
+    def submit_next() -> None:
+        item = next(chunks, None)
+        if item is not None:
+            running[pool.submit(_compute_fit_chunk, item[1])] = item[0]
+
+    for _ in range(workers):
+        submit_next()
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[running.pop(future)] = future.result()
+            submit_next()
+    return [result for i in sorted(results) for result in results[i]]
+
+
+def _compute_fits(requests: List[Dict[str, Any]], jobs: int) -> List[Dict[str, Any]]:
+    workers = min(jobs, FIT_JOBS, len(requests))
+    if workers > 1 and len(requests) >= MIN_PARALLEL_SHAPES:
+        pool = _fit_pool()
+        try:
+            return _map_chunks(pool, requests, workers)
+        except BrokenProcessPool as e:
+            # A killed worker breaks the pool; the next deck gets a fresh one
+            print(f"  WARNING: Parallel text fit failed, fitting in-process: {e}")
+            _discard_pool(pool)
+        except Exception as e:
+            print(f"  WARNING: Parallel text fit failed, fitting in-process: {e}")
+    return _compute_fit_chunk(requests)
+
+
+def _rewrite_text_frame(tf, paragraph_specs, wrapped_paras, size_pt: float, mx: float, my: float) -> None:
+    # Rewrite text frame using wrapped tokens + computed size
+    tf.clear()
+    # Apply proportional margins in pptx units
+    try:
+        tf.margin_left = Inches((mx / DPI))
+        tf.margin_right = Inches((mx / DPI))
+        tf.margin_top = Inches((my / DPI))
+        tf.margin_bottom = Inches((my / DPI))
+    except Exception:
+        pass
+    tf.word_wrap = True
+    tf.auto_size = MSO_AUTO_SIZE.NONE
+
+    for pi, (para_spec, wrapped_tokens) in enumerate(zip(paragraph_specs, wrapped_paras)):
+        p = tf.paragraphs[0] if pi == 0 else tf.add_paragraph()
+        p.alignment = para_spec["alignment"]
+        p.space_before = Pt(0)
+        p.space_after = Pt(0)
+        # Rebuild runs, merging adjacent tokens with identical style
+        for text, sk in _merge_wrapped(wrapped_tokens):
+            if text == "":
+                continue
+            font_name, bold, italic, color = sk
+            r = p.add_run()
+            r.text = text
+            r.font.name = font_name
+            r.font.bold = bold
+            r.font.italic = italic
+            try:
+                r.font.size = Pt(size_pt)
+            except Exception:
+                pass
+            if color is not None:
+                try:
+                    r.font.color.rgb = color
+                except Exception:
+                    pass
+
+
+def _pending_fit(target, paragraph_specs, width_emu, height_emu, tolerance_pt, cache) -> Optional[list]:
+    """``[target, paragraph specs, request, cache key, cached result]``, or None if empty."""
+    request = fit_request(paragraph_specs, width_emu, height_emu, tolerance_pt)
+    if request is None:
+        return None
+    key = fit_cache_key(request) if cache is not None else None
+    result = cache.get(key) if key is not None else None
+    return [target, paragraph_specs, request, key, result]
+
+
+def _solve_pending(pending: List[list], cache, jobs: Optional[int]) -> None:
+    # Solve the cache misses (in a pool when there are enough) and store them
+    misses = [item for item in pending if item[4] is None]
+    results = _compute_fits([item[2] for item in misses], jobs or FIT_JOBS)
+    for item, result in zip(misses, results):
+        item[4] = result
+        if "error" not in result and item[3] is not None:
+            cache.put(item[3], {"size": result["size"], "wrapped": result["wrapped"]})
+
+
+class FitStats:
+    """Measure passes per fitted shape and fit cache use, for the run summary."""
+
+    def __init__(self):
+        self.iterations: List[int] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_enabled = False
+
+    def record(self, outcome: Optional[Tuple[int, bool]]) -> None:
+        if outcome is None:
+            return
+        iterations, hit = outcome
+        if hit:
+            self.cache_hits += 1
+            return
+        if self.cache_enabled:
+            self.cache_misses += 1
+        self.iterations.append(iterations)
+
+    def summary(self) -> str:
+        shapes = len(self.iterations) + self.cache_hits
+        if not shapes:
+            return "Text fit: no text shapes"
+        text = f"Text fit: {shapes} shapes"
+        if self.iterations:
+            total = sum(self.iterations)
+            text += (f", {total} measure passes "
+                     f"(avg {total / len(self.iterations):.1f}, max {max(self.iterations)})")
+        if self.cache_enabled:
+            text += f"; fit cache {self.cache_hits} hits, {self.cache_misses} misses"
+        return text
+
+
+def maximize_text_size(prs, tolerance_pt: float = FIT_TOLERANCE_PT, cache=None,
+                       jobs: Optional[int] = None, skip_slide_ids=()) -> FitStats:
+    """Fit every text frame in ``prs``; failures are reported per shape.
+
+    ``jobs`` is the number of worker processes for uncached shapes (default
+    ``BBGRL_FIT_JOBS`` or the CPU count); 1 fits everything in-process.
+    Slides whose ``slide_id`` is in ``skip_slide_ids`` (already fitted, e.g.
+    copied from the static slide library) are left as they are.
+    """
+    stats = FitStats()
+    stats.cache_enabled = cache is not None
+    # (text frame, paragraph specs, request, cache key, result)
+    pending: List[list] = []
+    try:
+        for slide in prs.slides:
+            if slide.slide_id in skip_slide_ids:
+                continue
+            for shape in slide.shapes:
+                if not getattr(shape, "has_text_frame", False) or not shape.has_text_frame:
+                    continue
+                try:
+                    tf = shape.text_frame
+                    item = _pending_fit(tf, _paragraph_specs(tf), shape.width, shape.height, tolerance_pt, cache)
+                    if item is not None:
+                        pending.append(item)
+                except Exception as e:
+                    print(f"  WARNING: Text fit failed on a shape: {e}")
+
+        _solve_pending(pending, cache, jobs)
+
+        for tf, paragraph_specs, request, key, result in pending:
+            if "error" in result:
+                print(f"  WARNING: Text fit failed on a shape: {result['error']}")
+                continue
+            try:
+                apply_fit(tf, paragraph_specs, request, result)
+                hit = "iterations" not in result
+                stats.record((0 if hit else result["iterations"], hit))
+            except Exception as e:
+                print(f"  WARNING: Text fit failed on a shape: {e}")
+    except Exception as e:
+        print(f"  WARNING: Maximize text size post-pass encountered an error: {e}")
+    print(f"  {stats.summary()}")
+    return stats
+
+
+def fit_slide_specs(slides: List[SlideSpec], tolerance_pt: float = FIT_TOLERANCE_PT, cache=None,
+                    jobs: Optional[int] = None) -> Tuple[List[SlideSpec], FitStats]:
+    """Fit every text box of ``slides`` without rendering them.
+
+    Same result as rendering the specs and running :func:`maximize_text_size`
+    on the presentation, returned as new specs (see :func:`fitted_box`).
+    """
+    stats = FitStats()
+    stats.cache_enabled = cache is not None
+    boxes = [list(spec.boxes) for spec in slides]
+    pending: List[list] = []
+    for si, spec in enumerate(slides):
+        for bi, box in enumerate(spec.boxes):
+            try:
+                item = _pending_fit((si, bi), spec_paragraph_specs(box), box.width, box.height, tolerance_pt, cache)
+                if item is not None:
+                    pending.append(item)
+            except Exception as e:
+                print(f"  WARNING: Text fit failed on a shape: {e}")
+    try:
+        _solve_pending(pending, cache, jobs)
+    except Exception as e:
+        print(f"  WARNING: Maximize text size post-pass encountered an error: {e}")
+        pending = []
+
+    for (si, bi), paragraph_specs, request, key, result in pending:
+        if "error" in result:
+            print(f"  WARNING: Text fit failed on a shape: {result['error']}")
+            continue
+        try:
+            boxes[si][bi] = fitted_box(boxes[si][bi], paragraph_specs, request, result)
+            hit = "iterations" not in result
+            stats.record((0 if hit else result["iterations"], hit))
+        except Exception as e:
+            print(f"  WARNING: Text fit failed on a shape: {e}")
+    print(f"  {stats.summary()}")
+    return [replace(spec, boxes=tuple(b)) for spec, b in zip(slides, boxes)], stats
+
+
+__all__ = [
+    "FitStats",
+    "ParagraphLayout",
+    "apply_fit",
+    "compute_fit",
+    "fit_cache_key",
+    "fit_request",
+    "fit_shape",
+    "fit_slide_specs",
+    "fitted_box",
+    "maximize_text_size",
+    "shutdown_fit_pool",
+    "solve_font_size",
+    "spec_paragraph_specs",
+    "split_tokens_preserve_ws",
+]
@@ -0,0 +1,114 @@
+"""Import timing for ``--startup-profile``.
+
+``python -X importtime`` is not available in the frozen EXE, so
+:class:`ImportProfiler` measures imports in-process instead: it sits first
+on ``sys.meta_path``, wraps each module's loader and records how long the
+module took to execute, with and without the imports it triggered.
+:meth:`ImportProfiler.report` prints the result in the same layout as
+``-X importtime``.
+"""
+
+from __future__ import annotations
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from typing import List, Optional, TextIO
+
+
+class _Record:
+    __slots__ = ("name", "depth", "cumulative", "children")
+
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.cumulative = 0.0
+        self.children = 0.0
+
+    @property
+    def self_time(self) -> float:
+        return self.cumulative - self.children
+
+
+class _TimedLoader:
+    """Delegates to the real loader, timing ``exec_module``."""
+
+    def __init__(self, loader, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        profiler = self._profiler
+        record = _Record(module.__name__, len(profiler._stack))
+        profiler._stack.append(record)
+        start = time.perf_counter()
+        try:
+            # Undo the wrapping so the module sees its real loader
+            if getattr(module, "__loader__", None) is self:
+                module.__loader__ = self._loader
+            if module.__spec__ is not None and module.__spec__.loader is self:
+                module.__spec__.loader = self._loader
+            self._loader.exec_module(module)
+        finally:
+            record.cumulative = time.perf_counter() - start
+            profiler._stack.pop()
+            if profiler._stack:
+                profiler._stack[-1].children += record.cumulative
+            profiler.records.append(record)
+
+
+class ImportProfiler(MetaPathFinder):
+    """Records the execution time of every module imported while installed."""
+
+    def __init__(self):
+        self.records: List[_Record] = []
+        self._stack: List[_Record] = []
+
+    @classmethod
+    def install(cls) -> "ImportProfiler":
+        profiler = cls()
+        sys.meta_path.insert(0, profiler)
+        return profiler
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    @property
+    def total(self) -> float:
+        """Seconds spent in top-level imports."""
+        return sum(r.cumulative for r in self.records if r.depth == 0)
+
+    def report(self, stream: Optional[TextIO] = None, min_seconds: float = 0.001) -> None:
+        """Print ``-X importtime``-style lines for imports of at least ``min_seconds``.
+
+        As with ``-X importtime``, a module is listed after the modules it
+        imported, indented by its nesting depth; times are in microseconds.
+        """
+        stream = stream or sys.stderr
+        print("import time: self [us] | cumulative | imported package", file=stream)
+        for r in self.records:
+            if r.cumulative >= min_seconds:
+                print(f"import time: {r.self_time * 1e6:9.0f} | {r.cumulative * 1e6:10.0f} | "
+                      f"{'  ' * r.depth}{r.name}", file=stream)
+        print(f"import time: total {self.total * 1e3:.0f} ms in {len(self.records)} modules", file=stream)
+
+
+__all__ = ["ImportProfiler"]
@@ -0,0 +1,23 @@
+# Job bookkeeping for the UI server
+from .coalesce import RequestCoalescer
+from .events import JobEvents
+from .scheduler import JobScheduler, QueueFull
+from .store import (
+    JOB_DEFAULTS,
+    JobStore,
+    MemoryJobStore,
+    SQLiteJobStore,
+    open_job_store,
+)
+
+__all__ = [
+    "JOB_DEFAULTS",
+    "JobEvents",
+    "JobScheduler",
+    "JobStore",
+    "MemoryJobStore",
+    "QueueFull",
+    "RequestCoalescer",
+    "SQLiteJobStore",
+    "open_job_store",
+]
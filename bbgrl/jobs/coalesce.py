@@ -0,0 +1,50 @@
+"""In-flight deduplication of identical generation requests.
+
+When several people ask for the same deck at once, only the first request
+starts a job; the others attach to it and follow the same progress and
+download. A key stays in flight from the moment its job is started until
+:meth:`RequestCoalescer.finish` is called for it.
+"""
+
+from __future__ import annotations
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class RequestCoalescer:
+    """Maps request keys (e.g. ``(date, options)``) to their in-flight job id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, str] = {}
+        self.coalesced = 0  # requests that attached to an existing job
+
+    def attach_or_start(self, key: Hashable, start: Callable[[], str]) -> Tuple[str, bool]:
+        """(job id, attached): the in-flight job for ``key``, else ``start()``'s.
+
+        ``start`` runs under the lock, so identical concurrent requests start
+        one job; if it raises, nothing is registered.
+        """
+        with self._lock:
+            job_id = self._inflight.get(key)
+            if job_id is not None:
+                self.coalesced += 1
+                return job_id, True
+            job_id = self._inflight[key] = start()
+            return job_id, False
+
+    def finish(self, key: Hashable, job_id: str) -> None:
+        """Stop routing ``key`` to ``job_id``; later requests start a new job."""
+        with self._lock:
+            if self._inflight.get(key) == job_id:
+                del self._inflight[key]
+
+    def job_for(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            return self._inflight.get(key)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+__all__ = ["RequestCoalescer"]
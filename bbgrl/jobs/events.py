@@ -0,0 +1,87 @@
+"""Change notifications for job progress, for streaming it to clients.
+
+:class:`JobEvents` wraps a job store: every update goes through
+:meth:`JobEvents.update`, which stamps the job with a new version and wakes
+the streams waiting on that job in :meth:`JobEvents.wait`; streams of other
+jobs sleep on. A stream takes a :meth:`JobEvents.snapshot`, sends it, and
+waits for the job's version to move on; since a snapshot is always the
+job's latest state, updates that arrive while a stream is busy collapse
+into one. :meth:`JobEvents.touch` wakes a job's streams without changing
+the job, for state kept outside the store (e.g. its queue position).
+"""
+
+from __future__ import annotations
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .store import JobStore
+
+
+class _Waiters:
+    """Streams waiting on one job; ``changes`` counts wake-ups since they registered."""
+
+    __slots__ = ("cond", "count", "changes")
+
+    def __init__(self, lock: threading.Lock):
+        self.cond = threading.Condition(lock)
+        self.count = 0
+        self.changes = 0
+
+
+class JobEvents:
+    def __init__(self, store: JobStore):
+        self.store = store
+        self._lock = threading.Lock()
+        self._version = 0  # last version handed out; versions grow across all jobs
+        self._waiters: Dict[str, _Waiters] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def update(self, job_id: str, **fields) -> None:
+        """Update the job in the store and notify the streams waiting on it."""
+        with self._lock:
+            self._version += 1
+            self.store.update(job_id, version=self._version, **fields)
+            self._notify(job_id)
+
+    def touch(self, job_ids: Iterable[str]) -> None:
+        """Wake the streams of ``job_ids`` without changing the jobs."""
+        with self._lock:
+            for job_id in job_ids:
+                self._notify(job_id)
+
+    def _notify(self, job_id: str) -> None:
+        waiters = self._waiters.get(job_id)
+        if waiters is not None:
+            waiters.changes += 1
+            waiters.cond.notify_all()
+
+    def snapshot(self, job_id: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """(version, job): the job and its version, for :meth:`wait`."""
+        with self._lock:
+            job = self.store.get(job_id)
+            return (job.get("version", 0) if job else self._version), job
+
+    def wait(self, job_id: str, since: int, timeout: Optional[float] = None) -> bool:
+        """Block until the job changed after version ``since`` or was touched; False on timeout."""
+        with self._lock:
+            # An update may have landed between the caller's snapshot and now
+            job = self.store.get(job_id)
+            if job is None or job.get("version", 0) > since:
+                return True
+            waiters = self._waiters.get(job_id)
+            if waiters is None:
+                waiters = self._waiters[job_id] = _Waiters(self._lock)
+            waiters.count += 1
+            seen = waiters.changes
+            try:
+                return waiters.cond.wait_for(lambda: waiters.changes > seen, timeout)
+            finally:
+                waiters.count -= 1
+                if not waiters.count:
+                    del self._waiters[job_id]
+
+
+__all__ = ["JobEvents"]
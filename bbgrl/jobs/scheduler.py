@@ -0,0 +1,162 @@
+"""Bounded job scheduler for the UI server.
+
+Jobs wait in a FIFO queue and are run by a fixed number of worker threads,
+so a burst of requests queues up instead of starting a browser and a fit
+pass per request. The queue is bounded; :meth:`JobScheduler.submit` raises
+:class:`QueueFull` once it is full, which the app turns into HTTP 429.
+
+Within a job, the expensive stages run under per-stage limits
+(:meth:`JobScheduler.stage`): with two workers and one render slot, one
+job can scrape while another renders, but two decks are never fitted at
+the same time.
+
+Whenever a job leaves the queue, the ``on_queue_moved`` hook is called with
+the ids of the jobs still waiting, whose queue positions just changed.
+"""
+
+from __future__ import annotations
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, NamedTuple, Optional
+
+
+class QueueFull(Exception):
+    """Raised by :meth:`JobScheduler.submit` when the queue is at capacity."""
+
+
+class _Entry(NamedTuple):
+    seq: int
+    job_id: str
+    fn: Callable
+    args: tuple
+
+
+class JobScheduler:
+    """Fixed pool of ``workers`` threads fed from a FIFO queue of ``max_queue`` jobs.
+
+    ``stage_limits`` maps a stage name (e.g. ``"scrape"``, ``"render"``) to
+    how many jobs may be in that stage at once.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 10, stage_limits: Optional[Dict[str, int]] = None):
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self._cond = threading.Condition()
+        self._queue: Deque[_Entry] = deque()
+        self._waiting: Dict[str, int] = {}  # queued job id -> sequence number
+        self._running: Dict[str, int] = {}  # running job id -> worker index
+        self._seq = 0
+        self._stages = {name: threading.BoundedSemaphore(max(1, n)) for name, n in (stage_limits or {}).items()}
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self.on_queue_moved: Optional[Callable[[List[str]], None]] = None
+
+    def _start_workers(self) -> None:
+        # Started on first submit, so importing the app starts no threads
+        for i in range(self.workers):
+            t = threading.Thread(target=self._work, args=(i,), name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, job_id: str, fn: Callable, *args) -> int:
+        """Queue ``fn(*args)``; returns the job's queue position (1 = next)."""
+        with self._cond:
+            if self._closed:
+                raise QueueFull("scheduler is shutting down")
+            if len(self._queue) >= self.max_queue:
+                raise QueueFull(f"{len(self._queue)} jobs already queued")
+            if not self._threads:
+                self._start_workers()
+            self._seq += 1
+            self._queue.append(_Entry(self._seq, job_id, fn, args))
+            self._waiting[job_id] = self._seq
+            self._cond.notify()
+            return self._waiting[job_id] - self._queue[0].seq + 1
+
+    def position(self, job_id: str) -> Optional[int]:
+        """1-based queue position of a waiting job, 0 once running, None otherwise."""
+        with self._cond:
+            seq = self._waiting.get(job_id)
+            if seq is not None:
+                # FIFO: everything between the head and this job is still queued
+                return seq - self._queue[0].seq + 1
+            return 0 if job_id in self._running else None
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Hold one of the ``name`` stage's slots (unlimited if not configured)."""
+        sem = self._stages.get(name)
+        if sem is None:
+            yield
+            return
+        with sem:
+            yield
+
+    def _work(self, index: int) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                entry = self._queue.popleft()
+                del self._waiting[entry.job_id]
+                self._running[entry.job_id] = index
+                moved = list(self._waiting)
+            if moved and self.on_queue_moved is not None:
+                try:
+                    self.on_queue_moved(moved)
+                except Exception as e:
+                    print(f"  WARNING: Queue hook failed: {e}")
+            try:
+                entry.fn(*entry.args)
+            except Exception as e:
+                # Job functions report their own failures; keep the worker alive
+                print(f"  WARNING: Job {entry.job_id} raised: {e}")
+            finally:
+                with self._cond:
+                    self._running.pop(entry.job_id, None)
+                    self._cond.notify_all()
+
+    def abandon(self) -> List[str]:
+        """Drop the queued jobs; returns the ids of every queued or running job.
+
+        For a shutdown that stops waiting: the caller records these jobs as
+        interrupted, and no queued job starts afterwards.
+        """
+        with self._cond:
+            self._closed = True
+            unfinished = list(self._running) + [entry.job_id for entry in self._queue]
+            self._queue.clear()
+            self._waiting.clear()
+            self._cond.notify_all()
+            return unfinished
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """Stop accepting jobs; queued jobs still run.
+
+        With ``wait``, blocks until every queued and running job finished or
+        ``timeout`` seconds passed. Returns True once idle.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            if wait:
+                self._cond.wait_for(lambda: not self._queue and not self._running, timeout)
+            return not self._queue and not self._running
+
+
+__all__ = ["JobScheduler", "QueueFull"]
@@ -0,0 +1,348 @@
+"""Job stores for the UI server.
+
+A job is a small JSON-serializable dict (progress, message, done, error,
+output file, ...) keyed by job id. :class:`JobStore` is the interface the
+app uses; :class:`MemoryJobStore` keeps jobs in memory and
+:class:`SQLiteJobStore` also persists finished jobs, so they survive a
+restart.
+
+Both stores are bounded: finished jobs expire ``ttl_seconds`` after they
+finish, and past ``max_jobs`` the least recently used finished jobs go
+first. Evicting a job deletes its output file, unless another job still
+links to the same file, and calls the store's ``on_evict`` hook with its id.
+Running jobs are never evicted.
+"""
+
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Fields every job has; stores may add bookkeeping fields of their own
+JOB_DEFAULTS: Dict[str, Any] = {
+    "percent": 0,
+    "message": "",
+    "done": False,
+    "error": None,
+    "output_path": None,
+    "filename": None,
+    "etag": None,
+}
+
+
+class JobStore(ABC):
+    """Interface: create, look up and update jobs by id.
+
+    ``get`` returns a copy, so callers never see a job change under them.
+    Setting ``done`` stamps ``finished_at`` and starts the job's TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = 86400, max_jobs: int = 1000,
+                 clock: Callable[[], float] = time.time):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self.clock = clock
+        self._lock = threading.RLock()
+        # Called with each evicted job's id, under the store's lock
+        self.on_evict: Optional[Callable[[str], None]] = None
+
+    @abstractmethod
+    def create(self, job_id: str, **fields) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> None:
+        ...
+
+    @abstractmethod
+    def evict_expired(self) -> int:
+        """Drop finished jobs past their TTL; returns how many were dropped."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    def close(self) -> None:
+        """Release the store's resources; called once the server stops."""
+
+    def _new_job(self, fields) -> Dict[str, Any]:
+        job = dict(JOB_DEFAULTS, created_at=self.clock(), finished_at=None)
+        job.update(fields)
+        if job["done"] and job["finished_at"] is None:
+            job["finished_at"] = self.clock()
+        return job
+
+    def _apply(self, job: Dict[str, Any], fields) -> bool:
+        """Update ``job`` in place; True when this update finished it."""
+        finished = bool(fields.get("done")) and not job["done"]
+        job.update(fields)
+        if finished:
+            job["finished_at"] = self.clock()
+        return finished
+
+    def _expired(self, job: Dict[str, Any], now: float) -> bool:
+        return job["finished_at"] is not None and now - job["finished_at"] >= self.ttl_seconds
+
+    def _remove_outputs(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        for job in jobs:
+            path = job.get("output_path")
+            if not path or self._path_in_use(path):
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"  WARNING: Could not remove expired output {path}: {e}")
+
+    @abstractmethod
+    def _path_in_use(self, path: str) -> bool:
+        ...
+
+    def _notify_evicted(self, job_ids: Iterable[str]) -> None:
+        if self.on_evict is None:
+            return
+        for job_id in job_ids:
+            try:
+                self.on_evict(job_id)
+            except Exception as e:
+                print(f"  WARNING: Eviction hook failed for job {job_id}: {e}")
+
+
+class MemoryJobStore(JobStore):
+    """Jobs in an in-process LRU dict; lost on restart."""
+
+    def __init__(self, ttl_seconds: float = 86400, max_jobs: int = 1000,
+                 clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, max_jobs, clock)
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # LRU order
+        self._finished: "OrderedDict[str, float]" = OrderedDict()  # finish order
+        self._paths: Dict[str, int] = {}  # output path -> number of jobs linking it
+
+    def _link(self, job, delta: int) -> None:
+        path = job.get("output_path")
+        if path:
+            count = self._paths.get(path, 0) + delta
+            if count > 0:
+                self._paths[path] = count
+            else:
+                self._paths.pop(path, None)
+
+    def _path_in_use(self, path: str) -> bool:
+        return path in self._paths
+
+    def _drop(self, job_ids) -> list:
+        dropped = []
+        for job_id in job_ids:
+            job = self._jobs.pop(job_id)
+            self._finished.pop(job_id, None)
+            self._link(job, -1)
+            dropped.append(job)
+        self._notify_evicted(job_ids)
+        return dropped
+
+    def create(self, job_id: str, **fields) -> Dict[str, Any]:
+        with self._lock:
+            self.evict_expired()
+            if job_id in self._jobs:
+                self._drop([job_id])
+            job = self._jobs[job_id] = self._new_job(fields)
+            self._link(job, 1)
+            if job["done"]:
+                self._finished[job_id] = job["finished_at"]
+            # Over the limit: least recently used finished jobs go first
+            excess = len(self._jobs) - self.max_jobs
+            if excess > 0:
+                victims = [jid for jid, j in self._jobs.items() if j["done"] and jid != job_id][:excess]
+                self._remove_outputs(self._drop(victims))
+            return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if self._expired(job, self.clock()):
+                self._remove_outputs(self._drop([job_id]))
+                return None
+            self._jobs.move_to_end(job_id)
+            return dict(job)
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            self._link(job, -1)
+            if self._apply(job, fields):
+                self._finished[job_id] = job["finished_at"]
+            self._link(job, 1)
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            now = self.clock()
+            expired = []
+            # Finish times only grow, so the expired jobs are a prefix
+            for job_id, finished_at in self._finished.items():
+                if now - finished_at < self.ttl_seconds:
+                    break
+                expired.append(job_id)
+            self._remove_outputs(self._drop(expired))
+            return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    output_path TEXT,
+    finished_at REAL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_finished_at ON jobs (finished_at);
+CREATE INDEX IF NOT EXISTS jobs_output_path ON jobs (output_path);
+"""
+
+
+class SQLiteJobStore(JobStore):
+    """Jobs persisted in a SQLite database.
+
+    Running jobs are also held in memory and only written to the database
+    when created and when they finish, so progress updates cost no I/O. A
+    job still running when the process stopped is marked failed on the next
+    start. A lookup refreshes the job's LRU timestamp at most once every
+    ``USED_AT_INTERVAL`` seconds, and the row count is kept in memory.
+    """
+
+    USED_AT_INTERVAL = 60.0
+
+    def __init__(self, path: str, ttl_seconds: float = 86400, max_jobs: int = 1000,
+                 clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, max_jobs, clock)
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._active: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            self._count = self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            interrupted = self._db.execute("SELECT id, data FROM jobs WHERE finished_at IS NULL").fetchall()
+            for job_id, data in interrupted:
+                job = json.loads(data)
+                self._apply(job, {"done": True, "error": "Interrupted by a restart", "message": "Failed. See error"})
+                self._write(job_id, job)
+            self.evict_expired()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _write(self, job_id: str, job: Dict[str, Any]) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO jobs (id, data, output_path, finished_at, used_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, json.dumps(job), job.get("output_path"), job["finished_at"], self.clock()),
+        )
+
+    def _delete(self, rows) -> None:
+        if not rows:
+            return
+        cursor = self._db.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id, _ in rows])
+        self._count -= cursor.rowcount
+        self._remove_outputs(json.loads(data) for _, data in rows)
+        self._notify_evicted(job_id for job_id, _ in rows)
+
+    def _path_in_use(self, path: str) -> bool:
+        if any(job.get("output_path") == path for job in self._active.values()):
+            return True
+        return self._db.execute("SELECT 1 FROM jobs WHERE output_path = ? LIMIT 1", (path,)).fetchone() is not None
+
+    def create(self, job_id: str, **fields) -> Dict[str, Any]:
+        with self._lock:
+            self.evict_expired()
+            job = self._new_job(fields)
+            if self._db.execute("SELECT 1 FROM jobs WHERE id = ?", (job_id,)).fetchone() is None:
+                self._count += 1
+            self._write(job_id, job)
+            if not job["done"]:
+                self._active[job_id] = job
+            excess = self._count - self.max_jobs
+            if excess > 0:
+                # Least recently used finished jobs go first
+                self._delete(self._db.execute(
+                    "SELECT id, data FROM jobs WHERE finished_at IS NOT NULL AND id != ? ORDER BY used_at LIMIT ?",
+                    (job_id, excess),
+                ).fetchall())
+            return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is not None:
+                return dict(job)
+            row = self._db.execute("SELECT data, used_at FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            data, used_at = row
+            job = json.loads(data)
+            now = self.clock()
+            if self._expired(job, now):
+                self._delete([(job_id, data)])
+                return None
+            if now - used_at >= self.USED_AT_INTERVAL:
+                self._db.execute("UPDATE jobs SET used_at = ? WHERE id = ?", (now, job_id))
+            return job
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is None:
+                row = self._db.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                if row is None:
+                    return
+                job = json.loads(row[0])
+                self._apply(job, fields)
+                self._write(job_id, job)
+                return
+            if self._apply(job, fields):
+                del self._active[job_id]
+                self._write(job_id, job)
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, data FROM jobs WHERE finished_at IS NOT NULL AND finished_at <= ?",
+                (self.clock() - self.ttl_seconds,),
+            ).fetchall()
+            self._delete(rows)
+            return len(rows)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def open_job_store(spec: Optional[str], ttl_seconds: float = 86400, max_jobs: int = 1000) -> JobStore:
+    """``"memory"`` (or empty) for a :class:`MemoryJobStore`, else a SQLite database path."""
+    if not spec or spec == "memory":
+        return MemoryJobStore(ttl_seconds=ttl_seconds, max_jobs=max_jobs)
+    return SQLiteJobStore(spec, ttl_seconds=ttl_seconds, max_jobs=max_jobs)
+
+
+__all__ = ["JOB_DEFAULTS", "JobStore", "MemoryJobStore", "SQLiteJobStore", "open_job_store"]
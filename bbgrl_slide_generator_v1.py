@@ -9,20 +9,66 @@ to maintain backwards compatibility for imports like:
 
 from datetime import datetime
 from bbgrl.generator.generator import bbgrlslidegeneratorv1
+from bbgrl.generator.batch import output_filename_for
+
+
+def main_batch(argv):
+    """`generate --from YYYY-MM-DD --to YYYY-MM-DD --jobs N`: one deck per date."""
+    import argparse
+    from bbgrl.generator.batch import generate_batch
+
+    parser = argparse.ArgumentParser(prog="generate", description="Generate OLPH slide decks for a range of dates.")
+    parser.add_argument("--from", dest="start", required=True, help="First date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", required=True, help="Last date, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 runs serially)")
+    parser.add_argument("--output-dir", default="new_slides", help="Output directory (default: new_slides)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached iBreviary pages and fetch them again")
+    args = parser.parse_args(argv)
+
+    try:
+        start = datetime.strptime(args.start, "%Y-%m-%d")
+        end = datetime.strptime(args.end, "%Y-%m-%d")
+    except ValueError as e:
+        print(f"Error: Invalid date ({e}). Use YYYY-MM-DD")
+        return 2
+
+    def report(entry):
+        status = "ok" if entry["ok"] else f"FAILED ({entry['error']})"
+        print(f"  {entry['date']}: {status}")
+
+    manifest = generate_batch(start, end, jobs=args.jobs, output_dir=args.output_dir,
+                              refresh=args.refresh, progress_callback=report)
+    failed = [e for e in manifest if not e["ok"]]
+    print(f"\n✓ {len(manifest) - len(failed)}/{len(manifest)} decks written to {args.output_dir}/ (manifest.json)")
+    return 1 if failed else 0
 
 
 def main():
+    import argparse
     import sys
 
+    if sys.argv[1:2] == ["generate"]:
+        sys.exit(main_batch(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description="Generate the OLPH slides deck for a date.")
+    parser.add_argument("date", nargs="?", help="Date in MM-DD-YYYY format (default: 11-11-2025)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached iBreviary pages and fetch them again")
+    parser.add_argument("--full", action="store_true",
+                        help="Rebuild every section, even when an existing deck for the date is partly up to date")
+    args = parser.parse_args()
+
     print("BBGRL Slide Generator V1 - Template-Based Dynamic Generator")
     print("=" * 60)
     print("Fetching live liturgical data and applying reference structure...")
 
-    generator = bbgrlslidegeneratorv1()
+    generator = bbgrlslidegeneratorv1(refresh=args.refresh, incremental=not args.full)
 
     # Accept optional date arg in format MM-DD-YYYY; default to a sample date
-    if len(sys.argv) > 1:
-        date_str = sys.argv[1]
+    if args.date:
+        date_str = args.date
         try:
             target_date = datetime.strptime(date_str, "%m-%d-%Y")
         except ValueError:
@@ -35,7 +81,7 @@ def main():
     liturgical_data = generator.fetch_live_liturgical_data(target_date)
 
     # Build requested filename and directory: olph_slides_[MM]_[DD]_[YYYY].pptx in new_slides/
-    out_name = f"olph_slides_{target_date.month:02d}_{target_date.day:02d}_{target_date.year}.pptx"
+    out_name = output_filename_for(target_date)
     generator.create_presentation_from_template(
         liturgical_data,
         output_filename=out_name,
@@ -47,4 +93,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Batch mode spawns worker processes; needed for frozen Windows builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -47,6 +47,7 @@ pyinstaller --noconfirm --onefile ^
   --collect-all lxml ^
   --collect-all pptx ^
   --collect-all requests ^
+  --collect-all waitress ^
   "%ENTRY%"
 if errorlevel 1 (
   echo Build failed.
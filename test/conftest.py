@@ -0,0 +1,54 @@
+"""Shared test data."""
+
+import os
+
+import pytest
+
+from bbgrl.generator.parsers import (
+    extract_gospel_acclamation,
+    extract_gospel_citation,
+    extract_gospel_verses,
+    extract_psalm_citation,
+    extract_psalm_response_verses,
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+READINGS_HTML = """<html><body><div id="contenuto">
+<p><span class="titolo">Responsorial Psalm</span> <span class="citazione">Ps 34:2-3, 16-19</span></p>
+<p>R. :</p>
+<p><span class="rubrica">℟.</span> (2) I will bless the Lord at all times.<br>or:<br>℟. Alleluia.</p>
+<p>I will bless the LORD at all times;<br>his praise shall be ever in my mouth.<br>Let my soul glory in the LORD;<br>the lowly will hear me and be glad.<br><br>℟. I will bless the Lord at all times.</p>
+<hr>
+<p><span class="titolo">Acclamation before the Gospel</span> <span class="citazione">Jn 8:12</span></p>
+<p><span class="rubrica">℟.</span> <strong>Alleluia, alleluia.</strong><br>I am the light of the world, says the Lord;<br>whoever follows me will have the light of life.</p>
+<p><span class="titolo">Gospel</span> <span class="citazione">Lk 17:7-10</span></p>
+<p>The Lord be with you.</p>
+<p><strong>A reading from the holy Gospel according to Luke</strong><br><br>Jesus said to the Apostles:<br>"Who among you would say to your servant?"<br><strong>The Gospel of the Lord.</strong></p>
+</div></body></html>"""
+
+EXTRACTORS = (
+    extract_psalm_citation,
+    extract_psalm_response_verses,
+    extract_gospel_acclamation,
+    extract_gospel_citation,
+    extract_gospel_verses,
+)
+
+
+@pytest.fixture
+def readings_html():
+    """Excerpt of an iBreviary Mass readings page (psalm, acclamation, Gospel)."""
+    return READINGS_HTML
+
+
+@pytest.fixture
+def readings_extractors():
+    return EXTRACTORS
+
+
+@pytest.fixture
+def lauds_html():
+    """An English Morning Prayer page in iBreviary's markup, every section present."""
+    with open(os.path.join(FIXTURES, "lauds_en.html"), encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,70 @@
+"""Tests for multi-date batch generation."""
+
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+import bbgrl.generator.generator as generator_module
+from bbgrl.generator import batch
+
+
+class FakeGenerator:
+    instances = 0
+
+    def __init__(self, refresh=False, fit_jobs=None):
+        FakeGenerator.instances += 1
+        self.fit_jobs = fit_jobs
+
+    def fetch_live_liturgical_data(self, target_date=None, progress_callback=None):
+        if target_date.day == 3:
+            raise RuntimeError("iBreviary unavailable")
+        # Earlier dates finish later, so completion order is not date order
+        time.sleep((5 - target_date.day) * 0.05)
+        return {"date": target_date}
+
+    def create_presentation_from_template(self, liturgical_data, output_filename=None, output_dir=None):
+        path = os.path.join(output_dir, output_filename)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"{os.getpid()} {self.fit_jobs}")
+        return path
+
+
+def test_serial_batch_writes_manifest_per_date(tmp_path, monkeypatch):
+    monkeypatch.setattr(generator_module, "bbgrlslidegeneratorv1", FakeGenerator)
+    FakeGenerator.instances = 0
+    manifest = batch.generate_batch(datetime(2026, 11, 1), datetime(2026, 11, 4), jobs=1,
+                                    output_dir=str(tmp_path))
+
+    assert [e["date"] for e in manifest] == ["2026-11-01", "2026-11-02", "2026-11-03", "2026-11-04"]
+    assert [e["ok"] for e in manifest] == [True, True, False, True]
+    assert "iBreviary unavailable" in manifest[2]["error"]
+    assert manifest[0]["output_path"].endswith("olph_slides_11_01_2026.pptx")
+    assert FakeGenerator.instances == 1
+    with open(os.path.join(str(tmp_path), batch.MANIFEST_NAME), encoding="utf-8") as f:
+        assert json.load(f) == manifest
+
+
+def test_parallel_batch_keeps_date_order_and_isolates_failures(tmp_path):
+    finished = []
+    manifest = batch.generate_batch(datetime(2026, 11, 1), datetime(2026, 11, 4), jobs=2,
+                                    output_dir=str(tmp_path), generator_factory=FakeGenerator,
+                                    progress_callback=lambda entry: finished.append(entry["date"]))
+
+    assert [e["date"] for e in manifest] == ["2026-11-01", "2026-11-02", "2026-11-03", "2026-11-04"]
+    assert sorted(finished) == [e["date"] for e in manifest]
+    assert [e["ok"] for e in manifest] == [True, True, False, True]
+    assert "iBreviary unavailable" in manifest[2]["error"]
+    decks = [open(e["output_path"], encoding="utf-8").read().split() for e in manifest if e["ok"]]
+    # Each worker builds its own generator with a serial fit pass
+    assert {fit_jobs for _, fit_jobs in decks} == {"1"}
+    assert str(os.getpid()) not in {pid for pid, _ in decks}
+    with open(os.path.join(str(tmp_path), batch.MANIFEST_NAME), encoding="utf-8") as f:
+        assert json.load(f) == manifest
+
+
+def test_rejects_reversed_range():
+    with pytest.raises(ValueError):
+        batch.iter_dates(datetime(2026, 11, 30), datetime(2026, 11, 1))
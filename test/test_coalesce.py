@@ -0,0 +1,45 @@
+"""Tests for in-flight request coalescing."""
+
+import threading
+
+import pytest
+
+from bbgrl.jobs import QueueFull, RequestCoalescer
+
+
+def test_identical_requests_share_one_job():
+    coalescer = RequestCoalescer()
+    started = []
+
+    def start():
+        started.append(f"job{len(started)}")
+        return started[-1]
+
+    key = ("2025-12-09", (("refresh", False),))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalescer.attach_or_start(key, start)))
+               for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert started == ["job0"]
+    assert sorted(results) == [("job0", False)] + [("job0", True)] * 4
+    assert coalescer.coalesced == 4
+
+    other = ("2025-12-09", (("refresh", True),))
+    assert coalescer.attach_or_start(other, start) == ("job1", False)
+
+    coalescer.finish(key, "job0")
+    assert coalescer.attach_or_start(key, start) == ("job2", False)
+
+
+def test_failed_start_is_not_registered():
+    coalescer = RequestCoalescer()
+
+    def full():
+        raise QueueFull("busy")
+
+    with pytest.raises(QueueFull):
+        coalescer.attach_or_start("key", full)
+    assert coalescer.job_for("key") is None and coalescer.coalesced == 0
@@ -0,0 +1,51 @@
+"""Tests for incremental deck regeneration."""
+
+from bbgrl.generator.cache import FitCache
+from bbgrl.generator.deckindex import index_path
+from bbgrl.generator.fallbacks import get_fallback_data
+from bbgrl.generator.generator import bbgrlslidegeneratorv1
+from bbgrl.generator.library import SlideLibrary
+
+from test.test_ooxml import _assert_same_package
+
+
+def _generator(tmp_path, **kwargs):
+    return bbgrlslidegeneratorv1(
+        html_cache=False, fit_cache=FitCache(root=str(tmp_path / "fit")), fit_jobs=1,
+        static_library=SlideLibrary(root=str(tmp_path / "library")), **kwargs,
+    )
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_regeneration_rebuilds_only_changed_sections(tmp_path, capsys):
+    gen = _generator(tmp_path)
+    out = str(tmp_path / "out")
+    path = gen.create_presentation_from_template(get_fallback_data(), output_dir=out)
+    assert (tmp_path / "out" / index_path(path)).exists()
+    assert "Incremental build" not in capsys.readouterr().out
+
+    data = get_fallback_data()
+    data["morning_prayer"]["gospel_canticle"]["antiphon"] = "Blessed be the Lord, the God of Israel."
+    assert gen.create_presentation_from_template(data, output_dir=out) == path
+    log = capsys.readouterr().out
+    assert "Incremental build: rebuilt 1 changed section(s) (gospel_canticle_section)" in log
+    assert "(static library)" not in log
+
+    full = _generator(tmp_path, incremental=False).create_presentation_from_template(
+        data, output_dir=str(tmp_path / "full"))
+    assert "Incremental build" not in capsys.readouterr().out
+    _assert_same_package(_read(path), _read(full))
+
+
+def test_changed_deck_is_rebuilt_in_full(tmp_path, capsys):
+    gen = _generator(tmp_path)
+    path = gen.create_presentation_from_template(get_fallback_data(), output_dir=str(tmp_path))
+    with open(path, "ab") as f:
+        f.write(b"edited")
+    capsys.readouterr()
+    gen.create_presentation_from_template(get_fallback_data(), output_dir=str(tmp_path))
+    assert "Incremental build" not in capsys.readouterr().out
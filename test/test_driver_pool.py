@@ -0,0 +1,129 @@
+"""Tests for the shared WebDriver pool (no real browser involved)."""
+
+import threading
+import time
+
+from bbgrl.generator.driver_pool import WebDriverPool
+from bbgrl.generator.scraper import IBreviaryScraper
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.crashed = False
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _pool(**kwargs):
+    created = []
+
+    def factory():
+        d = _FakeDriver()
+        created.append(d)
+        return d
+
+    return WebDriverPool(factory=factory, **kwargs), created
+
+
+def test_released_driver_is_reused_across_scrapers():
+    pool, created = _pool(size=1)
+    first = IBreviaryScraper("https://example.invalid/", pool=pool)
+    with first.pool.driver() as d1:
+        pass
+    second = IBreviaryScraper("https://example.invalid/", pool=pool)
+    with second.pool.driver() as d2:
+        assert d2 is d1
+    assert len(created) == 1
+
+
+def test_driver_that_errors_is_recycled():
+    pool, created = _pool(size=1)
+    try:
+        with pool.driver() as d1:
+            raise RuntimeError("navigation failed")
+    except RuntimeError:
+        pass
+    with pool.driver() as d2:
+        assert d2 is not d1 and d1.quit_called
+    assert len(created) == 2
+
+
+def test_crashed_idle_driver_is_replaced():
+    pool, created = _pool(size=1)
+    d1 = pool.acquire()
+    pool.release(d1)
+    d1.crashed = True
+    d2 = pool.acquire()
+    assert d2 is not d1 and d1.quit_called
+
+
+def test_idle_drivers_are_evicted():
+    pool, created = _pool(size=1, idle_timeout=0.01)
+    d1 = pool.acquire()
+    pool.release(d1)
+    time.sleep(0.05)
+    d2 = pool.acquire()
+    assert d2 is not d1 and d1.quit_called
+    pool.close()
+
+
+def test_expired_drivers_are_quit_outside_the_lock():
+    pool, created = _pool(size=2, idle_timeout=0.01)
+    quit_locked = []
+
+    def quit_checking_lock(driver):
+        quit_locked.append(pool._cond._is_owned())
+        driver.quit_called = True
+
+    drivers = [pool.acquire(), pool.acquire()]
+    for d in drivers:
+        d.quit = lambda d=d: quit_checking_lock(d)
+        pool.release(d)
+    drivers[1].crashed = True
+    time.sleep(0.05)
+    pool.acquire()
+    assert quit_locked == [False, False]
+    pool.close()
+
+
+def test_health_probe_runs_outside_the_lock():
+    pool, created = _pool(size=2)
+    probing, unblock = threading.Event(), threading.Event()
+
+    class _HungDriver(_FakeDriver):
+        @property
+        def current_url(self):
+            probing.set()
+            unblock.wait(5)
+            return "about:blank"
+
+    hung, other = pool.acquire(), pool.acquire()
+    hung.__class__ = _HungDriver
+    pool.release(hung)
+    got = []
+    prober = threading.Thread(target=lambda: got.append(pool.acquire()))
+    prober.start()
+    assert probing.wait(5)
+    # While the probe hangs, the rest of the pool keeps working
+    reused = []
+
+    def release_and_acquire():
+        pool.release(other)
+        reused.append(pool.acquire(timeout=1))
+
+    worker = threading.Thread(target=release_and_acquire)
+    worker.start()
+    worker.join(1)
+    assert reused == [other]
+    unblock.set()
+    prober.join(5)
+    assert got == [hung]
+    pool.close()
@@ -0,0 +1,92 @@
+"""Tests for the process-wide font metrics cache and the font index."""
+
+import glob
+import os
+import shutil
+
+import pytest
+from PIL import features
+
+from bbgrl.generator.fonts import FontCache, FontIndex
+
+
+def test_repeated_lookups_reuse_the_loaded_font():
+    cache = FontCache(max_fonts=4)
+    first = cache.get(None, 12)
+    assert cache.get(None, 40) is first  # default font ignores size
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.length("Glory to the Father") == first.length("Glory to the Father") > 0
+    assert first.advance("G") > 0
+
+
+def test_least_recently_used_font_is_evicted():
+    cache = FontCache(max_fonts=2)
+    a = cache.get("missing-a.ttf", 10)
+    cache.get("missing-b.ttf", 10)
+    assert cache.get("missing-a.ttf", 10) is a
+    cache.get("missing-c.ttf", 10)
+    assert len(cache) == 2
+    misses = cache.misses
+    cache.get("missing-b.ttf", 10)
+    assert cache.misses == misses + 1
+    # A font file that fails to load is measured with the default font
+    assert a.path is None and not a.scalable
+
+
+def _system_fonts():
+    # Pillow wheels ship no .ttf files, so borrow whatever the host has
+    found = []
+    for pattern in ("/usr/share/fonts/**/*.ttf", "/Library/Fonts/*.ttf",
+                    os.path.join(os.environ.get("WINDIR", "C:/Windows"), "Fonts", "*.ttf")):
+        found += glob.glob(pattern, recursive=True)
+    return found[:2] if features.check("freetype2") else []
+
+
+def test_font_index_substitutes_and_rescans_on_change(tmp_path):
+    fonts = _system_fonts()
+    if len(fonts) < 2:
+        pytest.skip("needs two installed TrueType fonts")
+    font_dir = tmp_path / "fonts"
+    (font_dir / "sub").mkdir(parents=True)
+    first = shutil.copy(fonts[0], font_dir / "sub")
+    cache_path = str(tmp_path / "fonts.json")
+
+    probe = FontIndex([str(font_dir)], cache_path)
+    family = probe.families()[0]
+    assert probe.scanned and probe.find(family) == first
+
+    index = FontIndex([str(font_dir)], cache_path, substitutes={"georgia": ["Missing", family]})
+    assert index.find("Georgia", bold=True) == first
+    assert index.find("Unknown") is None
+    assert not index.scanned  # served from the on-disk index
+
+    second = shutil.copy(fonts[1], font_dir / "sub")
+    os.utime(font_dir / "sub", ns=(0, os.stat(font_dir / "sub").st_mtime_ns + 10**9))
+    index = FontIndex([str(font_dir)], cache_path)
+    found = {index.find(f, bold=b) for f in index.families() for b in (False, True)}
+    assert index.scanned and {first, second} <= found
+
+
+def test_font_changes_are_picked_up_by_a_running_process(tmp_path, monkeypatch):
+    from bbgrl.generator import fonts
+
+    monkeypatch.setattr(fonts, "_read_face", lambda path: (os.path.basename(path).split(".")[0], "Regular"))
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    (font_dir / "Alpha.ttf").write_bytes(b"")
+    index = FontIndex([str(font_dir)], str(tmp_path / "fonts.json"), recheck_seconds=3600)
+    monkeypatch.setattr(fonts, "_font_index", index)
+
+    generation = fonts.font_generation()
+    assert fonts.font_path_for("Beta", False, False) is None
+
+    (font_dir / "Beta.ttf").write_bytes(b"")
+    os.utime(font_dir, ns=(0, os.stat(font_dir).st_mtime_ns + 10**9))
+    # Not re-checked before recheck_seconds...
+    assert fonts.font_generation() == generation
+    assert fonts.font_path_for("Beta", False, False) is None
+    # ...and picked up, with a new generation for dependent caches, after it
+    index.refresh()
+    assert fonts.font_generation() == generation + 1
+    assert fonts.font_path_for("Beta", False, False) == str(font_dir / "Beta.ttf")
+    assert "Beta" in {f.title() for f in index.families()}
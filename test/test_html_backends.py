@@ -0,0 +1,107 @@
+"""Every HTML backend must yield identical structured output."""
+
+import contextlib
+import io
+import os
+
+import pytest
+
+from bbgrl.generator import parsers
+from bbgrl.generator.generator import bbgrlslidegeneratorv1
+from bbgrl.generator.parsers import ParsedPage
+
+# Italian page: the span lookups are checked on it, the structured parse on
+# the English Lauds fixture (conftest.lauds_html)
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "morning_prayer_2025_12_09.html")
+
+
+def _available_backends():
+    backends = [("html.parser", False)]
+    try:
+        import lxml  # noqa: F401
+        backends.append(("lxml", False))
+    except ImportError:
+        pass
+    try:
+        import selectolax  # noqa: F401
+        backends.extend((parser, True) for parser, _ in list(backends))
+    except ImportError:
+        pass
+    return backends
+
+
+BACKENDS = _available_backends()
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    yield
+    parsers.set_html_backend()
+
+
+def _structured_morning_prayer(html):
+    generator = bbgrlslidegeneratorv1(html_cache=False)
+    generator._navigate_ibreviary_to_date = lambda target_date, refresh=False: html
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generator._fetch_morning_prayer_structured(None)
+
+
+def _results_per_backend(run):
+    results = {}
+    for parser, selectolax in BACKENDS:
+        parsers.set_html_backend(parser, selectolax=selectolax)
+        results[(parser, selectolax)] = run()
+    return results
+
+
+def test_morning_prayer_fixture_is_backend_independent(lauds_html):
+    results = _results_per_backend(lambda: _structured_morning_prayer(lauds_html))
+    reference = results[("html.parser", False)]
+    # The fixture is parsed for real, not answered from fallbacks
+    psalmody = reference["psalmody"]
+    assert psalmody["antiphon_1"]["text"].startswith("See, the Lord will come to save his people")
+    assert psalmody["antiphon_1"]["psalm_title"] == "Psalm 85"
+    assert psalmody["psalm_1"][0]["text"].startswith("O Lord, you once favored your land")
+    assert psalmody["canticle_info"]["title"] == "Canticle: Isaiah 40:10-17"
+    assert psalmody["canticle"]["verses"][1]["text"].startswith("Like a shepherd he feeds his flock")
+    assert psalmody["psalm_3"][0]["text"].startswith("The Lord is king, let earth rejoice")
+    assert reference["reading"]["short_reading"]["citation"] == "Isaiah 62:11-12"
+    assert len(reference["reading"]["responsory"]) == 3
+    assert reference["gospel_canticle"]["antiphon"].startswith("A voice cries out in the wilderness")
+    assert reference["intercessions"][0]["response_line"] == "Come, Lord Jesus!"
+    assert reference["concluding_prayer"].endswith("— Amen.")
+    for backend, result in results.items():
+        assert result == reference, backend
+
+
+def test_fixture_span_lookups_are_backend_independent():
+    with open(FIXTURE, encoding="utf-8") as f:
+        html = f.read()
+
+    def lookups():
+        page = ParsedPage(html)
+        return {cls: page.span_texts(cls) for cls in ("rubrica", "titolo", "citazione")}
+
+    results = _results_per_backend(lookups)
+    reference = results[("html.parser", False)]
+    assert reference["rubrica"][0] == "INVITATORIO"
+    assert "SALMO 94\xa0 Invito a lodare Dio" in reference["rubrica"]
+    for backend, result in results.items():
+        assert result == reference, backend
+
+
+def test_readings_extractors_are_backend_independent(readings_html, readings_extractors):
+    def extract_all():
+        page = ParsedPage(readings_html)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [extract(page) for extract in readings_extractors]
+
+    results = _results_per_backend(extract_all)
+    reference = results[("html.parser", False)]
+    for backend, result in results.items():
+        assert result == reference, backend
+
+
+def test_unknown_parser_is_rejected():
+    with pytest.raises(ValueError):
+        parsers.set_html_backend("html5")
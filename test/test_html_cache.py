@@ -0,0 +1,65 @@
+"""Tests for the on-disk HTML and fit caches."""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from bbgrl.generator.cache import FitCache, HtmlCache
+
+
+def test_roundtrip_is_keyed_by_date_and_page(tmp_path):
+    cache = HtmlCache(root=str(tmp_path))
+    day = datetime(2025, 12, 9)
+    cache.put(day, "morning_prayer", "<html>lodi</html>")
+    assert cache.get(day, "morning_prayer") == "<html>lodi</html>"
+    assert cache.get(day, "readings") is None
+    assert cache.get(day + timedelta(days=1), "morning_prayer") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = HtmlCache(root=str(tmp_path), ttl_seconds=60)
+    day = datetime(2025, 12, 9)
+    cache.put(day, "readings", "<html>letture</html>")
+    path = os.path.join(str(tmp_path), HtmlCache.key(day, "readings") + ".html.gz")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert cache.get(day, "readings") is None
+    assert not os.path.exists(path)
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    cache = HtmlCache(root=str(tmp_path), max_bytes=10 ** 9)
+    days = [datetime(2025, 12, d) for d in (1, 2, 3)]
+    for i, day in enumerate(days):
+        cache.put(day, "readings", os.urandom(2000).hex())
+        path = os.path.join(str(tmp_path), HtmlCache.key(day, "readings") + ".html.gz")
+        os.utime(path, (1000 + i, time.time()))
+    # Touch the oldest entry so the second one becomes least recently used
+    assert cache.get(days[0], "readings")
+    cache.max_bytes = 2 * os.path.getsize(path) + 100
+    cache.put(datetime(2025, 12, 4), "readings", os.urandom(2000).hex())
+    assert cache.get(days[0], "readings") is not None
+    assert cache.get(days[1], "readings") is None
+
+
+def test_fit_cache_tracks_size_without_rescanning(tmp_path, monkeypatch):
+    from bbgrl.generator import cache as cache_mod
+
+    scans = []
+    real_list = cache_mod._list_entries
+    monkeypatch.setattr(cache_mod, "_list_entries", lambda *a: scans.append(1) or real_list(*a))
+    cache = FitCache(root=str(tmp_path), max_bytes=10 ** 9)
+    for i in range(100):
+        cache.put(f"{i:064x}", {"size": i, "wrapped": []})
+    assert len(scans) == 1
+
+    entry = os.path.getsize(os.path.join(str(tmp_path), f"{0:064x}.json"))
+    for i in range(100):
+        os.utime(os.path.join(str(tmp_path), f"{i:064x}.json"), (1000 + i, time.time()))
+    cache.max_bytes = 50 * entry
+    cache.put("f" * 64, {"size": 0, "wrapped": []})
+    remaining = sorted(os.listdir(str(tmp_path)))
+    # Trimmed below the cap, least recently read first, with one more scan
+    assert len(scans) == 2
+    assert len(remaining) <= 45
+    assert f"{0:064x}.json" not in remaining and f"{99:064x}.json" in remaining
@@ -0,0 +1,68 @@
+"""Tests for job progress notifications."""
+
+import threading
+import time
+
+from bbgrl.jobs import JobEvents, MemoryJobStore
+
+
+def test_updates_wake_waiters_and_version_the_job():
+    events = JobEvents(MemoryJobStore())
+    events.store.create("a")
+    version, job = events.snapshot("a")
+    assert job["percent"] == 0
+    assert not events.wait("a", version, timeout=0.01)
+
+    woke = []
+    waiter = threading.Thread(target=lambda: woke.append(events.wait("a", version, timeout=5)))
+    waiter.start()
+    events.update("a", percent=10, message="Fetching")
+    events.update("a", percent=20, message="Rendering")
+    waiter.join()
+    assert woke == [True]
+
+    # A snapshot is the latest state; the burst of updates collapses into it
+    latest, job = events.snapshot("a")
+    assert latest == version + 2
+    assert job["percent"] == 20 and job["version"] == latest
+    # An update that lands between a snapshot and the wait is not missed
+    events.update("a", percent=30)
+    assert events.wait("a", latest, timeout=0)
+    assert events.wait("missing", 0, timeout=0)
+
+
+def test_waiters_only_wake_for_their_own_job():
+    events = JobEvents(MemoryJobStore())
+    for job_id in ("a", "b"):
+        events.store.create(job_id)
+    woke = {}
+
+    def wait(job_id):
+        version, _ = events.snapshot(job_id)
+        woke[job_id] = events.wait(job_id, version, timeout=0.5)
+
+    waiters = [threading.Thread(target=wait, args=(job_id,)) for job_id in ("a", "b")]
+    for waiter in waiters:
+        waiter.start()
+    while len(events._waiters) < 2:
+        time.sleep(0.01)
+    events.update("a", percent=10)
+    waiters[0].join()
+    assert woke == {"a": True}
+    waiters[1].join()
+    assert woke == {"a": True, "b": False}
+    assert not events._waiters
+
+
+def test_touch_wakes_waiters_without_changing_the_job():
+    events = JobEvents(MemoryJobStore())
+    events.store.create("a")
+    version, _ = events.snapshot("a")
+    woke = []
+    waiter = threading.Thread(target=lambda: woke.append(events.wait("a", version, timeout=5)))
+    waiter.start()
+    while "a" not in events._waiters:
+        time.sleep(0.01)
+    events.touch(["a", "missing"])
+    waiter.join()
+    assert woke == [True] and events.snapshot("a")[0] == version
@@ -0,0 +1,94 @@
+"""Tests for the bounded UI job scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from bbgrl.jobs import JobScheduler, QueueFull
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_queue_is_fifo_with_positions_and_backpressure():
+    scheduler = JobScheduler(workers=1, max_queue=2)
+    release = threading.Event()
+    order = []
+    moved = []
+    scheduler.on_queue_moved = moved.append
+
+    def job(name):
+        order.append(name)
+        release.wait(5)
+
+    assert scheduler.submit("a", job, "a") == 1
+    _wait_for(lambda: scheduler.position("a") == 0)
+    assert scheduler.submit("b", job, "b") == 1
+    assert scheduler.submit("c", job, "c") == 2
+    with pytest.raises(QueueFull):
+        scheduler.submit("d", job, "d")
+    assert scheduler.position("c") == 2 and scheduler.position("d") is None
+
+    release.set()
+    assert scheduler.shutdown(timeout=5)
+    assert order == ["a", "b", "c"]
+    assert scheduler.position("a") is None
+    assert moved == [["c"]]  # b left the queue with c still behind it
+
+
+def test_stage_limits_bound_concurrency_per_stage():
+    scheduler = JobScheduler(workers=3, max_queue=10, stage_limits={"render": 1})
+    lock = threading.Lock()
+    active = {"render": 0, "scrape": 0}
+    peak = {"render": 0, "scrape": 0}
+
+    def job():
+        for stage in ("scrape", "render"):
+            with scheduler.stage(stage):
+                with lock:
+                    active[stage] += 1
+                    peak[stage] = max(peak[stage], active[stage])
+                time.sleep(0.05)
+                with lock:
+                    active[stage] -= 1
+
+    for i in range(3):
+        scheduler.submit(str(i), job)
+    assert scheduler.shutdown(timeout=5)
+    assert peak["render"] == 1
+    assert peak["scrape"] > 1  # unlimited stage
+
+
+def test_shutdown_drains_running_jobs_within_timeout():
+    scheduler = JobScheduler(workers=1, max_queue=5)
+    release = threading.Event()
+    scheduler.submit("a", release.wait, 5)
+    scheduler.submit("b", lambda: None)
+
+    assert not scheduler.shutdown(timeout=0.1)  # "a" still running
+    assert scheduler.closed
+    with pytest.raises(QueueFull):
+        scheduler.submit("c", lambda: None)
+
+    release.set()
+    assert scheduler.shutdown(timeout=5)
+    assert scheduler.queued == 0 and scheduler.running == 0
+
+
+def test_abandon_drops_queued_jobs_and_reports_unfinished_ones():
+    scheduler = JobScheduler(workers=1, max_queue=5)
+    release = threading.Event()
+    ran = []
+    scheduler.submit("a", release.wait, 5)
+    _wait_for(lambda: scheduler.position("a") == 0)
+    scheduler.submit("b", ran.append, "b")
+    assert scheduler.abandon() == ["a", "b"]
+    assert scheduler.closed and scheduler.queued == 0
+    release.set()
+    assert scheduler.shutdown(timeout=5)
+    assert ran == []
@@ -0,0 +1,122 @@
+"""Tests for the UI job stores."""
+
+import pytest
+
+from bbgrl.jobs import MemoryJobStore, SQLiteJobStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    stores = []
+
+    def make(**kwargs):
+        if request.param == "memory":
+            store = MemoryJobStore(**kwargs)
+        else:
+            store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), **kwargs)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        if isinstance(store, SQLiteJobStore):
+            store.close()
+
+
+def test_jobs_are_created_updated_and_copied(make_store):
+    jobs = make_store()
+    job = jobs.create("a", message="Starting...")
+    assert job["percent"] == 0 and not job["done"]
+    jobs.update("a", percent=40, message="Fetching")
+    snapshot = jobs.get("a")
+    snapshot["percent"] = 99
+    assert jobs.get("a")["percent"] == 40
+    jobs.update("missing", percent=1)
+    assert jobs.get("missing") is None and "missing" not in jobs
+
+
+def test_finished_jobs_expire_and_remove_unshared_outputs(make_store, tmp_path):
+    clock = Clock()
+    jobs = make_store(ttl_seconds=60, clock=clock)
+    shared, own = tmp_path / "shared.pptx", tmp_path / "own.pptx"
+    shared.write_bytes(b"deck")
+    own.write_bytes(b"deck")
+    jobs.create("old")
+    jobs.update("old", done=True, output_path=str(own))
+    jobs.create("a", done=True, output_path=str(shared))
+    clock.now += 30
+    jobs.create("b", done=True, output_path=str(shared))
+    jobs.create("running")
+
+    clock.now += 40
+    assert jobs.evict_expired() == 2
+    assert jobs.get("old") is None and jobs.get("a") is None
+    assert not own.exists()
+    assert shared.exists()  # still linked from "b"
+    clock.now += 1000
+    assert jobs.get("b") is None
+    assert not shared.exists()
+    assert jobs.get("running") is not None and len(jobs) == 1
+
+
+def test_least_recently_used_finished_jobs_go_past_the_limit(make_store):
+    clock = Clock()
+    jobs = make_store(max_jobs=3, clock=clock)
+    evicted = []
+    jobs.on_evict = evicted.append
+    for job_id in ("a", "b", "c"):
+        jobs.create(job_id, done=True)
+        clock.now += 100
+    jobs.get("a")
+    clock.now += 100
+    jobs.create("d")
+    assert jobs.get("b") is None
+    assert all(jobs.get(job_id) for job_id in ("a", "c", "d"))
+    assert evicted == ["b"]
+    assert len(jobs) == 3
+
+
+def test_sqlite_store_throttles_lookups_and_counts_rows_in_memory(tmp_path):
+    clock = Clock()
+    jobs = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), max_jobs=2, clock=clock)
+    statements = []
+    jobs._db.set_trace_callback(statements.append)
+    jobs.create("a", done=True)
+    jobs.create("a", done=True)
+    assert len(jobs) == 1
+    for _ in range(10):
+        clock.now += 1
+        assert jobs.get("a")["done"]
+    clock.now += SQLiteJobStore.USED_AT_INTERVAL
+    jobs.get("a")
+    for job_id in ("b", "c"):
+        clock.now += 1
+        jobs.create(job_id, done=True)
+    assert len(jobs) == 2 and jobs.get("a") is None
+    assert sum(s.startswith("UPDATE") for s in statements) == 1
+    assert not any("COUNT(" in s for s in statements)
+    jobs.close()
+
+
+def test_sqlite_store_keeps_finished_jobs_across_restarts(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    jobs = SQLiteJobStore(path)
+    jobs.create("done")
+    jobs.update("done", percent=100, done=True, filename="deck.pptx")
+    jobs.create("running")
+    jobs.update("running", percent=50)
+    jobs.close()
+
+    jobs = SQLiteJobStore(path)
+    assert jobs.get("done")["filename"] == "deck.pptx"
+    interrupted = jobs.get("running")
+    assert interrupted["done"] and interrupted["error"]
+    jobs.close()
@@ -0,0 +1,53 @@
+"""Tests for lazy loading of the generator package and the import profiler."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_package_import_defers_heavy_dependencies():
+    out = _run(
+        "import sys, bbgrl.generator as g\n"
+        "print(sorted(m for m in ('pptx', 'selenium', 'requests', 'bs4') if m in sys.modules))\n"
+        "g.extract_antiphon\n"
+        "print('bbgrl.generator.parsers' in sys.modules, 'selenium' in sys.modules)\n"
+    )
+    assert out.split("\n")[:2] == ["[]", "True False"]
+
+
+def test_lazy_names_resolve_and_unknown_names_raise():
+    import bbgrl.generator as g
+    from bbgrl.generator.parsers import ParsedPage
+
+    assert g.ParsedPage is ParsedPage
+    assert "bbgrlslidegeneratorv1" in dir(g)
+    assert set(g.__all__) <= set(dir(g))
+    with pytest.raises(AttributeError, match="no_such_name"):
+        g.no_such_name
+
+
+def test_import_profiler_records_nested_imports():
+    # In a fresh interpreter, so the imports being timed really execute
+    out = _run(
+        "import sys\n"
+        "from bbgrl.importprofile import ImportProfiler\n"
+        "profiler = ImportProfiler.install()\n"
+        "import colorsys, xml.dom.minidom\n"
+        "profiler.uninstall()\n"
+        "records = {r.name: r for r in profiler.records}\n"
+        "print(records['colorsys'].depth, records['xml.dom.minidom'].depth, records['xml.dom'].depth,"
+        " records['xml.dom.minicompat'].depth)\n"
+        "print(records['xml.dom.minidom'].cumulative >= records['xml.dom.minicompat'].cumulative)\n"
+        "print(xml.dom.minidom.__loader__ is xml.dom.minidom.__spec__.loader,"
+        " type(xml.dom.minidom.__loader__).__name__)\n"
+        "profiler.report(sys.stdout, min_seconds=0)\n"
+    )
+    lines = out.split("\n")
+    assert lines[:3] == ["0 0 0 1", "True", "True SourceFileLoader"]
+    assert lines[3] == "import time: self [us] | cumulative | imported package"
+    assert any(line.endswith("|   xml.dom.minicompat") for line in lines)
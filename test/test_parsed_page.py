@@ -0,0 +1,28 @@
+"""A ParsedPage is parsed once and gives the same results as raw HTML."""
+
+from bbgrl.generator import parsers
+from bbgrl.generator.parsers import ParsedPage, extract_gospel_citation
+
+
+def test_page_matches_raw_html_results(readings_html, readings_extractors):
+    page = ParsedPage(readings_html)
+    for extract in readings_extractors:
+        assert extract(page) == extract(readings_html), extract.__name__
+    assert extract_gospel_citation(page) == "Lk 17:7-10"
+
+
+def test_full_document_is_parsed_once(monkeypatch, readings_html, readings_extractors):
+    real_bs4 = parsers._bs4
+    full_parses = []
+
+    def counting_bs4(markup):
+        if markup is readings_html:
+            full_parses.append(1)
+        return real_bs4(markup)
+
+    monkeypatch.setattr(parsers, "_bs4", counting_bs4)
+    page = ParsedPage(readings_html)
+    for extract in readings_extractors:
+        extract(page)
+    assert page.text is page.text
+    assert len(full_parses) == 1
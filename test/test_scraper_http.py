@@ -0,0 +1,113 @@
+"""Tests for the HTTP (browser-free) iBreviary navigation path."""
+
+from datetime import datetime
+
+from bbgrl.generator import scraper as scraper_mod
+from bbgrl.generator.scraper import IBreviaryScraper
+
+
+OPTIONS_HTML = '''
+<html><body>
+<form action="opzioni.php" method="post">
+  <input type="text" name="giorno" value="1" />
+  <select name="mese">
+    <option value="1" selected>gennaio</option><option value="2">febbraio</option>
+    <option value="3">marzo</option><option value="4">aprile</option>
+    <option value="5">maggio</option><option value="6">giugno</option>
+    <option value="7">luglio</option><option value="8">agosto</option>
+    <option value="9">settembre</option><option value="10">ottobre</option>
+    <option value="11">novembre</option><option value="12">dicembre</option>
+  </select>
+  <input type="text" name="anno" value="2025" />
+  <input type="hidden" name="lang" value="en" />
+  <input type="submit" name="ok" value="OK" />
+</form>
+</body></html>
+'''
+
+MORNING_PRAYER_HTML = "<html><body><p>PSALMODY</p>" + ("x" * 6000) + "</body></html>"
+
+
+class _Resp:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise RuntimeError(self.status_code)
+
+
+class _FakeSession:
+    def __init__(self):
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(("GET", url, params))
+        if url.endswith("opzioni.php"):
+            return _Resp(OPTIONS_HTML)
+        if "breviario.php" in url:
+            return _Resp(MORNING_PRAYER_HTML)
+        return _Resp("short", status_code=200)
+
+    def post(self, url, data=None, timeout=None):
+        self.calls.append(("POST", url, data))
+        return _Resp("<html></html>")
+
+
+def test_http_navigation_replays_date_form(monkeypatch):
+    sessions = []
+
+    def _make_session():
+        s = _FakeSession()
+        sessions.append(s)
+        return s
+
+    monkeypatch.setattr(scraper_mod.requests, "Session", _make_session)
+    scr = IBreviaryScraper("https://www.ibreviary.com/m2/")
+    html = scr.navigate_morning_prayer_html(datetime(2026, 11, 5))
+    assert html == MORNING_PRAYER_HTML
+    assert len(sessions) == 1
+    method, url, data = sessions[0].calls[1]
+    assert method == "POST" and url.endswith("opzioni.php")
+    assert data["giorno"] == "5" and data["mese"] == "11" and data["anno"] == "2026"
+    assert data["lang"] == "en" and data["ok"] == "OK"
+    # Same date reuses the session cookies instead of setting the date again
+    scr.fetch_page_http(datetime(2026, 11, 5), "morning_prayer")
+    assert len(sessions) == 1
+
+
+def test_http_page_failing_validation_returns_none(monkeypatch):
+    monkeypatch.setattr(scraper_mod.requests, "Session", _FakeSession)
+    scr = IBreviaryScraper("https://www.ibreviary.com/m2/")
+    assert scr.fetch_page_http(datetime(2026, 11, 5), "readings") is None
+
+
+def test_generator_fetches_pages_on_separate_sessions(monkeypatch):
+    from bbgrl.generator.generator import bbgrlslidegeneratorv1
+
+    sessions = []
+    readings_html = "<html><body><span class='titolo'>Gospel</span>" + ("y" * 6000) + "</body></html>"
+
+    class _PageSession(_FakeSession):
+        def get(self, url, params=None, timeout=None):
+            if "letture.php" in url:
+                self.calls.append(("GET", url, params))
+                return _Resp(readings_html)
+            return super().get(url, params=params, timeout=timeout)
+
+    def _make_session():
+        s = _PageSession()
+        sessions.append(s)
+        return s
+
+    monkeypatch.setattr(scraper_mod.requests, "Session", _make_session)
+    gen = bbgrlslidegeneratorv1(html_cache=False)
+    data = gen.fetch_live_liturgical_data(datetime(2026, 11, 5))
+    assert data["date"] == "November 05, 2026"
+    fetched = sorted(url.rsplit("/", 1)[1] for s in sessions for m, url, _ in s.calls
+                     if m == "GET" and not url.endswith("opzioni.php"))
+    assert fetched == ["breviario.php?s=lodi", "letture.php?s=letture"]
+    # Each page set the date on its own session
+    assert len([s for s in sessions if s.calls]) == 2
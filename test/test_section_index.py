@@ -0,0 +1,77 @@
+"""Tests for the single-pass Morning Prayer section marker index."""
+
+from bbgrl.generator.parsers import (
+    SectionIndex,
+    extract_concluding_prayer,
+    extract_gospel_antiphon,
+    extract_responsory_from_html,
+    extract_short_reading,
+)
+
+MORNING_PRAYER_TEXT = """Tune: Old Hundredth
+PSALMODY
+Ant. 1 Each morning I will sing your praise.
+Canticle: Daniel 3:57-88
+READING Romans 13:11b-12
+It is the hour now for you to awake from sleep.
+RESPONSORY
+Christ, Son of the living God, have mercy on us.
+— Christ, Son of the living God, have mercy on us.
+You are seated at the right hand of the Father,
+— have mercy on us.
+Glory to the Father, and to the Son, and to the Holy Spirit.
+— Christ, Son of the living God, have mercy on us.
+GOSPEL CANTICLE
+Ant. The Lord has come to his people and set them free.
+Canticle of Zechariah
+INTERCESSIONS
+Let us pray to Christ.
+CONCLUDING PRAYER
+Lord God, grant that we may watch for your coming,
+through our Lord Jesus Christ.
+— Amen.
+Or:
+Another prayer.
+MASS READINGS
+"""
+
+
+def test_markers_inside_other_markers_are_indexed():
+    index = SectionIndex(MORNING_PRAYER_TEXT)
+    readings_at = MORNING_PRAYER_TEXT.index("MASS READINGS")
+    assert index.find("mass_readings") == (readings_at, readings_at + len("MASS READINGS"))
+    assert index.find_all("reading")[-1][0] == readings_at + len("MASS ")
+    assert index.find("zechariah")[0] == MORNING_PRAYER_TEXT.index("Canticle of Zechariah")
+
+
+def test_region_and_limit_bound_every_lookup():
+    index = SectionIndex(MORNING_PRAYER_TEXT)
+    responsory = index.find("responsory")[1]
+    region = index.region(responsory)
+    assert region.find("ant")[0] == MORNING_PRAYER_TEXT.index("Ant. The Lord")
+    assert region.find("canticle_colon") is None
+    assert index.find("intercessions", limit=responsory) is None
+    assert str(index.region(0, 8)) == "Tune: Ol"
+
+
+def test_first_of_prefers_list_order_over_position():
+    index = SectionIndex(MORNING_PRAYER_TEXT)
+    start = index.find("responsory")[1]
+    assert index.first_of(["intercessions", "gospel_canticle"], start)[0] == MORNING_PRAYER_TEXT.index("INTERCESSIONS")
+
+
+def test_extractors_accept_text_or_index():
+    index = SectionIndex(MORNING_PRAYER_TEXT)
+    after_psalmody = index.region(index.find("psalmody")[0])
+    text_after_psalmody = str(after_psalmody)
+    assert extract_short_reading(after_psalmody) == extract_short_reading(text_after_psalmody) == {
+        "citation": "Romans 13:11b-12",
+        "text": "It is the hour now for you to awake from sleep.",
+    }
+    responsory = extract_responsory_from_html(None, after_psalmody)
+    assert responsory == extract_responsory_from_html(None, text_after_psalmody)
+    assert len(responsory) == 3 and responsory[1]["text"].endswith("— have mercy on us.")
+    assert extract_gospel_antiphon(after_psalmody) == "The Lord has come to his people and set them free."
+    assert extract_concluding_prayer(index) == extract_concluding_prayer(MORNING_PRAYER_TEXT) == (
+        "Lord God, grant that we may watch for your coming,\nthrough our Lord Jesus Christ.\n— Amen."
+    )
@@ -0,0 +1,47 @@
+"""Tests for the pre-rendered static slide library."""
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from bbgrl.generator import library
+from bbgrl.generator.library import STATIC_SECTIONS, SlideLibrary, library_digest
+
+
+def _deck():
+    prs = Presentation()
+    prs.slide_width = Inches(13.33)
+    prs.slide_height = Inches(7.5)
+    return prs
+
+
+def _texts(prs):
+    return [[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame] for slide in prs.slides]
+
+
+def test_sections_are_built_once_and_copied(tmp_path):
+    slides = SlideLibrary(root=str(tmp_path))
+    prs = _deck()
+    count, ids = slides.insert(prs, "salve_regina", 3)
+    assert slides.built
+    assert count - 3 == len(ids) == len(prs.slides) > 0
+    assert {s.slide_id for s in prs.slides} == set(ids)
+
+    expected = _deck()
+    STATIC_SECTIONS["salve_regina"](expected, 0)
+    # The copies carry the fitted line breaks; the words are unchanged
+    assert [[t.split() for t in s] for s in _texts(prs)] == [[t.split() for t in s] for s in _texts(expected)]
+
+    again = SlideLibrary(root=str(tmp_path))
+    again.insert(_deck(), "salve_regina", 0)
+    assert not again.built
+
+
+def test_digest_changes_with_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(library, "IMAGE_DIR", str(tmp_path))
+    image = tmp_path / "heart_of_jesus_slide.png"
+    image.write_bytes(b"one")
+    first = library_digest(Inches(13.33), Inches(7.5))
+    assert library_digest(Inches(13.33), Inches(7.5)) == first
+    image.write_bytes(b"two")
+    assert library_digest(Inches(13.33), Inches(7.5)) != first
+    assert library_digest(Inches(10), Inches(7.5)) != first
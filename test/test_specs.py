@@ -0,0 +1,113 @@
+"""Tests for the declarative slide specs and their renderer."""
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
+from pptx.util import Inches, Pt
+
+from bbgrl.generator import sections
+from bbgrl.generator.constants import get_reference_template
+from bbgrl.generator.fallbacks import get_fallback_data
+from bbgrl.generator.specs import (
+    FontSpec,
+    ParagraphSpec,
+    RunSpec,
+    SlideSpec,
+    TextBoxSpec,
+    render_slide,
+    specs_digest,
+    text_runs,
+)
+
+
+def _c14n(element):
+    return etree.tostring(element, method="c14n")
+
+
+def test_rendered_text_box_matches_python_pptx_api():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_textbox(Inches(0.5), Inches(1), Inches(12.33), Inches(5.5))
+    tf = box.text_frame
+    tf.word_wrap = True
+    tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+    tf.vertical_anchor = MSO_ANCHOR.MIDDLE
+    tf.margin_left = Inches(0.3)
+    tf.margin_top = Inches(0.2)
+    tf.margin_right = Inches(0.3)
+    tf.margin_bottom = Inches(0.2)
+    p = tf.paragraphs[0]
+    p.text = "Blessed be the Lord\nthe God of Israel <&>"
+    p.font.size = Pt(44)
+    p.font.name = "Georgia"
+    p.font.bold = True
+    p.font.color.rgb = RGBColor(0x98, 0x00, 0x00)
+    p.alignment = PP_ALIGN.LEFT
+    p.space_after = Pt(8)
+    p = tf.add_paragraph()
+    p.alignment = PP_ALIGN.CENTER
+    p.space_before = Pt(14)
+    run = p.add_run()
+    run.text = "Ant.\x0b "
+    run.font.size = Pt(30)
+    run.font.italic = True
+    run.font.color.rgb = RGBColor(0, 0, 0xFF)
+
+    spec = SlideSpec((TextBoxSpec(
+        Inches(0.5), Inches(1), Inches(12.33), Inches(5.5),
+        paragraphs=(
+            ParagraphSpec(
+                runs=text_runs("Blessed be the Lord\nthe God of Israel <&>"),
+                alignment="left",
+                font=FontSpec("Georgia", 44, True, None, "980000"),
+                space_after=8,
+            ),
+            ParagraphSpec(
+                runs=(RunSpec("Ant.\x0b ", FontSpec(size=30, italic=True, color="0000FF")),),
+                alignment="center",
+                space_before=14,
+            ),
+        ),
+        word_wrap=True,
+        auto_size="text_to_fit_shape",
+        vertical_anchor="middle",
+        margins=(Inches(0.3), Inches(0.2), Inches(0.3), Inches(0.2)),
+    ),))
+    rendered = render_slide(prs, spec)
+    assert _c14n(rendered.shapes[0]._element.txBody) == _c14n(box._element.txBody)
+    assert rendered.shapes[0].text_frame.text == box.text_frame.text
+
+
+def test_section_specs_are_pure_and_digest_stably():
+    template = get_reference_template()
+    builders = list(sections.SECTION_BUILDERS.values())
+    first = [spec for build in builders for spec in build(get_fallback_data(), template)]
+    second = [spec for build in builders for spec in build(get_fallback_data(), template)]
+    assert first and first == second
+    assert specs_digest(first) == specs_digest(second)
+
+    data = get_fallback_data()
+    data["morning_prayer"]["psalmody"]["antiphon_1"]["text"] += " Alleluia."
+    changed = [spec for build in builders for spec in build(data, template)]
+    assert specs_digest(changed) != specs_digest(first)
+    assert [s.digest() for s in changed[1:]] != [s.digest() for s in first[1:]]
+
+
+def test_section_titles_come_from_reference_template():
+    template = get_reference_template()
+    template["section_templates"]["gospel_canticle_section"]["title_slide"]["text"] = "BENEDICTUS"
+    data = get_fallback_data()
+    data["morning_prayer"]["gospel_canticle"]["antiphon"] = "Blessed be the Lord."
+    header = sections.gospel_canticle_section(data, template)[0].boxes[0]
+    assert header.paragraphs[0].runs[0].text == "BENEDICTUS"
+    assert header.paragraphs[0].font.color == str(template["formatting_rules"]["title_color"])
+
+
+def test_chunk_gospel_text_keeps_paragraphs_together():
+    text = "\n\n".join(["a" * 120, "b" * 120, "c" * 120, "d\n" * 200])
+    chunks = sections.chunk_gospel_text(text)
+    assert chunks[0] == "a" * 120 + "\n\n" + "b" * 120
+    assert chunks[1] == "c" * 120
+    assert all(len(c) <= 300 for c in chunks)
+    assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
@@ -0,0 +1,141 @@
+"""Tests for the prefix-sum line breaker used by the text fit pass."""
+
+import random
+
+from bbgrl.generator.textfit import ParagraphLayout, split_tokens_preserve_ws
+
+STYLE = ("Georgia", False, False, None)
+
+
+def _layout(text):
+    return ParagraphLayout([(tok, STYLE) for tok in split_tokens_preserve_ws(text) if tok])
+
+
+def _lines(wrapped):
+    return 1 + sum(text.count("\n") for text, _ in wrapped)
+
+
+def test_line_count_matches_wrapped_output():
+    rng = random.Random(7)
+    words = ["Glory", "to", "the", "Father,", "and", "to", "the", "Son", "Blessed",
+             "Zechariah", "x" * 60, "\n", "  "]
+    for _ in range(50):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 80)))
+        layout = _layout(text)
+        for max_ref in (15.0, 60.0, 150.0, 400.0, 5000.0):
+            wrapped = layout.wrap(max_ref)
+            assert layout.count_lines(max_ref) == _lines(wrapped), (text, max_ref)
+            assert "".join("".join(t for t, _ in wrapped).split()) == "".join(text.split())
+
+
+def test_long_words_are_hard_broken_to_the_line_width():
+    layout = _layout("Amen " + "a" * 200)
+    max_ref = 120.0
+    wrapped = layout.wrap(max_ref)
+    chunks = [t.rstrip("\n") for t, _ in wrapped if t.strip("\n").startswith("a")]
+    assert len(chunks) > 1
+    assert all(layout.metrics.length(c) <= max_ref for c in chunks[:-1])
+
+
+def test_solver_matches_exhaustive_bisection():
+    from bbgrl.generator.textfit import solve_font_size
+
+    rng = random.Random(11)
+    words = ["Lord,", "have", "mercy", "on", "us.", "Sacred", "Heart", "of", "Jesus", "\n"]
+    for _ in range(40):
+        layouts = []
+        for _ in range(rng.randint(1, 3)):
+            layout = _layout(" ".join(rng.choice(words) for _ in range(rng.randint(1, 60))))
+            layout.scalable = True  # treat the default font as if it scaled
+            layouts.append(layout)
+        inner_w, inner_h = rng.uniform(200, 1200), rng.uniform(60, 600)
+
+        def fits(size):
+            return sum(l.count_lines(inner_w / l.scale(size)) * l.line_height(size) for l in layouts) <= inner_h
+
+        low, high = 1.0, inner_h / 96.0 * 72.0
+        for _ in range(60):
+            mid = (low + high) / 2.0
+            low, high = (mid, high) if fits(mid) else (low, mid)
+
+        size, iterations = solve_font_size(layouts, inner_w, inner_h, tolerance_pt=0.25)
+        assert fits(size)
+        assert low - 0.25 <= size <= low + 1e-6
+        assert iterations < 18
+
+
+def _deck(boxes=1):
+    from pptx import Presentation
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches, Pt
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shapes = []
+    for i in range(boxes):
+        box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6 - i % 4), Inches(3 + i % 3))
+        run = box.text_frame.paragraphs[0].add_run()
+        run.text = "Blessed be the Lord, the God of Israel; he has come to his people and set them free. " * (1 + i % 3)
+        run.font.name = "Georgia"
+        run.font.size = Pt(12)
+        run.font.color.rgb = RGBColor(0x80, 0, 0)
+        shapes.append(box)
+    return prs, shapes
+
+
+def _snapshot(shapes):
+    return [[[(r.text, r.font.size, r.font.color.rgb) for r in p.runs] for p in box.text_frame.paragraphs]
+            for box in shapes]
+
+
+def test_fit_cache_replays_size_and_line_breaks(tmp_path):
+    from bbgrl.generator.cache import FitCache
+    from bbgrl.generator.textfit import maximize_text_size
+
+    cache = FitCache(tmp_path)
+    first, first_shapes = _deck()
+    stats = maximize_text_size(first, cache=cache, jobs=1)
+    assert (stats.cache_hits, stats.cache_misses) == (0, 1)
+
+    second, second_shapes = _deck()
+    stats = maximize_text_size(second, cache=cache, jobs=1)
+    assert (stats.cache_hits, stats.cache_misses) == (1, 0)
+    assert _snapshot(second_shapes) == _snapshot(first_shapes)
+
+
+def test_parallel_fit_matches_in_process_fit(monkeypatch):
+    from bbgrl.generator import textfit
+    from bbgrl.generator.textfit import MIN_PARALLEL_SHAPES, maximize_text_size, shutdown_fit_pool
+
+    monkeypatch.setattr(textfit, "FIT_JOBS", 3)
+    serial, serial_shapes = _deck(MIN_PARALLEL_SHAPES + 4)
+    maximize_text_size(serial, jobs=1)
+    parallel, parallel_shapes = _deck(MIN_PARALLEL_SHAPES + 4)
+    again, again_shapes = _deck(MIN_PARALLEL_SHAPES + 4)
+    try:
+        stats = maximize_text_size(parallel, jobs=2)
+        pool = textfit._pool
+        # Calls asking for different worker counts share one pool
+        maximize_text_size(again, jobs=3)
+        assert pool is not None and textfit._pool is pool
+    finally:
+        shutdown_fit_pool()
+    assert len(stats.iterations) == MIN_PARALLEL_SHAPES + 4
+    assert _snapshot(parallel_shapes) == _snapshot(serial_shapes) == _snapshot(again_shapes)
+
+
+def test_broken_pool_is_only_replaced_by_its_own_caller(monkeypatch):
+    from bbgrl.generator import textfit
+
+    class _Pool:
+        stopped = False
+
+        def shutdown(self, wait=True):
+            self.stopped = True
+
+    stale, current = _Pool(), _Pool()
+    monkeypatch.setattr(textfit, "_pool", current)
+    textfit._discard_pool(stale)
+    assert textfit._pool is current and stale.stopped and not current.stopped
+    textfit._discard_pool(current)
+    assert textfit._pool is None
@@ -0,0 +1,182 @@
+"""Tests for the Flask UI: downloads, progress streams and shutdown."""
+
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from bbgrl.jobs import JobScheduler
+
+APP_PATH = Path(__file__).resolve().parents[1] / "ui_app" / "app.py"
+DECK = bytes(range(256)) * 8
+
+
+@pytest.fixture(scope="module")
+def ui(tmp_path_factory):
+    runtime = tmp_path_factory.mktemp("ui_runtime")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BBGRL_JOB_STORE", "memory")
+        mp.setenv("BBGRL_RUNTIME_DIR", str(runtime))
+        spec = importlib.util.spec_from_file_location("bbgrl_ui_app", APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        mp.setitem(sys.modules, spec.name, module)
+        spec.loader.exec_module(module)
+        yield module
+        module.SCHEDULER.shutdown(wait=False)
+
+
+@pytest.fixture
+def client(ui):
+    return ui.app.test_client()
+
+
+def _finished_job(ui, job_id, **fields):
+    ui.JOBS.create(job_id, done=True, filename=f"{job_id}.pptx", etag=f"etag-{job_id}", **fields)
+
+
+def _check_download(client, job_id):
+    resp = client.get(f"/download/{job_id}")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Length"] == str(len(DECK))
+    assert resp.headers["ETag"] == f'"etag-{job_id}"'
+    assert f"{job_id}.pptx" in resp.headers["Content-Disposition"]
+    assert resp.data == DECK
+
+    resp = client.get(f"/download/{job_id}", headers={"If-None-Match": f'"etag-{job_id}"'})
+    assert resp.status_code == 304 and resp.data == b""
+
+    resp = client.get(f"/download/{job_id}", headers={"Range": "bytes=10-19"})
+    assert resp.status_code == 206
+    assert resp.headers["Content-Range"] == f"bytes 10-19/{len(DECK)}"
+    assert resp.data == DECK[10:20]
+
+
+def test_download_serves_in_memory_decks(ui, client):
+    _finished_job(ui, "in-memory")
+    ui._keep_deck("in-memory", DECK)
+    _check_download(client, "in-memory")
+
+
+def test_download_serves_archived_decks(ui, client, tmp_path):
+    path = tmp_path / "archived.pptx"
+    path.write_bytes(DECK)
+    _finished_job(ui, "archived", output_path=str(path))
+    _check_download(client, "archived")
+
+
+def test_memory_decks_are_least_recently_used_and_follow_their_jobs(ui, client, monkeypatch):
+    monkeypatch.setattr(ui, "MAX_MEMORY_DECKS", 2)
+    for job_id in ("a", "b"):
+        _finished_job(ui, job_id)
+        ui._keep_deck(job_id, DECK)
+    # Downloading "a" makes "b" the least recently used deck
+    assert client.get("/download/a").status_code == 200
+    _finished_job(ui, "c")
+    ui._keep_deck("c", DECK)
+    assert client.get("/download/b").status_code == 404  # never archived
+    assert client.get("/download/a").status_code == 200
+
+    ui.JOBS.create("a")  # replacing the job evicts the old one
+    assert "a" not in ui._decks
+    assert client.get("/download/no-such-job").status_code == 404
+
+
+@pytest.fixture
+def sse(ui, monkeypatch):
+    monkeypatch.setattr(ui, "SSE_MIN_INTERVAL", 0)
+    monkeypatch.setattr(ui, "SSE_HEARTBEAT", 0.05)
+    monkeypatch.setattr(ui, "_sse_slots", threading.BoundedSemaphore(1))
+    return ui
+
+
+def _stream(client, job_id, **headers):
+    resp = client.get(f"/events/{job_id}", headers=headers, buffered=False)
+    assert resp.status_code == 200 and resp.mimetype == "text/event-stream"
+    chunks = iter(resp.response)
+    assert next(chunks) == b"retry: 2000\n\n"
+    return resp, chunks
+
+
+def _event(chunk):
+    lines = chunk.decode().rstrip("\n").split("\n")
+    assert lines[0].startswith("id: ") and lines[1].startswith("data: ")
+    return int(lines[0][4:]), json.loads(lines[1][6:])
+
+
+def test_event_stream_sends_progress_until_the_job_is_done(sse, client):
+    sse.JOBS.create("sse-a", message="Queued")
+    sse.EVENTS.update("sse-a", percent=10, message="Fetching")
+    resp, chunks = _stream(client, "sse-a")
+    version, payload = _event(next(chunks))
+    assert payload["percent"] == 10 and payload["message"] == "Fetching"
+    sse.EVENTS.update("sse-a", percent=100, message="Done", done=True, filename="a.pptx", etag="a")
+    done_version, payload = _event(next(chunks))
+    assert done_version > version
+    assert payload["done"] and payload["download_url"] == "/download/sse-a"
+    assert next(chunks, None) is None
+    resp.close()
+
+
+def test_event_stream_resumes_after_last_event_id_with_heartbeats(sse, client):
+    sse.JOBS.create("sse-b", message="Queued")
+    sse.EVENTS.update("sse-b", percent=20, message="Rendering")
+    version = sse.JOBS.get("sse-b")["version"]
+    resp, chunks = _stream(client, "sse-b", **{"Last-Event-ID": str(version)})
+    # Nothing new since the client's last event: only a heartbeat comes
+    assert next(chunks) == b": heartbeat\n\n"
+    sse.EVENTS.update("sse-b", percent=30, message="Rendering")
+    new_version, payload = _event(next(chunks))
+    assert new_version == version + 1 and payload["percent"] == 30
+    resp.close()
+
+
+def test_event_stream_reports_a_job_that_is_gone(sse, client, monkeypatch):
+    sse.JOBS.create("sse-c", done=True)
+    resp, chunks = _stream(client, "sse-c")
+    monkeypatch.setattr(sse.JOBS, "ttl_seconds", 0)  # the job expires mid-stream
+    assert next(chunks) == b"event: gone\ndata: {}\n\n"
+    assert next(chunks, None) is None
+    resp.close()
+
+
+def test_event_streams_are_limited_and_release_their_slot_on_close(sse, client):
+    sse.JOBS.create("sse-d", message="Queued")
+    assert client.get("/events/no-such-job").status_code == 404
+    first = client.get("/events/sse-d", buffered=False)
+    assert first.status_code == 200
+    busy = client.get("/events/sse-d")
+    assert busy.status_code == 503 and "poll /status" in busy.get_json()["error"]
+    first.close()
+    second, _ = _stream(client, "sse-d")
+    second.close()
+
+
+def test_shutdown_closes_the_store_after_marking_unfinished_jobs(ui, monkeypatch):
+    scheduler = JobScheduler(workers=1, max_queue=5)
+    monkeypatch.setattr(ui, "SCHEDULER", scheduler)
+    closed = []
+    monkeypatch.setattr(ui.JOBS, "close", lambda: closed.append(len(closed)))
+    ui._close_jobs()  # idle: nothing to mark
+    assert closed == [0]
+
+    scheduler = JobScheduler(workers=1, max_queue=5)
+    monkeypatch.setattr(ui, "SCHEDULER", scheduler)
+    release = threading.Event()
+    for job_id in ("running", "queued", "finished"):
+        ui.JOBS.create(job_id, message="Queued")
+    scheduler.submit("running", release.wait, 5)
+    while scheduler.position("running") != 0:
+        release.wait(0.01)
+    scheduler.submit("queued", lambda: ui.EVENTS.update("queued", done=True))  # must never run
+    ui.EVENTS.update("finished", done=True)
+    ui._close_jobs()
+    release.set()
+    assert closed == [0, 1]
+    for job_id in ("running", "queued"):
+        job = ui.JOBS.get(job_id)
+        assert job["done"] and job["error"] == "Interrupted by a shutdown"
+    assert ui.JOBS.get("finished")["error"] is None
+    assert scheduler.shutdown(timeout=5)
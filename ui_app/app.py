@@ -1,16 +1,34 @@
-import os
 import sys
+import time
+
+_STARTED_AT = time.perf_counter()
+# --startup-profile: time every import from here on (see __main__)
+if "--startup-profile" in sys.argv:
+    from bbgrl.importprofile import ImportProfiler
+    _IMPORT_PROFILER = ImportProfiler.install()
+else:
+    _IMPORT_PROFILER = None
+
+import hashlib
+import io
+import json
+import os
+import multiprocessing
+import signal
 import socket
 import threading
+import _thread
 import uuid
 import logging
 import webbrowser
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file, abort
+from flask import Flask, Response, render_template, request, jsonify, send_file, abort, stream_with_context
 
-# Import the slide generator
-from bbgrl.generator.generator import bbgrlslidegeneratorv1
+# The slide generator (pptx, requests, bs4, selenium) is imported by the
+# first job, not here, so the UI is up before it has loaded
+from bbgrl.jobs import JobEvents, JobScheduler, QueueFull, RequestCoalescer, open_job_store
 
 
 def _detect_base_path() -> Path:
@@ -20,7 +38,11 @@ def _detect_base_path() -> Path:
     return Path(__file__).parent
 
 def _detect_runtime_dir() -> Path:
-    # Where to write logs and other runtime files
+    # Where to write logs and other runtime files (BBGRL_RUNTIME_DIR overrides)
+    override = os.environ.get("BBGRL_RUNTIME_DIR")
+    if override:
+        os.makedirs(override, exist_ok=True)
+        return Path(override)
     if getattr(sys, 'frozen', False):
         return Path(sys.executable).parent
     return Path(__file__).parent
@@ -44,40 +66,119 @@ logger = logging.getLogger("ui_app")
 
 app = Flask(__name__, template_folder=str(TEMPLATE_DIR))
 
-# In-memory job store (simple for single-user desktop use)
-JOBS = {}
-# JOBS[job_id] = {
+# Job store: SQLite next to the app by default, so finished jobs survive a
+# restart (BBGRL_JOB_STORE=memory, or a database path). Finished jobs and
+# their archived decks expire after BBGRL_JOB_TTL seconds (default a day).
+# job = {
 #     "percent": int,
 #     "message": str,
 #     "done": bool,
 #     "error": str|None,
-#     "output_path": str|None,
+#     "output_path": str|None,   # archived copy, once written
+#     "filename": str|None,
+#     "etag": str|None,
+#     "version": int,            # bumped on every update (see EVENTS)
 # }
+JOB_TTL = float(os.environ.get("BBGRL_JOB_TTL", 86400))
+
+
+def _open_jobs():
+    spec = os.environ.get("BBGRL_JOB_STORE", str(RUNTIME_DIR / "ui_jobs.sqlite3"))
+    try:
+        return open_job_store(spec, ttl_seconds=JOB_TTL)
+    except Exception:
+        logger.exception("Could not open job store %s; keeping jobs in memory", spec)
+        return open_job_store("memory", ttl_seconds=JOB_TTL)
+
+
+JOBS = _open_jobs()
+# Job updates go through EVENTS, which wakes the /events streams
+EVENTS = JobEvents(JOBS)
+
+PPTX_MIMETYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+# Finished decks are archived to output_v2 next to the app after the job
+# completes (BBGRL_ARCHIVE=0 to skip). Only the MAX_MEMORY_DECKS most
+# recently finished or downloaded decks stay in memory; older ones are
+# served from the archive, or are gone (404) if they were never archived.
+ARCHIVE_DECKS = os.environ.get("BBGRL_ARCHIVE", "1") not in ("0", "false", "no")
+MAX_MEMORY_DECKS = 8
+_decks = OrderedDict()  # job_id -> deck bytes, least recently used first
+_deck_lock = threading.Lock()
+
+
+def _keep_deck(job_id: str, deck: bytes):
+    """Hold a finished deck in memory, dropping the least recently used past the limit."""
+    with _deck_lock:
+        _decks[job_id] = deck
+        _decks.move_to_end(job_id)
+        while len(_decks) > MAX_MEMORY_DECKS:
+            _decks.popitem(last=False)
+
+
+def _memory_deck(job_id: str):
+    with _deck_lock:
+        deck = _decks.get(job_id)
+        if deck is not None:
+            _decks.move_to_end(job_id)
+        return deck
+
+
+def _forget_deck(job_id: str):
+    with _deck_lock:
+        _decks.pop(job_id, None)
+
+
+# A job evicted from the store takes its in-memory deck with it
+JOBS.on_evict = _forget_deck
+
+
+# Generations run on a fixed pool of workers fed from a bounded FIFO queue
+# (a full queue answers /start with 429). Within a job, scraping and
+# rendering each have their own concurrency limit, so one job can scrape
+# while another renders.
+SCHEDULER = JobScheduler(
+    workers=int(os.environ.get("BBGRL_UI_WORKERS", 2)),
+    max_queue=int(os.environ.get("BBGRL_UI_QUEUE", 10)),
+    stage_limits={
+        "scrape": int(os.environ.get("BBGRL_UI_SCRAPERS", 2)),
+        "render": int(os.environ.get("BBGRL_UI_RENDERERS", 1)),
+    },
+)
+
+
+# Requests for a deck that is already being generated (same date and
+# options) attach to the running job instead of starting another one
+COALESCER = RequestCoalescer()
+
+# Streams of queued jobs report the queue position, so wake them when it moves
+SCHEDULER.on_queue_moved = EVENTS.touch
+
+
+def _deck_options(form) -> tuple:
+    """Request options that change the generated deck, as a hashable key part."""
+    return (("refresh", form.get("refresh", "") in ("1", "true", "yes")),)
 
 
 def _update(job_id: str, percent: int, message: str):
-    job = JOBS.get(job_id)
-    if job is None:
-        return
-    job["percent"] = max(0, min(100, int(percent)))
-    job["message"] = message
+    EVENTS.update(job_id, percent=max(0, min(100, int(percent))), message=message)
 
 
-def _run_generation(job_id: str, date_str: str):
+def _run_generation(job_id: str, date_str: str, options: tuple = ()):
     try:
-        JOBS[job_id] = {
-            "percent": 0,
-            "message": "Starting...",
-            "done": False,
-            "error": None,
-            "output_path": None,
-        }
+        _generate(job_id, date_str, dict(options))
+    finally:
+        COALESCER.finish((date_str, options), job_id)
+
 
+def _generate(job_id: str, date_str: str, options: dict):
+    try:
         def progress_callback(percent, message):
             _update(job_id, percent, message)
 
         _update(job_id, 5, "Initializing generator")
-        gen = bbgrlslidegeneratorv1()
+        from bbgrl.generator.generator import bbgrlslidegeneratorv1
+        gen = bbgrlslidegeneratorv1(refresh=options.get("refresh", False))
 
         # Parse input date from YYYY-MM-DD
         _update(job_id, 10, f"Parsing date {date_str}")
@@ -88,24 +189,33 @@ def _run_generation(job_id: str, date_str: str):
         # Fetch data with progress updates
         def fetch_progress(percent, message):
             _update(job_id, percent, message)
-        data = gen.fetch_live_liturgical_data(target_date, progress_callback=fetch_progress)
+        with SCHEDULER.stage("scrape"):
+            data = gen.fetch_live_liturgical_data(target_date, progress_callback=fetch_progress)
         _update(job_id, 55, "Fetched data: parsing complete")
 
-        # Create presentation with progress callback
-        _update(job_id, 60, "Creating PowerPoint presentation")
-        persistent_out_dir = RUNTIME_DIR / "output_v2"
-        persistent_out_dir.mkdir(exist_ok=True)
-        output_path = gen.create_presentation_from_template(data, output_dir=str(persistent_out_dir), progress_callback=progress_callback)
+        # Create presentation with progress callback; built in memory so the
+        # download does not wait on writing the deck to disk and reading it back
+        _update(job_id, 58, "Waiting for the renderer")
+        with SCHEDULER.stage("render"):
+            _update(job_id, 60, "Creating PowerPoint presentation")
+            deck = gen.create_presentation_from_template(data, progress_callback=progress_callback, as_bytes=True)
 
         # All done!
-        _update(job_id, 100, "Done. Ready to download")
-        JOBS[job_id]["done"] = True
-        JOBS[job_id]["output_path"] = str(output_path)
+        _keep_deck(job_id, deck)
+        EVENTS.update(job_id, percent=100, message="Done. Ready to download", done=True,
+                      filename=gen.output_filename(data), etag=hashlib.sha256(deck).hexdigest()[:32])
     except Exception as e:
         logger.exception("Generation failed")
-        JOBS[job_id]["done"] = True
-        JOBS[job_id]["error"] = str(e)
-        _update(job_id, 100, "Failed. See error")
+        EVENTS.update(job_id, percent=100, message="Failed. See error", done=True, error=str(e))
+        return
+
+    if ARCHIVE_DECKS:
+        try:
+            persistent_out_dir = RUNTIME_DIR / "output_v2"
+            output_path = gen.archive_presentation(deck, data, output_dir=str(persistent_out_dir))
+            EVENTS.update(job_id, output_path=str(output_path))
+        except Exception:
+            logger.exception("Archiving the deck failed")
 
 
 @app.route("/")
@@ -124,42 +234,236 @@ def start():
     except Exception:
         return jsonify({"error": "Invalid date format. Use YYYY-MM-DD."}), 400
 
-    job_id = uuid.uuid4().hex
-    t = threading.Thread(target=_run_generation, args=(job_id, date_str), daemon=True)
-    t.start()
-    return jsonify({"job_id": job_id})
+    options = _deck_options(request.form)
+    if SCHEDULER.closed:
+        return jsonify({"error": "The server is shutting down. Please try again shortly."}), 503
 
+    def start_job():
+        job_id = uuid.uuid4().hex
+        JOBS.create(job_id, message="Queued")
+        try:
+            SCHEDULER.submit(job_id, _run_generation, job_id, date_str, options)
+        except QueueFull:
+            EVENTS.update(job_id, done=True, error="Server busy", message="Server busy")
+            raise
+        return job_id
 
-@app.route("/status/<job_id>")
-def status(job_id: str):
-    job = JOBS.get(job_id)
-    if not job:
-        return jsonify({"error": "Unknown job id"}), 404
+    try:
+        job_id, attached = COALESCER.attach_or_start((date_str, options), start_job)
+    except QueueFull:
+        resp = jsonify({"error": "The server is busy generating other decks. Please try again in a minute."})
+        return resp, 429, {"Retry-After": "30"}
+    if attached:
+        logger.info("Request for %s joined job %s (%d coalesced so far)", date_str, job_id, COALESCER.coalesced)
+    return jsonify({"job_id": job_id, "queue_position": SCHEDULER.position(job_id), "coalesced": attached})
+
+
+def _status(job_id: str, job: dict) -> dict:
     resp = {
         "percent": job["percent"],
         "message": job["message"],
         "done": job["done"],
         "error": job["error"],
     }
+    position = SCHEDULER.position(job_id)
+    if position:
+        resp["queue_position"] = position
+        resp["message"] = f"Waiting in queue (position {position})"
     if job["done"] and not job["error"]:
         resp["download_url"] = f"/download/{job_id}"
-    return jsonify(resp)
+    return resp
+
+
+@app.route("/status/<job_id>")
+def status(job_id: str):
+    job = JOBS.get(job_id)
+    if not job:
+        return jsonify({"error": "Unknown job id"}), 404
+    return jsonify(_status(job_id, job))
+
+
+# Progress stream (Server-Sent Events). Each event carries the /status
+# payload; bursts of updates within SSE_MIN_INTERVAL are sent as one event
+# with the latest state, and an idle stream gets a comment line every
+# SSE_HEARTBEAT seconds. The event id is the job's version, so a reconnecting
+# browser (Last-Event-ID) is only sent what it has not seen. Each stream
+# holds a server thread, so at most SSE_MAX_STREAMS are open at once; past
+# that the page falls back to polling /status.
+SSE_MIN_INTERVAL = 0.25
+SSE_HEARTBEAT = 15.0
+SSE_MAX_STREAMS = int(os.environ.get("BBGRL_SSE_STREAMS", 32))
+_sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+
+
+def _event_stream(job_id: str, last_id: int):
+    yield "retry: 2000\n\n"
+    sent = None
+    last_sent_at = 0.0
+    while True:
+        # Let a burst of updates settle into one event
+        delay = last_sent_at + SSE_MIN_INTERVAL - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        version, job = EVENTS.snapshot(job_id)
+        if job is None:
+            yield "event: gone\ndata: {}\n\n"
+            return
+        payload = _status(job_id, job)
+        job_version = job.get("version", 0)
+        if payload != sent and (sent is not None or job_version > last_id or "queue_position" in payload):
+            yield f"id: {job_version}\ndata: {json.dumps(payload)}\n\n"
+            last_sent_at = time.monotonic()
+        sent = payload
+        if job["done"]:
+            return
+        if not EVENTS.wait(job_id, version, timeout=SSE_HEARTBEAT):
+            yield ": heartbeat\n\n"
+
+
+@app.route("/events/<job_id>")
+def events(job_id: str):
+    if JOBS.get(job_id) is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    if not _sse_slots.acquire(blocking=False):
+        return jsonify({"error": "Too many progress streams; poll /status instead"}), 503
+    try:
+        last_id = int(request.headers.get("Last-Event-ID", 0))
+    except ValueError:
+        last_id = 0
+    resp = Response(stream_with_context(_event_stream(job_id, last_id)), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    # The server closes the response however the stream ends
+    resp.call_on_close(_sse_slots.release)
+    return resp
+
+
+@app.route("/stats")
+def stats():
+    return jsonify({
+        "queued": SCHEDULER.queued,
+        "running": SCHEDULER.running,
+        "in_flight": len(COALESCER),
+        "coalesced": COALESCER.coalesced,
+    })
 
 
 @app.route("/download/<job_id>")
 def download(job_id: str):
     job = JOBS.get(job_id)
-    if not job or not job.get("output_path") or job.get("error"):
+    if not job or not job["done"] or job.get("error"):
         abort(404)
-    path = job["output_path"]
-    if not os.path.exists(path):
+    deck = _memory_deck(job_id)
+    path = job.get("output_path")
+    if deck is not None:
+        source = io.BytesIO(deck)
+    elif path and os.path.exists(path):
+        source = path
+    else:
         abort(404)
-    # Send as attachment so the browser downloads it
-    filename = os.path.basename(path)
-    return send_file(path, as_attachment=True, download_name=filename)
+    # Send as attachment so the browser downloads it; Content-Length and the
+    # ETag (If-None-Match / Range) are handled by send_file
+    return send_file(source, as_attachment=True, download_name=job["filename"], mimetype=PPTX_MIMETYPE,
+                     etag=job["etag"], conditional=True)
+
+
+def serve(host: str = "127.0.0.1", port: int = 5000, threads: int = 16,
+          connection_limit: int = 100, shutdown_timeout: float = 120.0):
+    """Serve the app with waitress until interrupted.
+
+    The first SIGINT/SIGTERM stops new generations (/start answers 503) and
+    waits up to ``shutdown_timeout`` seconds for queued and running jobs to
+    finish while status and downloads keep being served; a second signal
+    stops at once. Jobs left unfinished are marked interrupted before the
+    job store is closed.
+    """
+    from waitress.server import create_server
+
+    global SSE_MAX_STREAMS, _sse_slots
+    if "BBGRL_SSE_STREAMS" not in os.environ:
+        # Each progress stream holds one of the server's threads; leave some
+        # for page loads, /start and downloads
+        SSE_MAX_STREAMS = max(1, threads - 4)
+        _sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+
+    server = create_server(app, host=host, port=port, threads=threads, connection_limit=connection_limit)
+    draining = threading.Event()
+
+    def _drain():
+        running = SCHEDULER.queued + SCHEDULER.running
+        logger.info("Shutting down; waiting up to %ss for %d job(s) to finish", shutdown_timeout, running)
+        if not SCHEDULER.shutdown(wait=True, timeout=shutdown_timeout):
+            logger.warning("Shutdown timeout reached with %d job(s) unfinished",
+                           SCHEDULER.queued + SCHEDULER.running)
+        # Stops server.run() in the main thread
+        _thread.interrupt_main()
+
+    def _on_signal(signum, frame):
+        if draining.is_set():
+            raise KeyboardInterrupt
+        draining.set()
+        threading.Thread(target=_drain, name="drain", daemon=True).start()
+
+    for name in ("SIGINT", "SIGTERM", "SIGBREAK"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), _on_signal)
+
+    logger.info("Serving on http://%s:%s (%d threads, %d connections)", host, port, threads, connection_limit)
+    try:
+        server.run()
+    finally:
+        _close_jobs()
+    logger.info("Server stopped")
+
+
+def _close_jobs():
+    """Close the job store once no job can still write to it.
+
+    If the drain timed out (or a second signal cut it short), the jobs still
+    queued or running are recorded as interrupted before the store closes.
+    """
+    if not SCHEDULER.shutdown(wait=False):
+        unfinished = SCHEDULER.abandon()
+        logger.warning("Marking %d unfinished job(s) as interrupted", len(unfinished))
+        for job_id in unfinished:
+            job = JOBS.get(job_id)
+            if job and not job["done"]:
+                EVENTS.update(job_id, done=True, error="Interrupted by a shutdown", message="Failed. See error")
+    JOBS.close()
 
 
 if __name__ == "__main__":
+    # The text fit pass uses worker processes; required for the frozen EXE
+    multiprocessing.freeze_support()
+
+    import argparse
+    parser = argparse.ArgumentParser(description="BBGRL slides web UI")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run under the waitress WSGI server for shared use instead of opening a browser")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on with --serve (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=5000, help="Port to listen on with --serve (default 5000)")
+    parser.add_argument("--threads", type=int, default=int(os.environ.get("BBGRL_SERVE_THREADS", 16)),
+                        help="Request threads with --serve (default 16)")
+    parser.add_argument("--connection-limit", type=int, default=int(os.environ.get("BBGRL_SERVE_CONNECTIONS", 100)),
+                        help="Maximum open connections with --serve (default 100)")
+    parser.add_argument("--shutdown-timeout", type=float, default=float(os.environ.get("BBGRL_SHUTDOWN_TIMEOUT", 120)),
+                        help="Seconds to wait for running jobs on shutdown with --serve (default 120)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print how long each import took at startup (like python -X importtime)")
+    args = parser.parse_args()
+
+    def _startup_report():
+        if _IMPORT_PROFILER is not None:
+            _IMPORT_PROFILER.uninstall()
+            _IMPORT_PROFILER.report()
+            print(f"startup: ready {(time.perf_counter() - _STARTED_AT) * 1e3:.0f} ms after app start",
+                  file=sys.stderr)
+
+    if args.serve:
+        _startup_report()
+        serve(args.host, args.port, args.threads, args.connection_limit, args.shutdown_timeout)
+        sys.exit(0)
+
     # Find a free localhost port starting from 5000
     def find_free_port(start_port: int = 5000, max_tries: int = 50) -> int:
         port = start_port
@@ -173,16 +477,24 @@ if __name__ == "__main__":
                     port += 1
         return start_port
 
+    from werkzeug.serving import make_server
+
     port = find_free_port()
     url = f"http://127.0.0.1:{port}"
     logger.info("Starting UI on %s", url)
+    # Bind before opening the browser, so its first request is answered
+    # instead of racing the server start
+    server = make_server("127.0.0.1", port, app, threaded=True)
 
-    # Open the browser shortly after server starts
     def _open_browser():
         try:
             webbrowser.open(url, new=1)
         except Exception:
             logger.exception("Failed to open browser")
 
-    threading.Timer(0.8, _open_browser).start()
-    app.run(host="127.0.0.1", port=port, debug=False)
+    threading.Thread(target=_open_browser, name="open-browser", daemon=True).start()
+    _startup_report()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass